@@ -0,0 +1,256 @@
+#Aggregate Count Cube
+  #Observation counts for every combination of the dimensions the dashboard pages group and filter on,
+  #built once per data snapshot from the cleaned forest + grassland frame.
+  #Why? → Almost every page is a groupby().size() / nunique() over a few of these columns; answering it from
+  #the cube costs as much as the number of cells, not the number of observations.
+
+#Cells
+  #The cube is a few cell tables, one per group of dimensions the pages use together (TABLES). Each table has
+  #one row per observed combination of its dimensions (missing values are kept as their own cell),
+  #with two measures:
+    #Count          → number of observations in the cell
+    #Distinct_Count → observations that are not exact duplicates of an earlier row (for pages that drop_duplicates())
+  #Why? → One table over all twelve dimensions held about 0.67 cells per observation (667K cells at 1M rows),
+  #so a rollup scanned a table about as large as the raw rows. Split by page, the tables hold about 80K cells
+  #at 1M rows and stop growing once every species / plot / period combination has been seen.
+
+#Appended Workbooks
+  #When data_ingest appends a workbook, only the new rows are grouped and their cells are added to the cube.
+
+#Rollups
+  #rollup(dims) sums the smallest table holding the given dimensions down to them; each rollup is built once and
+  #reused, so a page's filters are applied to a few hundred/thousand cells instead of millions of rows.
+  #select(dims, ...) filters a rollup through its bitmap index (see bitmap_index.py).
+  #sketch() holds a HyperLogLog sketch of the species of every (ecosystem, habitat, year, month) cell
+  #for unique-species counts (see richness_sketch.py).
+  #top_summary(measure) holds bounded top-K species summaries of the same kind of cells for the Top-K pages
+  #(see heavy_hitters.py).
+
+#Import required libraries
+import threading                   #Guards the rollup memo against concurrent Streamlit sessions
+
+import numpy as np                 #NumPy for the forest/grassland ecosystem codes
+import pandas as pd                #Pandas to group, bin and sum the observations
+import bitmap_index                #Packed bitsets resolving page filters on the rollup cells
+import data_ingest                 #Shared, cached ingest layer (ObservationSnapshot)
+import dedup                       #Hashed exact-duplicate detection for the Distinct_Count measure
+import heavy_hitters               #Bounded top-K species summaries per cell (Top-K pages)
+import richness_sketch             #HyperLogLog species sketches per cell (unique-species counts)
+import schema                      #Shared category dictionaries when merging cells
+
+#Dimensions of the cube
+  #Ecosystem → which workbook the row came from (Forest / Grassland); Location_Type is the column inside the file
+DIMENSIONS = [
+    'Ecosystem',
+    'Location_Type',
+    'Common_Name',
+    'Plot_Name',
+    'Year',
+    'Month',
+    'Season',
+    'Sky',
+    'Wind',
+    'Flyover_Observed',
+    'Temperature_Bin',
+    'Humidity_Bin'
+]
+
+#Cell tables and their dimensions (every page's rollup fits in one of them)
+  #species    → per-species pages, top-K summaries and species sketches (Season is a function of Month, so it adds no cells)
+  #plots      → Species Activity and High Activity Zones
+  #humidity   → Humidity Bins
+  #conditions → Temperature Bins, Sky Conditions and Wind Conditions
+TABLES = {
+    'species': ['Ecosystem', 'Location_Type', 'Common_Name', 'Year', 'Month', 'Season', 'Flyover_Observed'],
+    'plots': ['Ecosystem', 'Common_Name', 'Plot_Name', 'Season'],
+    'humidity': ['Location_Type', 'Common_Name', 'Year', 'Month', 'Humidity_Bin'],
+    'conditions': ['Location_Type', 'Sky', 'Wind', 'Temperature_Bin']
+}
+
+#Measures stored in each cell
+COUNT = 'Count'
+DISTINCT_COUNT = 'Distinct_Count'
+MEASURES = [COUNT, DISTINCT_COUNT]
+
+ECOSYSTEMS = data_ingest.ECOSYSTEMS
+
+#Temperature bins (°C, left-closed: 0-10 includes 0, excludes 10)
+TEMPERATURE_BINS = [0, 10, 20, 30, 40, 50]
+TEMPERATURE_LABELS = ['0-10°C', '10-20°C', '20-30°C', '30-40°C', '40-50°C']
+
+#Humidity bins (%, right-closed, lowest edge included)
+HUMIDITY_BINS = [0, 30, 60, 90]
+HUMIDITY_LABELS = ['Low', 'Medium', 'High']
+
+
+#Temperature_Bin column for a frame (non-numeric or out-of-range temperatures → NaN)
+def temperature_bin(temperature):
+    temperature = pd.to_numeric(temperature, errors='coerce')
+    return pd.cut(temperature, bins=TEMPERATURE_BINS, labels=TEMPERATURE_LABELS, right=False)
+
+
+#Humidity_Bin column for a frame (non-numeric or out-of-range humidity → NaN)
+def humidity_bin(humidity):
+    humidity = pd.to_numeric(humidity, errors='coerce')
+    return pd.cut(humidity, bins=HUMIDITY_BINS, labels=HUMIDITY_LABELS, include_lowest=True)
+
+
+#Cube dimension columns for a frame (dimensions the workbooks do not have are skipped)
+  #ecosystem_codes → position in ECOSYSTEMS of each row's source workbook
+def dimension_columns(frame, ecosystem_codes):
+    columns = {'Ecosystem': pd.Categorical.from_codes(ecosystem_codes, categories=ECOSYSTEMS)}
+    for dim in DIMENSIONS:
+        if dim in frame.columns:
+            columns[dim] = frame[dim].array
+    if 'Temperature' in frame.columns:
+        columns['Temperature_Bin'] = temperature_bin(frame['Temperature']).array
+    if 'Humidity' in frame.columns:
+        columns['Humidity_Bin'] = humidity_bin(frame['Humidity']).array
+    return pd.DataFrame({dim: columns[dim] for dim in DIMENSIONS if dim in columns}, index=frame.index)
+
+
+#Cells of a frame summed over a table's dimensions (dimensions the frame does not have are skipped)
+def _sum_cells(cells, dims):
+    dims = [dim for dim in dims if dim in cells.columns]
+    return cells.groupby(dims, observed=True, dropna=False)[MEASURES].sum().reset_index()
+
+
+#Cells the species sketches / top-K summaries are built from: the smallest table with their dimensions and Common_Name
+def _species_cells(cube, dims):
+    return cube.table([dim for dim in dims + ['Common_Name'] if dim in cube.dimensions])
+
+
+#Cube tables of a frame (table name → cells); distinct → 1 for rows that are not exact duplicates of an earlier row
+def group_cells(frame, ecosystem_codes, distinct):
+    keys = dimension_columns(frame, ecosystem_codes)
+    keys[COUNT] = np.ones(len(keys), dtype=np.int64)
+    keys[DISTINCT_COUNT] = distinct.astype(np.int64)
+    return {name: _sum_cells(keys, dims) for name, dims in TABLES.items()}
+
+
+#Precomputed Count Cube for One Snapshot
+class AggregateCube:
+    #tables     -> table name → cells (one row per observed combination of the table's dimensions, with the measures)
+    #dimensions -> cube dimensions available for this snapshot
+    #token      -> snapshot token the cube was built from
+    def __init__(self, tables, token):
+        self.tables = tables
+        self.dimensions = [dim for dim in DIMENSIONS if any(dim in cells.columns for cells in tables.values())]
+        self.token = token
+        self._rollups = {}
+        self._indexes = {}
+        self._sketch = None
+        self._summaries = {}
+        self._lock = threading.RLock()
+
+    #Smallest table holding all of the given dimensions
+    def table(self, dims):
+        missing = [dim for dim in dims if dim not in self.dimensions]
+        if missing:
+            raise KeyError(f"Not a cube dimension: {', '.join(missing)}")
+        tables = [cells for cells in self.tables.values() if all(dim in cells.columns for dim in dims)]
+        if not tables:
+            raise KeyError(f"No cube table holds {', '.join(dims)} together (see aggregate_cube.TABLES)")
+        return min(tables, key=len)
+
+    #Cells summed down to the given dimensions (built once per dimension list, then reused)
+    def rollup(self, dims):
+        key = tuple(dims)
+        cells = self.table(key)
+        with self._lock:
+            rolled = self._rollups.get(key)
+            if rolled is None:
+                rolled = _sum_cells(cells, key)
+                self._rollups[key] = rolled
+            return rolled
+
+    #Cells held by each table
+    def cell_counts(self):
+        return {name: len(cells) for name, cells in self.tables.items()}
+
+    #Rollup cells matching the filters (column=value / [values], None = no filter; notna = dropna columns)
+      #Filters are resolved with the rollup's bitmap index, built the first time the rollup is filtered
+    def select(self, dims, notna=(), **filters):
+        cells = self.rollup(dims)
+        if not notna and all(selected is None for selected in filters.values()):
+            return cells
+        key = tuple(dims)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = bitmap_index.BitmapIndex(cells, key)
+                self._indexes[key] = index
+        return index.select(cells, notna, **filters)
+
+    #Species sketches of the cells (built from the cells the first time a unique-species count asks for them)
+    def sketch(self):
+        with self._lock:
+            if self._sketch is None:
+                self._sketch = richness_sketch.RichnessSketch.from_frame(_species_cells(self, richness_sketch.SKETCH_DIMS))
+            return self._sketch
+
+    #Top-K species summaries of the cells for a measure (built the first time a Top-K page asks for them)
+    def top_summary(self, measure):
+        with self._lock:
+            summary = self._summaries.get(measure)
+            if summary is None:
+                summary = heavy_hitters.TopKSummary.from_frame(_species_cells(self, heavy_hitters.SUMMARY_DIMS), measure)
+                self._summaries[measure] = summary
+            return summary
+
+
+#Builds the cube of a snapshot from all of its rows
+def build_cube(snapshot):
+    distinct = dedup.first_occurrences(dedup.row_hashes(snapshot.frame, 'exact'))
+    return AggregateCube(group_cells(snapshot.frame, snapshot.ecosystem_codes(), distinct), snapshot.token)
+
+
+#Cube of an appended snapshot: the cells of the new rows are added to the previous cube's cells
+  #Appended rows are already deduplicated on their key, so none of them repeats an earlier row
+def update_cube(cube, snapshot, rows, habitat):
+    ecosystem_codes = np.full(len(rows), data_ingest.HABITATS.index(habitat), dtype=np.int8)
+    new_cube = AggregateCube(
+        group_cells(rows, ecosystem_codes, dedup.first_occurrences(dedup.row_hashes(rows, 'exact'))),
+        snapshot.token
+    )
+
+    #Re-encode both sets of cells with the new snapshot's dictionaries before adding them up
+    dtypes = {
+        dim: snapshot.frame[dim].dtype for dim in cube.dimensions
+        if dim in snapshot.frame.columns and isinstance(snapshot.frame[dim].dtype, pd.CategoricalDtype)
+    }
+    tables = {}
+    for name, dims in TABLES.items():
+        cells = pd.concat(
+            [schema.apply_categories(cube.tables[name].copy(), dtypes), schema.apply_categories(new_cube.tables[name], dtypes)],
+            ignore_index=True
+        )
+        tables[name] = _sum_cells(cells, dims)
+    updated = AggregateCube(tables, snapshot.token)
+    if cube._sketch is not None:               #Sketches merge: only the new cells are sketched
+        updated._sketch = cube._sketch.merge(new_cube.sketch())
+    for measure, summary in cube._summaries.items():    #Top-K summaries merge the same way
+        updated._summaries[measure] = summary.merge(new_cube.top_summary(measure))
+    return updated
+
+
+#Returns the AggregateCube of a snapshot, building it the first time the snapshot is used
+def cube_for(snapshot):
+    return snapshot.derived('aggregate_cube', build_cube, update_cube)
+
+
+#Returns the AggregateCube for the current forest + grassland workbooks
+def load_cube(forest_path=data_ingest.FOREST_PATH, grassland_path=data_ingest.GRASSLAND_PATH):
+    return cube_for(data_ingest.load_snapshot(forest_path, grassland_path))
+
+#Commands Used
+#groupby(observed=True, dropna=False) – One cell per combination that actually occurs, missing values included
+#TABLES                               – Per-page groups of dimensions, each grouped into its own cell table
+#dedup.row_hashes(frame, 'exact')     – Marks exact duplicate rows once (row hashes), for the Distinct_Count measure
+#pd.cut()                             – Temperature / humidity bins shared with the pages
+#pd.Categorical.from_codes()          – Forest / Grassland ecosystem column without building strings per row
+#update_cube()                        – Adds the cells of appended rows instead of regrouping every row
+#rollup()                             – Sums the smallest table holding a page's dimensions down to them (memoized)
+#select()                             – Bitwise-filters a rollup's cells before any pandas work
+#sketch()                             – Mergeable HyperLogLog species sketches for unique-species counts
+#top_summary()                        – Mergeable bounded top-K species summaries per cell
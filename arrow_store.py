@@ -0,0 +1,163 @@
+#Shared Arrow Store
+  #Writes the cleaned observations of a snapshot to one uncompressed Arrow IPC file that every Streamlit
+  #session and every worker process memory-maps read-only; the columns come back as NumPy views of the mapped file.
+  #Why? → Each worker behind a load balancer parsed and held its own copy of the observations; mapped pages
+  #live in the OS page cache once, so an extra worker costs almost no resident memory and starts without parsing.
+
+#Storage mode
+  #BIRD_STORAGE=arrow turns it on (default: memory → each process keeps its own parsed frame, as before).
+  #data_ingest.load_snapshot() looks the store up by the workbooks' content hashes before reading any workbook;
+  #the first process to build a snapshot writes the store, every later process maps it.
+  #Sessions of one process already share the snapshot through data_ingest's process-wide cache.
+
+#Column layout (every stored array is a null-free primitive array, so the mapped buffers are used as they are)
+  #category       → integer codes (-1 = missing); categories kept in the file's metadata
+  #bool           → uint8, viewed as bool
+  #datetime64     → int64, viewed as datetime64 (NaT included)
+  #Int8 / Int16…  → values + "<column>.mask" (uint8)
+  #int / float    → as they are
+  #object flags   → nullable bool (values + mask), e.g. Previously_Obs when some sheets lack it
+  #anything else  → Arrow strings (Start_Time / End_Time times as "HH:MM:SS" text, as in the Parquet snapshots)
+
+#Import required libraries
+import glob                        #Older store files to remove
+import hashlib                     #File name from the snapshot key
+import json                        #Column layout and snapshot details in the file metadata
+import os                          #Store folder, storage switch and atomic renames
+
+import numpy as np                 #Views of the mapped buffers
+import pandas as pd                #Frame rebuilt from the mapped columns
+import snapshot_cache              #Store files sit next to the Parquet snapshots
+
+#pyarrow is optional – without it the storage mode falls back to in-memory frames
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+#Storage mode of the cleaned observations (override with the BIRD_STORAGE environment variable)
+STORAGE = os.environ.get("BIRD_STORAGE", "memory").strip().lower()
+ENABLED = STORAGE == "arrow" and pa is not None
+
+#Bump when the column layout changes so stores written by older code are rebuilt
+STORE_VERSION = 2
+
+STORE_PREFIX = "observations-"
+
+#Nullable pandas arrays stored as values + mask (Int8/Int16 Year, Month, Hour; 'boolean' flags)
+MASKED_ARRAYS = (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)
+
+
+#Store file of a snapshot key (workbook content hashes)
+def store_path(key, directory=None):
+    digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()[:16]
+    return os.path.join(directory or snapshot_cache.SNAPSHOT_DIR, f"{STORE_PREFIX}{digest}.arrow")
+
+
+#Stored arrays and layout entry of one column
+def encode_column(name, series):
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype) and all(isinstance(v, str) for v in dtype.categories):
+        layout = {'kind': 'category', 'categories': list(dtype.categories), 'ordered': bool(dtype.ordered)}
+        return [(name, pa.array(series.cat.codes.to_numpy()))], layout
+    if dtype == bool:
+        return [(name, pa.array(series.to_numpy().view(np.uint8)))], {'kind': 'bool'}
+    if isinstance(dtype, np.dtype) and dtype.kind == 'M':
+        return [(name, pa.array(series.to_numpy().view(np.int64)))], {'kind': 'datetime', 'dtype': str(dtype)}
+    if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+        return [(name, pa.array(series.to_numpy()))], {'kind': 'numpy'}
+    if not isinstance(series.array, MASKED_ARRAYS) and dtype == object:
+        try:
+            array = pa.array(series, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            array = None
+        if array is not None and pa.types.is_boolean(array.type):
+            series = series.astype('boolean')  #TRUE/FALSE flags with gaps (Previously_Obs) → nullable bool
+    if isinstance(series.array, MASKED_ARRAYS):
+        values = series.array.to_numpy(dtype=series.dtype.numpy_dtype, na_value=0)
+        values = values.view(np.uint8) if values.dtype == bool else values   #Arrow packs bools into bits (no views)
+        mask = series.isna().to_numpy().view(np.uint8)
+        return [(name, pa.array(values)), (f"{name}.mask", pa.array(mask))], {'kind': 'masked', 'dtype': str(series.dtype)}
+    #Everything else is stored as text (times, mixed cells), read back as an Arrow-backed string column
+    array = pa.array(series.where(series.isna(), series.astype(str)), type=pa.large_string(), from_pandas=True)
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()         #Arrow-backed pandas columns arrive in pieces; the store keeps one batch
+    return [(name, array)], {'kind': 'text'}
+
+
+#Column rebuilt from the mapped table (views of the file)
+def decode_column(table, name, layout):
+    def view(column):
+        return table.column(column).chunk(0).to_numpy(zero_copy_only=True)
+
+    kind = layout['kind']
+    if kind == 'category':
+        dtype = pd.CategoricalDtype(layout['categories'], ordered=layout['ordered'])
+        return pd.Categorical.from_codes(view(name), dtype=dtype, validate=False)
+    if kind == 'bool':
+        return view(name).view(bool)
+    if kind == 'datetime':
+        return view(name).view(layout['dtype'])
+    if kind == 'masked':
+        dtype = pd.api.types.pandas_dtype(layout['dtype'])
+        values = view(name).view(dtype.numpy_dtype)
+        return dtype.construct_array_type()(values, view(f"{name}.mask").view(bool))
+    if kind == 'numpy':
+        return view(name)
+    return table.column(name).to_pandas()     #pandas keeps large_string columns as Arrow arrays over the mapped buffers
+
+
+#Writes a snapshot's combined frame to the store of its key; returns the path (None when it cannot be written)
+  #Other store files are removed: processes still mapping them keep their pages until they let go
+def write_store(key, frame, forest_rows, token):
+    if pa is None:
+        return None
+    path = store_path(key)
+    arrays, layout = [], {}
+    for name in frame.columns:
+        stored, layout[name] = encode_column(name, frame[name])
+        arrays.extend(stored)
+    metadata = {'version': STORE_VERSION, 'key': key, 'token': token, 'forest_rows': forest_rows,
+                'rows': len(frame), 'columns': layout}
+    table = pa.table(dict(arrays)).replace_schema_metadata({'bird_store': json.dumps(metadata)})
+
+    temp_path = f"{path}.{os.getpid()}.tmp"        #One temp file per process when several workers write at once
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with pa.OSFile(temp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=max(len(table), 1))   #One record batch → one buffer per column
+        os.replace(temp_path, path)
+    except (OSError, pa.ArrowException):
+        return None
+    for old in glob.glob(os.path.join(os.path.dirname(path), f"{STORE_PREFIX}*.arrow")):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass                           #Still open elsewhere (Windows) → removed by a later write
+    return path
+
+
+#Maps the store of a key read-only; returns (frame, forest rows, token) or None when there is no matching store
+def read_store(key):
+    path = store_path(key)
+    if pa is None or not os.path.exists(path):
+        return None
+    try:
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        metadata = json.loads(table.schema.metadata[b'bird_store'])
+        if metadata['version'] != STORE_VERSION or metadata['key'] != json.loads(json.dumps(key)):
+            return None
+        columns = {name: decode_column(table, name, layout) for name, layout in metadata['columns'].items()}
+    except (OSError, KeyError, ValueError, pa.ArrowException):
+        return None                        #Missing, half-copied or older store → caller builds the snapshot
+    frame = pd.DataFrame(columns, copy=False)  #copy=False keeps every column a view of the mapped file
+    return frame, metadata['forest_rows'], metadata['token']
+
+#Commands Used
+#pa.ipc.new_file()                      – Uncompressed Arrow IPC file (mappable as-is)
+#pa.memory_map(path, "r")               – Read-only mapping shared through the OS page cache
+#to_numpy(zero_copy_only=True)          – NumPy view of a mapped column buffer (fails instead of copying)
+#pd.Categorical.from_codes(validate=False) – Category column over the mapped codes
+#pd.DataFrame(columns, copy=False)      – Frame whose columns stay views of the file
+#os.replace()                           – Atomic swap so workers never map a half-written store
@@ -0,0 +1,261 @@
+#Batch Page Reports
+  #Runs every built-in dashboard page outside Streamlit for each admin unit (park) and period, and writes
+  #one report bundle: an HTML report per park and period with every page's figures, static images
+  #(PNG/PDF/SVG through kaleido, when installed) and an index of all reports.
+  #Why? → The monthly park summaries were made by clicking through every page of the sidebar by hand.
+
+#Bundle layout (--output, default reports/)
+  #index.html                      → table of parks × periods linking to each report
+  #manifest.json                   → pages rendered / empty / failed for every report
+  #plotly.min.js                   → shared by every report (works offline)
+  #<period>/<unit>/report.html     → every page's figures for one park and period
+  #<period>/<unit>/<page>-<n>.png  → static images of the figures (--images png|pdf|svg)
+  #--zip also packs the folder into <output>.zip
+
+#Parallelism
+  #Each (park, period) report is one task in a process pool (--workers, default: every core);
+  #each worker loads the observations once (Parquet snapshots, see snapshot_cache.py) and slices them per task.
+
+#Usage
+  #python batch_reports.py --period month --year 2018
+  #python batch_reports.py --units ANTI CATO --period year --images png --zip
+
+#Import required libraries
+import argparse                    #Command-line options
+import html                        #Escapes page titles and messages in the report HTML
+import json                        #Manifest of the bundle
+import multiprocessing             #spawn context for the worker processes
+import os                          #Output folders
+import re                          #File-name-safe page titles
+import shutil                      #Zipped bundle
+import time                        #Elapsed time per report
+from concurrent.futures import ProcessPoolExecutor, as_completed   #One task per park and period
+
+import pandas as pd                #Pandas to slice the observations per park and period
+import plotly.offline              #plotly.js written once into the bundle
+import data_ingest                 #Shared, cached ingest layer (ObservationSnapshot)
+import page_pipelines              #Stages of every built-in page
+
+#kaleido is optional – without it the reports hold interactive HTML figures only
+try:
+    import kaleido
+except ImportError:
+    kaleido = None
+
+PERIODS = ['all', 'year', 'month']
+IMAGE_FORMATS = ['none', 'png', 'pdf', 'svg']
+OUTPUT_DIR = "reports"
+
+#Observations of the worker process (loaded once per worker by _init_worker)
+_worker_snapshot = None
+
+
+#File-name-safe form of a page title
+def slug(title):
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+
+
+#(year, month) of a period label: 'all' → (None, None), '2018' → (2018, None), '2018-06' → (2018, 6)
+def parse_period(period):
+    if period == 'all':
+        return None, None
+    year, _, month = period.partition('-')
+    return int(year), int(month) if month else None
+
+
+#Report tasks as (unit, period label) for every park and period that has observations
+def report_tasks(snapshot, period='month', units=None, year=None):
+    frame = snapshot.frame
+    keys = pd.DataFrame({
+        'unit': frame['Admin_Unit_Code'].astype(object),
+        'year': frame['Year'],
+        'month': frame['Month']
+    }).dropna(subset=['unit'])
+    if units:
+        keys = keys[keys['unit'].isin(units)]
+    if year is not None:
+        keys = keys[keys['year'].eq(year).fillna(False)]
+    if period == 'all':
+        return [(unit, 'all') for unit in sorted(keys['unit'].unique())]
+    keys = keys.dropna(subset=['year', 'month'] if period == 'month' else ['year'])
+    columns = ['unit', 'year', 'month'] if period == 'month' else ['unit', 'year']
+    tasks = []
+    for row in keys[columns].drop_duplicates().sort_values(columns).itertuples(index=False):
+        label = f"{row.year:04d}-{row.month:02d}" if period == 'month' else f"{row.year:04d}"
+        tasks.append((row.unit, label))
+    return tasks
+
+
+#Snapshot holding only one park's observations in one period (token derived from the full snapshot's)
+def subset_snapshot(snapshot, unit, period):
+    year, month = parse_period(period)
+
+    def rows(frame):
+        mask = frame['Admin_Unit_Code'].eq(unit).fillna(False)
+        if year is not None:
+            mask &= frame['Year'].eq(year).fillna(False)
+        if month is not None:
+            mask &= frame['Month'].eq(month).fillna(False)
+        return frame[mask.to_numpy(dtype=bool)].reset_index(drop=True)
+
+    return data_ingest.ObservationSnapshot(rows(snapshot.forest), rows(snapshot.grassland), f"{snapshot.token}-{unit}-{period}")
+
+
+#Runs every page on a snapshot; returns [(title, figures, error message or None)]
+  #A page failing (e.g. no rows for its default filter) is reported instead of stopping the report
+def render_pages(snapshot, titles):
+    pages = []
+    for title in titles:
+        try:
+            pages.append((title, page_pipelines.render_page(title, snapshot), None))
+        except Exception as e:
+            pages.append((title, [], f"{type(e).__name__}: {e}"))
+    return pages
+
+
+#HTML report of one park and period (plotly.js loaded from the bundle root)
+def report_html(unit, period, pages, rows, images):
+    sections = []
+    for title, figures, error in pages:
+        body = []
+        if error:
+            body.append(f"<p class='note'>Not available: {html.escape(error)}</p>")
+        elif not figures:
+            body.append("<p class='note'>No data for this page.</p>")
+        for index, fig in enumerate(figures):
+            body.append(fig.to_html(full_html=False, include_plotlyjs=False))
+            image = images.get((title, index))
+            if image:
+                body.append(f"<p class='note'>Static image: <a href='{html.escape(image)}'>{html.escape(image)}</a></p>")
+        sections.append(f"<section><h2>{html.escape(title)}</h2>{''.join(body)}</section>")
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<title>{html.escape(unit)} – {html.escape(period)}</title>"
+        "<script src='../../plotly.min.js'></script>"
+        "<style>body{font-family:sans-serif;margin:2em} .note{color:#666}</style></head><body>"
+        f"<h1>Bird observations – {html.escape(unit)}, {html.escape(period)}</h1>"
+        f"<p>{rows:,} observations</p>{''.join(sections)}</body></html>"
+    )
+
+
+#Loads the observations once per worker process
+def _init_worker(forest_path, grassland_path):
+    global _worker_snapshot
+    _worker_snapshot = data_ingest.load_snapshot(forest_path, grassland_path)
+
+
+#Builds and writes one report (runs in a worker process); returns its manifest entry
+def build_report(unit, period, titles, output_dir, image_format='none'):
+    start = time.perf_counter()
+    snapshot = subset_snapshot(_worker_snapshot, unit, period)
+    pages = render_pages(snapshot, titles)
+
+    folder = os.path.join(output_dir, period, unit)
+    os.makedirs(folder, exist_ok=True)
+    images = {}
+    if image_format != 'none':
+        for title, figures, _ in pages:
+            for index, fig in enumerate(figures):
+                name = f"{slug(title)}-{index + 1}.{image_format}"
+                fig.write_image(os.path.join(folder, name))
+                images[(title, index)] = name
+    with open(os.path.join(folder, "report.html"), "w", encoding="utf-8") as handle:
+        handle.write(report_html(unit, period, pages, len(snapshot.frame), images))
+
+    return {
+        'unit': unit,
+        'period': period,
+        'rows': len(snapshot.frame),
+        'report': f"{period}/{unit}/report.html",
+        'pages': {title: 'error' if error else 'ok' if figures else 'empty' for title, figures, error in pages},
+        'errors': {title: error for title, _, error in pages if error},
+        'seconds': round(time.perf_counter() - start, 3)
+    }
+
+
+#Index page of the bundle: one row per park, one column per period
+def index_html(entries):
+    periods = sorted({entry['period'] for entry in entries})
+    units = sorted({entry['unit'] for entry in entries})
+    reports = {(entry['unit'], entry['period']): entry for entry in entries}
+    header = "".join(f"<th>{html.escape(period)}</th>" for period in periods)
+    rows = []
+    for unit in units:
+        cells = []
+        for period in periods:
+            entry = reports.get((unit, period))
+            cells.append(f"<td><a href='{entry['report']}'>{entry['rows']:,}</a></td>" if entry else "<td></td>")
+        rows.append(f"<tr><th>{html.escape(unit)}</th>{''.join(cells)}</tr>")
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Bird observation reports</title>"
+        "<style>body{font-family:sans-serif;margin:2em} td,th{padding:4px 10px;text-align:right}</style></head><body>"
+        "<h1>Bird observation reports</h1><p>Observations per park and period; each number links to its report.</p>"
+        f"<table><tr><th></th>{header}</tr>{''.join(rows)}</table></body></html>"
+    )
+
+
+#Builds every report in a process pool and writes the bundle's index, manifest and plotly.js
+def build_reports(output_dir=OUTPUT_DIR, period='month', units=None, year=None, titles=None, image_format='none',
+                  workers=None, forest_path=data_ingest.FOREST_PATH, grassland_path=data_ingest.GRASSLAND_PATH):
+    if image_format != 'none' and kaleido is None:
+        raise RuntimeError("Static images need the kaleido package (pip install kaleido); use --images none for HTML only")
+    titles = list(titles or page_pipelines.PIPELINES)
+    snapshot = data_ingest.load_snapshot(forest_path, grassland_path)
+    tasks = report_tasks(snapshot, period, units, year)
+    del snapshot
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "plotly.min.js"), "w", encoding="utf-8") as handle:
+        handle.write(plotly.offline.get_plotlyjs())
+
+    entries = []
+    if tasks:
+        context = multiprocessing.get_context("spawn")
+        workers = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(forest_path, grassland_path)) as pool:
+            futures = [pool.submit(build_report, unit, label, titles, output_dir, image_format) for unit, label in tasks]
+            for done, future in enumerate(as_completed(futures), start=1):
+                entry = future.result()
+                entries.append(entry)
+                print(f"[{done}/{len(tasks)}] {entry['unit']} {entry['period']}: {entry['rows']:,} rows, "
+                      f"{len(entry['errors'])} page errors, {entry['seconds']:.2f} s")
+
+    entries.sort(key=lambda entry: (entry['period'], entry['unit']))
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as handle:
+        json.dump({'period': period, 'pages': titles, 'images': image_format, 'reports': entries}, handle, indent=2)
+    with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as handle:
+        handle.write(index_html(entries))
+    return entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every dashboard page per park and period into a report bundle")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="bundle folder")
+    parser.add_argument("--period", choices=PERIODS, default='month', help="one report per park and month, year, or all data")
+    parser.add_argument("--year", type=int, help="only this year")
+    parser.add_argument("--units", nargs="+", metavar="UNIT", help="admin unit codes (default: every park)")
+    parser.add_argument("--pages", nargs="+", choices=list(page_pipelines.PIPELINES), metavar="PAGE", help="pages to render (default: all)")
+    parser.add_argument("--images", choices=IMAGE_FORMATS, default='none', help="static image format (needs kaleido)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: every core)")
+    parser.add_argument("--zip", action="store_true", help="also pack the bundle into <output>.zip")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    entries = build_reports(args.output, args.period, args.units, args.year, args.pages, args.images, args.workers)
+    print(f"{len(entries)} reports written to {args.output} in {time.perf_counter() - start:.1f} s")
+    if args.zip:
+        archive = shutil.make_archive(os.path.abspath(args.output), "zip", args.output)
+        print(f"Bundle: {archive}")
+
+
+if __name__ == "__main__":
+    main()
+
+#Commands Used
+#page_pipelines.render_page()              – Runs a page's load → clean → aggregate → figures stages without Streamlit
+#ObservationSnapshot(rows of one park)      – Per-park, per-period data that every page accepts unchanged
+#ProcessPoolExecutor(initializer=...)      – One report per task; each worker loads the observations once
+#fig.to_html(include_plotlyjs=False)       – Interactive figures sharing one plotly.min.js
+#fig.write_image()                         – PNG / PDF / SVG through kaleido
+#shutil.make_archive()                     – Zipped report bundle
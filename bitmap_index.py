@@ -0,0 +1,69 @@
+#Bitmap Filter Index
+  #One packed bitset per value of each indexed column (bit i set → row i holds that value),
+  #plus one "present" bitset per column (bit i set → row i is not missing).
+  #Why? → A page's filters (species, habitat, year, month, season, ...) become bitwise OR within a column
+  #and AND across columns on n/8-byte arrays, resolved before any pandas work touches the rows.
+
+#Filters
+  #column=value or column=[values] → rows holding any of the values (an empty list selects nothing)
+  #column=None                     → no filter on that column (matches the pages' "None = all" selectboxes)
+  #notna=[columns]                 → rows where every listed column is present (dropna(subset=...))
+
+#Import required libraries
+import numpy as np                 #NumPy packed bit arrays and bitwise operations
+import pandas as pd                #Pandas to factorize the indexed columns
+
+
+#Packed Bitsets for the Values of Several Columns
+class BitmapIndex:
+    #size     -> number of rows indexed
+    #bitmaps  -> column -> {value: packed bitset}
+    #present  -> column -> packed bitset of rows where the column is not missing
+    def __init__(self, frame, columns):
+        self.size = len(frame)
+        self.bitmaps = {}
+        self.present = {}
+        for col in columns:
+            codes, values = pd.factorize(frame[col])
+            self.present[col] = np.packbits(codes >= 0)
+            self.bitmaps[col] = {
+                value: np.packbits(codes == code)
+                for code, value in enumerate(values.tolist())
+            }
+
+    #Bitset with every row selected (padding bits of the last byte stay clear)
+    def _all_rows(self):
+        return np.packbits(np.ones(self.size, dtype=bool))
+
+    #Packed bitset of the rows matching the filters
+    def mask(self, notna=(), **filters):
+        bits = self._all_rows()
+        for col in notna:
+            bits &= self.present[col]
+        for col, selected in filters.items():
+            if selected is None:
+                continue
+            if not isinstance(selected, (list, tuple, set)):
+                selected = [selected]
+            col_bits = np.zeros_like(bits)
+            for value in selected:
+                value_bits = self.bitmaps[col].get(value)
+                if value_bits is not None:
+                    col_bits |= value_bits
+            bits &= col_bits
+        return bits
+
+    #Row positions matching the filters, in row order
+    def positions(self, notna=(), **filters):
+        return np.flatnonzero(np.unpackbits(self.mask(notna, **filters), count=self.size))
+
+    #Rows of the indexed frame matching the filters
+    def select(self, frame, notna=(), **filters):
+        return frame.take(self.positions(notna, **filters))
+
+#Commands Used
+#pd.factorize()          – Integer code per distinct value (missing values → -1)
+#np.packbits()           – Packs a boolean row mask into 1 bit per row
+#&= / |=                 – AND across columns, OR across the selected values of one column
+#np.unpackbits(count=n)  – Back to a row mask, trimmed to the number of rows
+#DataFrame.take()        – Gathers only the matching rows
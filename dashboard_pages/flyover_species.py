@@ -0,0 +1,42 @@
+#Flyover Observed Species
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("🦅 Flyover Observed Species")
+    st.markdown("This section highlights the top species observed during flyovers.")
+
+    #Observation counts per species / flyover flag from the aggregate cube
+    pipeline, cube = load_page_source("Flyover Observed Species")
+
+    #Clean and process data
+    df = run_stage(pipeline.clean, cube)
+
+    #Filter rows where Flyover_Observed is TRUE, count occurrences per species, most observed species first
+    flyover_counts_sorted = run_stage(pipeline.aggregate, cube, df)
+
+    #Plot the top flyover species
+    if flyover_counts_sorted.empty:
+        st.warning("No flyover observed species data available.")
+    else:
+        fig, = pipeline.figures(flyover_counts_sorted)  # Show top 10 species
+        show_chart(fig, use_container_width=True)
+
+#render() - Runs when the user selects the "Flyover Observed Species" option from the sidebar.
+#Data Loading and Processing - We load the forest and grassland data, clean the columns, and filter out rows where the Flyover_Observed is TRUE.
+#Group and Count -We group the data by species and count the number of observations for each species during flyovers.
+#Visualization - The top 10 flyover species are visualized using a bar chart. If no data is available, a warning message is displayed        
+
+#Commands Used
+#load_page_source()              – Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py)
+#run_stage(pipeline.clean, cube) – Observation counts per species and flyover flag (cube.rollup(), missing values dropped)
+#run_stage(pipeline.aggregate)   – Top 10 species among flyover observations (heavy_hitters.top_species())
+#st.warning()                    – Display message if no flyover species are available
+#pipeline.figures()              – Plotly bar chart of the top 10 flyover species
+#show_chart()                    – Draws the chart with st.plotly_chart()
+#st.header(), st.markdown()      – Display page title and introductory text
+
+#Short Description: Displays the top 10 bird species most frequently observed during flyovers across forest and grassland habitats.
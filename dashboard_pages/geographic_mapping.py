@@ -0,0 +1,65 @@
+#Geographic mapping (if location data is available) to highlight high-activity zones
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+import richness_sketch             #Whether unique-species counts are estimated (HyperLogLog) and their error bound
+from dashboard_pages.common import load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    #Title and subheader
+    st.title("Geographic Mapping: Forest vs Grassland")
+    st.subheader("Monthly & Yearly Species Count Comparison in Forest and Grassland Ecosystems")
+
+    #Info block
+    st.markdown(
+        "This analysis compares the number of unique bird species observed in forest and grassland ecosystems "
+        "across different **months** and **years** to understand seasonal and long-term biodiversity trends."
+    )
+
+    #Species present per ecosystem / year / month from the aggregate cube ('Ecosystem' = source workbook)
+    #Duplicate rows never change a unique-species count, so the drop_duplicates() passes are not needed here
+    pipeline, cube = load_page_source("Geographic Mapping - Forest vs Grassland")
+    df = run_stage(pipeline.clean, cube)
+
+    #MONTHLY / YEARLY UNIQUE SPECIES COUNT
+    #Forest, then Grassland: Group by Month (and by Year), count unique species, combine both ecosystems
+    result = run_stage(pipeline.aggregate, cube, df)
+
+    #Plot: Monthly and yearly comparison
+    fig_month, fig_year = pipeline.figures(result)
+    show_chart(fig_month)
+    show_chart(fig_year)
+    if richness_sketch.use_sketch(cube, ['Ecosystem', 'Year', 'Month']):
+        st.caption(f"Species counts estimated from HyperLogLog sketches (±{richness_sketch.ERROR_BOUND:.1%} for 95 % of counts).")
+
+#Keyword Explanation
+#load_page_source()              – Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py)
+#run_stage(pipeline.clean, cube) – Observation counts per ecosystem, year, month and species (cube.rollup())
+#run_stage(pipeline.aggregate)   – Unique species per month and per year in each ecosystem (richness_sketch.distinct_species())
+#pipeline.figures()              – Plotly grouped bar charts (monthly and yearly)
+#show_chart()                    – Renders the charts with st.plotly_chart()
+#richness_sketch.use_sketch()    – Whether the counts are HyperLogLog estimates (st.caption() shows the error bound)
+#st.title, st.subheader          – Add section titles and context
+#st.markdown()                   – Display explanation text
+
+#Short Note:
+#This section compares the number of unique bird species observed in forest and grassland ecosystems,
+#Highlighting biodiversity differences using a bar chart.
+#(Forest vs Grassland = “Who has more bird variety?”)
+
+#Focus: Ecosystem-level comparison — answers “Which ecosystem has more unique species?”
+
+#Metric: Count of unique species (Common_Name) per ecosystem
+
+#Explanations:
+#Data Loading: Observation counts for both forest and grassland ecosystems come from the snapshot's aggregate cube.
+#Data Cleaning: Duplicate rows never change a unique-species count, so no duplicate removal is needed.
+#Unique Species Count: We count distinct bird species based on the "Common_Name" column in each ecosystem.
+#Visualization: A Plotly bar chart visually compares species richness across the two ecosystems.
+
+#Key Takeaways:
+#Forest Ecosystem: Hosts a distinct set of observed bird species.
+#Grassland Ecosystem: Has its own unique bird species as well.
+#Species Comparison: The chart shows which ecosystem supports greater biodiversity.
+#Importance: Comparing biodiversity across ecosystems aids ecological research and conservation planning.
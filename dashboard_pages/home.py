@@ -0,0 +1,79 @@
+#Home
+  #Title, greeting and a guide to every page (no observations are loaded)
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from datetime import datetime      #Used to fetch the current time for personalized greeting
+
+
+def render():
+    st.title("Bird Species Observation Dashboard")
+    st.subheader("Welcome to the Bird Monitoring Explorer")
+
+    # Greeting
+    current_hour = datetime.now().hour    #Get the current hour of the day
+    if current_hour < 12:                 #Check if it is before 12 PM
+        st.write("🌞 Good Morning!")     #Display good morning message
+    elif 12 <= current_hour < 18:         #Check if it is between 12 PM and 6 PM
+        st.write("☀️ Good Afternoon!")   #Display good afternoon message
+    else:                                 #If the hour is 6 PM or later
+        st.write("🌙 Good Evening!")     #Display good evening message
+
+    #datetime.now().hour --> Gets the current hour from the system clock to customize the greeting.
+    #st.write() --> Displays the greeting message based on the time of day  
+
+    st.markdown("""
+    Explore forest and grassland bird activity across regions and time.  
+    Gain insights into species patterns and conservation efforts.
+    """)
+
+    #App Description (Markdown for styling) wrapped in an expander
+    with st.expander("📘 How to Use This Dashboard"):
+        st.markdown("""
+        ### About the Dashboard
+        Explore insightful visualizations from **forest** and **grassland** ecosystems.  
+        - Analyze bird species trends  
+        - Understand observer patterns  
+        - Visualize conservation statuses  
+
+        **Home** - Overview & Insights  
+                    
+        **Species Distribution** - Distance & Flyover Trends  
+                    
+        **Temporal Heatmap** - Monthly Activity  
+                    
+        **Species Filters** - Environmental Patterns
+
+        **Geographic Mapping** - Compare species diversity in forest and grassland ecosystems          
+     
+        **Species Richness** – Count of unique species observed across habitats
+                    
+        **Top Observed Species** – Most frequently recorded species overall
+                    
+        **Species Activity by Region and Season** – Seasonal and regional presence of bird species
+                    
+        **Temperature Bin by Habitat** – Species distribution across temperature ranges
+                    
+        **Humidity Bin by Habitat** – Observation patterns under varying humidity conditions
+                    
+        **Sky Conditions** – Effect of sky/cloud cover on species visibility
+                    
+        **Wind Conditions** – Influence of wind conditions on bird observations
+                    
+        **Seasonal Observation Counts** – Number of observations across different seasons
+                    
+        **Seasonal Time Factor** – Time-of-day activity trends across seasons
+                    
+        **Flyover Observed Species** – Analysis of species recorded as flyovers
+                    
+        **Species Migration Patterns** – Migratory trends across months and regions
+        
+        **At-Risk Species & Conservation** – Highlighting conservation-priority species
+                    
+        **At-Risk Species & Conservation – Top 5 At-Risk Species** – Most observed vulnerable or endangered species
+
+        **High Activity Zones** - Species Count
+                    
+                             
+        Use the interactive tools and filters to **explore how birds interact with their environment**.
+        """)
@@ -0,0 +1,70 @@
+#Humidity Bin by Habitat
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import column_options, load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("🌧️ Humidity Bin by Habitat")
+    st.markdown("Explore how humidity levels vary across habitats by filtering bird observations by year and month.")
+
+    #Observation counts per species / habitat / year / month / humidity bin from the aggregate cube
+    pipeline, cube = load_page_source("Humidity Bin by Habitat")
+
+    #Drop cells missing key fields ('Year' is missing exactly when 'Date' is; missing or out-of-range humidity has no bin)
+    df = run_stage(pipeline.clean, cube)
+
+    #'Year' and 'Month' are derived from 'Date' once at ingest
+
+    #Sidebar filters for year and month
+    years = column_options(df, 'Year')
+    months = column_options(df, 'Month')
+
+    selected_year = st.selectbox("Select Year", options=[None] + years, index=0)
+    selected_month = st.selectbox("Select Month", options=[None] + months, index=0)
+
+    #Humidity bins (Low 0-30%, Medium 30-60%, High 60-90%) are assigned when the cube is built (aggregate_cube.HUMIDITY_BINS)
+
+    #Apply filters, then count the number of observations in each bin per habitat
+    humidity_bin_counts = run_stage(pipeline.aggregate, cube, df, year=selected_year, month=selected_month)
+
+    #Plot
+    if humidity_bin_counts.empty:
+        st.warning("No data available for the selected filters.")
+    else:
+        fig, = pipeline.figures(humidity_bin_counts)
+        show_chart(fig, use_container_width=True)
+
+#Commands
+#Data Loading & Cleaning
+  #load_page_source(): Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py).
+  #run_stage(pipeline.clean, cube): Observation counts per species, habitat, year, month and humidity bin (cube.rollup()).
+  #dropna(subset=[...]): Removes cells missing critical fields: Common_Name, Location_Type, Year (Date) or the humidity bin.
+
+#Sidebar Filters
+#column_options(): Sorted years and months of the cleaned cells
+#st.selectbox(): Dropdown filters for: Year, Month
+
+#Humidity Binning --> assigned when the cube is built (aggregate_cube.HUMIDITY_BINS): Low (0–30%), Medium (30–60%), High (60–90%)
+
+#Aggregation
+#run_stage(pipeline.aggregate): cube.select() keeps the cells of the selected year and month,
+#groupby([...])['Count'].sum(): Calculates number of observations per humidity bin for each habitat.
+
+#Visualization
+  #pipeline.figures() (Plotly Express bar chart):
+  #X-axis: Location_Type (habitat)
+  #Y-axis: Observation count
+  #Color: Humidity bin
+  #Custom color map: Low = blue, Medium = orange, High = red
+  #template='plotly_dark': Uses a dark theme
+#show_chart(..., use_container_width=True): Embeds the responsive chart in the Streamlit app (st.plotly_chart()).
+#st.warning(): Informs users when no data matches the selected filters.
+
+#Short Note: This feature categorizes humidity observations into low, medium, and high bins and visualizes the distribution of these humidity levels across different habitats (forest and grassland). Users can filter observations by year and month, and the results are displayed in an interactive bar chart        
+
+#Key Concepts
+#Humidity Binning - Humidity data is grouped into categories (bins) such as low, medium, and high based on predefined thresholds (0-30, 30-60, 60-90).
+#Data Filtering - Users can filter the dataset by selecting specific years and months
+#Visualization - Bar Chart displays the count of observations in each humidity bin, color-coded by the level of humidity
@@ -0,0 +1,55 @@
+#Species Migration Patterns
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("🦋 Species Migration Patterns")
+    st.markdown("Analyze species movement between forest and grassland habitats across different seasons.")
+
+    #Observation counts per species / season / habitat from the aggregate cube
+    pipeline, cube = load_page_source("Species Migration Patterns")
+    df = run_stage(pipeline.clean, cube)   #'Season' is missing exactly when 'Date' is; cube counts become the 'Observation' column
+
+    #Create observation count per species per habitat per season, pivoted to one column per habitat
+    migration_data = run_stage(pipeline.aggregate, cube, df)
+
+    #Display the table
+    if migration_data.empty:
+        st.warning("No species migration data available.")
+    else:
+        st.dataframe(migration_data)
+
+        #Plot: Grouped Bar Chart (index reset and melted for bar plotting)
+        fig, = pipeline.figures(migration_data)
+        show_chart(fig, use_container_width=True)
+
+#Data Loading: We take the forest and grassland observation counts from the aggregate cube.
+#Species Observed in Both Habitats: We create a filtered dataset where species are observed in both habitats (forest and grassland).
+#Migration Analysis: We generate a pivot table where species are indexed by their name and season, and columns are habitat types (forest and grassland).
+#Plotting: A bar chart is generated to visualize species migration patterns across habitats and seasons.
+
+#Explanation 
+  #Tracks how species appear across forest and grassland habitats by season to reveal potential migration or habitat overlap
+
+#Short Note
+  #This module identifies and visualizes the top 10 bird species observed during flyovers across forest and grassland habitats
+
+#Commands
+#load_page_source()                – Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py)
+#run_stage(pipeline.clean, cube)   – Observation counts per species, season and habitat (cube.rollup(), missing values dropped)
+#run_stage(pipeline.aggregate)     – Group and sum observations by species, season, and habitat, then pivot_table()
+#st.dataframe()                    – Display the pivoted table in Streamlit  
+#pipeline.figures()                – Grouped bar chart by species and habitat per season (reset_index(), melt(), px.bar())
+#collapse_tail()                   – Species beyond the largest ones are summed into 'Other' in the chart
+#show_chart()                      – Render the interactive Plotly chart (st.plotly_chart())
+#st.warning()                      – Show message if no migration data is found  
+#st.header(), st.markdown()        – Add section title and description to the Streamlit app  
+
+
+#Explanation
+#The code combines and cleans forest and grassland bird observation data, then filters to include only rows marked as flyover events. 
+#It counts how often each species is observed in flyovers, sorts them in descending order, and displays the top 10 species using a bar chart. 
+#If no relevant data is found, it notifies the user.
@@ -0,0 +1,94 @@
+#Seasonal Observation Counts
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import column_options, load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("📅 Seasonal Observation Counts")
+    st.markdown("Filter by year or season to explore the number of bird observations in each season.")
+
+    #Observation counts per species / habitat / year / season from the aggregate cube
+    pipeline, cube = load_page_source("Seasonal Observation Counts")
+
+    #Drop cells where necessary columns are missing ('Year' is missing exactly when 'Date' is)
+    df = run_stage(pipeline.clean, cube)
+
+    #'Year', 'Month' and 'Season' (months mapped to seasons) are derived once at ingest
+
+    #Sidebar filters for selecting year and season
+    years = column_options(df, 'Year')
+    seasons = ['Winter', 'Spring', 'Summer', 'Fall']
+
+    selected_year = st.selectbox("Select Year", options=[None] + years, index=0)
+    selected_season = st.selectbox("Select Season", options=[None] + seasons, index=0)
+
+    #Filter the DataFrame based on selected year and season, then count observations per season
+    seasonal_counts = run_stage(pipeline.aggregate, cube, df, year=selected_year, season=selected_season)
+
+    #Plot the seasonal observation counts
+    if seasonal_counts.empty:
+        st.warning("No data available for the selected filters.")
+    else:
+        fig, = pipeline.figures(seasonal_counts)
+        show_chart(fig, use_container_width=True)
+
+#Data Loading & Cleaning
+  #load_page_source(): Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py)
+  #run_stage(pipeline.clean, cube): Observation counts per species, habitat, year and season (cube.rollup())
+  #dropna(subset=[...]): Removes cells missing important data (Common_Name, Location_Type, Year)
+
+#Date Processing
+  #Year, month and season are derived from the Date column once at ingest (invalid dates have none and are dropped).
+
+#Season Mapping
+  #Months map to seasons at ingest:
+  #Winter: December, January, February
+  #Spring: March, April, May
+  #Summer: June, July, August
+  #Fall: September, October, November
+
+#Sidebar Filters
+  #column_options(): Sorted years of the cleaned cells
+  #st.selectbox(): Lets users choose:
+  #A specific year
+  #A specific season (with None as the default to show all)
+
+#Data Filtering
+  #run_stage(pipeline.aggregate): cube.select() keeps the cells of the selected year and/or season.
+
+#Observation Count
+  #groupby('Season')['Count'].sum(): Counts bird observations per season.
+  #.reset_index() and .rename(): Prepares the count data for visualization.
+
+#Visualization
+  #pipeline.figures(): Creates a bar chart (px.bar()):
+  #X-axis: Season
+  #Y-axis: Observation Count
+  #Color: Season-based color
+  #Theme: plotly_dark for a sleek look
+  #show_chart(..., use_container_width=True): Displays the chart responsively in the app (st.plotly_chart()).
+  #st.warning(): Shows a message if no data matches the filters.        
+
+#Short Note: Explore the number of bird observations across different seasons by filtering bird observations by year or season, visualized through an interactive bar chart.
+
+#Code Walkthrough
+#Navigation     - Create a page for Seasonal Observation Counts, and use the elif function
+#Data Loading   - Take the observation counts from the snapshot's aggregate cube (load_page_source)
+#Date Parsing   - Year and season come from the Date column, derived once at ingest
+#Season Mapping - Map the months to respective seasons (Spring, Summer, Fall, Winter)
+#Filter         - Allow filtering by year or season
+#Seasonal Count Calculation - Count the number of observations per season
+#Visualization  - Display the seasonal counts as a bar chart
+
+#Key Points
+#Season Mapping  - Months are mapped to four seasons (Winter, Spring, Summer, Fall) based on typical seasonal definitions.
+#Sidebar Filters - Allows filtering by specific year or season
+#Count Calculation - .groupby() function groups by season and sums the observation counts of the cube cells
+#Visualization     - Seasonal counts are visualized using a bar chart with Plotly
+
+#Other Insights
+#Identify high-activity regions and seasons for specific bird species
+#Uncover the influence of environmental factors on species behavior and activity
+#Highlight at-risk species and conservation priorities for targeted efforts
@@ -0,0 +1,56 @@
+#Seasonal Time Factor
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import column_options, load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("🌱 Seasonal Time Factor Analysis")
+    st.markdown("Explore how seasonal and time factors influence bird species observations by season and month.")
+
+    #Observation counts per species / habitat / season / month from the aggregate cube
+    pipeline, cube = load_page_source("Seasonal Time Factor")
+    df = run_stage(pipeline.clean, cube)   #'Month' is missing exactly when 'Date' is
+
+    #'Year', 'Month' and 'Season' for the seasonal analysis are derived once at ingest
+    
+    #Filter data by season and month
+    seasons = ['Spring', 'Summer', 'Fall', 'Winter']
+    selected_season = st.selectbox("Select Season", options=[None] + seasons, index=0)
+
+    months = column_options(df, 'Month', dropna=False)
+    selected_month = st.selectbox("Select Month", options=[None] + months, index=0)
+
+    #Apply season and month filters
+    #Seasonal Time Factor: Count observations by season and species
+    seasonal_time_factor = run_stage(pipeline.aggregate, cube, df, season=selected_season, month=selected_month)
+
+    #Plot the results
+    if seasonal_time_factor.empty:
+        st.warning("No data available for the selected filters.")
+    else:
+        fig, = pipeline.figures(seasonal_time_factor)
+        show_chart(fig, use_container_width=True)
+
+#Short Note: Analyzes bird species observations based on season and month to identify seasonal patterns in forest and grassland habitats
+
+#Commands
+#load_page_source() – Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py)
+#run_stage(pipeline.clean, cube) – Observation counts per species, habitat, season and month (cube.rollup(), dropna())
+#column_options() – Sorted months of the cleaned cells
+#selectbox() – Dropdown for user selection of season and month
+#run_stage(pipeline.aggregate) – cube.select() for the season and month, groupby()['Count'].sum() by species and season
+#pipeline.figures() – Create a grouped bar chart (px.bar(), smaller species summed into 'Other')
+#show_chart() – Render the chart (st.plotly_chart())
+
+#Data Loading   : Forest and grassland observation counts come from the snapshot's aggregate cube
+#Data Cleaning  : We drop cells with missing 'Common_Name', 'Month' (Date) or 'Location_Type'
+#Season Extraction: The season (Spring, Summer, Fall, Winter) is derived from the month of observation at ingest
+#Filters        : Users can filter by season and month using selectbox for dynamic filtering
+#Seasonal Time Factor Calculation: We calculate the count of observations for each season and species
+#Visualization: Results are plotted using a bar chart, with seasons on the x-axis and observation counts on the y-axis, colored by species
+
+#Explanation:
+#The code takes bird observation counts for forest and grassland regions from the aggregate cube, drops cells without a month or species, and lets users filter by season/month. 
+#It then groups data by season and bird species to show seasonal observation trends via a bar chart.
@@ -0,0 +1,43 @@
+#Sky Conditions
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("🌤️ Sky Conditions by Habitat")
+    st.markdown("Analyze how sky/cloud conditions vary between forest and grassland habitats.")
+
+    #Observation counts per habitat / sky condition from the aggregate cube
+    pipeline, cube = load_page_source("Sky Conditions")
+
+    #Standardize sky condition values and keep the expected conditions (page_pipelines.SKY_CONDITIONS)
+    df = run_stage(pipeline.clean, cube)
+
+    #Count by habitat and condition
+    sky_counts = run_stage(pipeline.aggregate, cube, df)
+
+    #Plot
+    if sky_counts.empty:
+        st.warning("No valid sky condition data available.")
+    else:
+        fig, = pipeline.figures(sky_counts)
+        show_chart(fig, use_container_width=True)
+
+#Explanations:
+   #This code analyzes and visualizes how sky/cloud conditions vary between forest and grassland habitats. 
+   #It takes observation counts for both ecosystems from the aggregate cube, standardizes the sky values, and filters valid sky conditions. 
+   #It then counts the number of observations by habitat and sky condition, and visualizes the results in a grouped bar chart.
+
+#Commands:
+#load_page_source(): Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py)
+#run_stage(pipeline.clean, cube): Observation counts per habitat and sky condition (cube.rollup())
+#df.dropna(): Drops cells with missing values in specified columns
+#str.strip().str.lower(): Converts text to lowercase for standardization
+#df.isin(): Filters rows where a column's value matches any in a provided list
+#run_stage(pipeline.aggregate): groupby()['Count'].sum() by habitat and sky condition
+#pipeline.figures(): Creates a bar chart using Plotly for data visualization
+#show_chart(): Renders the chart (st.plotly_chart())
+
+#Short Note: Short Note: This code visualizes the variation in sky/cloud conditions between forest and grassland habitats, showing observation counts for different sky conditions using a grouped bar chart  
@@ -0,0 +1,52 @@
+#Identify high-activity regions and seasons for specific bird species
+#Other Insights - High Activity Regions and Seasons
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import column_options, load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("📍 Seasonal Species Activity by Region")
+    st.markdown("Identify high-activity regions and seasons for specific bird species based on observation counts.")
+
+    #Observation counts per species / plot / season from the aggregate cube
+    pipeline, cube = load_page_source("Species Activity by Region and Season")
+
+    #Drop cells missing required data ('Season' is missing exactly when 'Date' is)
+    df = run_stage(pipeline.clean, cube)
+
+    #'Season' is derived from the month once at ingest (Winter: Dec-Feb, Spring: Mar-May, Summer: Jun-Aug, Fall: Sep-Nov)
+
+    #Optional: Let user select a species
+    species_list = column_options(df, 'Common_Name', dropna=False)
+    selected_species = st.selectbox("Select a Bird Species", species_list)
+
+    #Counts by species, plot (region), and season for the selected species
+    result = run_stage(pipeline.aggregate, cube, df, species=selected_species)
+
+    if result[0].empty:
+        st.warning("No observation data available for the selected species.")
+    else:
+        fig, = pipeline.figures(result)
+        show_chart(fig, use_container_width=True)
+
+#Commands Used
+#load_page_source()              – Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py)
+#run_stage(pipeline.clean, cube) – Observation counts per species, plot and season (cube.rollup(), missing values dropped)
+#column_options()                – Sorted species of the cleaned cells
+#st.selectbox()                  – Dropdown for species selection
+#run_stage(pipeline.aggregate)   – Counts by plot (region) and season for the selected species (cube.select())
+#pipeline.figures()              – Create grouped bar chart by region and season (px.bar())
+#show_chart()                    – Render the chart in Streamlit (st.plotly_chart())
+#st.warning()                    – Display warning if no data is available
+#st.header(), st.markdown()      – Display UI headers and description
+
+#Uncover the influence of environmental factors on species behavior and activity
+#Temperature Bin by Habitat
+#Humidity Bin by Habitat
+#Sky Conditions by Habitat
+#Wind Conditions
+#Seasonal Time Factor
+#Seasonal Observation Counts
+#Flyover Observed Species
@@ -0,0 +1,74 @@
+#Species Distribution Insights
+#Species Distribution - Distance & Flyover Trends Page
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("📍 Species Distribution - Distance & Flyover Trends")
+    st.markdown("Analyze how bird species are observed based on distance and number of flyovers.")
+
+    #Load the shared cleaned forest + grassland frame (parsed once per process by data_ingest)
+    #Column selection --> Keeps only the relevant columns for analysis: Distance, Initial_Three_Min_Cnt, and Common_Name.
+    pipeline, source = load_page_source("Species Distribution")
+
+    #Cleaning Step --> Placeholders ('NA', '-', etc.) are already missing values at ingest (schema.py): Distance is an ordered band code, Initial_Three_Min_Cnt a bool
+    #.dropna() --> Drops rows with missing values
+    #Convert bool to 0/1 --> .astype('int8') --> Initial_Three_Min_Cnt summed per species and distance
+    #Convert distance bands to numeric midpoints for visualization (schema.DISTANCE_MIDPOINTS indexed by band code)
+    df = run_stage(pipeline.clean, source)
+
+    #Check for empty values in 'Distance_Numeric' and 'Initial_Three_Min_Cnt'
+    st.write("Data Preview (Cleaned):")
+    st.write(df.head())  # Show the first few rows for inspection
+
+    #Group data to get counts per species per distance (REQUIRED for plotting)
+    #Filter top 10 species by total count (for readability)
+    result = run_stage(pipeline.aggregate, source, df)
+
+    #Check if the dataframe has valid data for plotting
+    if df['Distance_Numeric'].isnull().any() or df['Initial_Three_Min_Cnt'].isnull().any():
+        st.warning("There are missing values in the data that might affect plotting.")
+    else:
+        #Bar Chart – plotly.express.bar() -> Plots species count at each distance range; Useful for comparing how species differ across distance bands
+        #Strip Plot – plotly.express.strip() -> Shows distribution of species across the distance range
+        bar_fig, scatter_fig = pipeline.figures(result)
+
+        st.subheader("Bar Chart - Species Count by Distance")
+        show_chart(bar_fig, use_container_width=True)
+
+        st.subheader("Scatter Plot - Species Count by Distance")
+        show_chart(scatter_fig, use_container_width=True)
+
+#Header + Markdown -->	Shows the page title and a brief description
+#load_page_source() -->	Page pipeline and the combined forest + grassland observation frame (snapshot rows)
+#Column selection   -->  Keeps only the relevant columns for analysis: Distance, Initial_Three_Min_Cnt, and Common_Name.
+#Cleaning Step	   -->  Placeholders are missing values at ingest; distance bands become numeric midpoints
+#Drop NaNs	       -->  Removes unusable rows where Distance or Count are missing
+#Bar Chart – Shows total bird count per species at different distances
+#Scatter Plot – Reveals distribution of species sightings by distance
+#Bar Chart – plotly.express.bar() -> Plots species count at each distance range; Useful for comparing how species differ across distance bands
+#Strip Plot – plotly.express.strip() -> Shows distribution spread of species sightings by distance
+#show_chart()      -->  Displays interactive visualizations in Streamlit with full width (st.plotly_chart())
+#st.write(df.head())->  Displays a preview of the cleaned data
+#st.subheader(...) -->	Adds a subtitle above the chart
+#px.bar(...)	   --> Creates a bar chart using the cleaned dataset
+#x='Distance'	   --> Sets the X-axis as Distance
+#y='Initial_Three_Min_Cnt' -->Sets the Y-axis as the bird count
+#color='Common_Name'-->	Stacks or groups bars by bird species
+#labels={...}	    --> Renames labels in the chart for clarity
+#template='seaborn'	--> Gives the chart a clean and visually appealing style
+#show_chart(..., use_container_width=True)	--> Ensures chart uses full width of Streamlit app layout
+#run_stage(pipeline.clean) --> .dropna() drops rows with missing values, .astype('int8') turns the bool count into 0/1
+#run_stage(pipeline.aggregate) --> groupby().agg() per species and distance, top 10 species by total count (nlargest())
+
+#Short Note: # Explores how bird species are distributed across different distances and number of flyovers using visualizations for forest and grassland areas.
+
+# Insights:
+# - Detection range: Which birds are visible farther away?
+# - Density patterns: Are some species more vocal or more frequently flying over?
+# - Helps refine survey techniques and habitat-specific analysis.
+
+#Explanation: Visualizes bird species detection across distances to reveal observation patterns in forest and grassland areas.
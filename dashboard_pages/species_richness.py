@@ -0,0 +1,73 @@
+#Species Richness by Habitat
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+import richness_sketch             #Whether unique-species counts are estimated (HyperLogLog) and their error bound
+from dashboard_pages.common import column_options, load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("🌿 Species Richness by Habitat")
+    st.markdown("Filter by year and month to explore how species richness varies across habitat types.")
+
+    #Observation counts per habitat / species / year / month from the aggregate cube
+    pipeline, cube = load_page_source("Species Richness")
+    
+    #Drops cells missing key fields; 'Year' is missing exactly when 'Date' is missing or invalid
+    df = run_stage(pipeline.clean, cube)
+
+    #'Year' and 'Month' (used by the heatmap) are derived once at ingest
+
+    #Sidebar filters
+    years = column_options(df, 'Year')
+    months = column_options(df, 'Month')
+
+    selected_year = st.selectbox("Select Year", options=[None] + years, index=0)
+    selected_month = st.selectbox("Select Month", options=[None] + months, index=0)
+
+    #Apply filters, then richness calculation (unique species per habitat)
+    richness = run_stage(pipeline.aggregate, cube, df, year=selected_year, month=selected_month)
+
+    #Plot
+    if richness.empty:
+        st.warning("No data available for the selected filters.")
+    else:
+        fig, = pipeline.figures(richness)
+        show_chart(fig, use_container_width=True)
+        if richness_sketch.use_sketch(cube, ['Location_Type', 'Year', 'Month']):
+            st.caption(f"Species counts estimated from HyperLogLog sketches (±{richness_sketch.ERROR_BOUND:.1%} for 95 % of counts).")
+
+#Short Note: Explore and compare species richness in forest and grassland habitats by filtering bird observations by year and month, visualized through an interactive bar chart.
+
+#Data Loading & Preparation
+   #load_page_source(): Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py)
+   #run_stage(pipeline.clean, cube): Observation counts per habitat, species, year and month (cube.rollup())
+   #dropna(): Removes cells with missing values in critical columns (Common_Name, Location_Type, Year)
+   #Year and Month are derived from the Date column once at ingest; invalid dates have neither
+
+#Filters & Widgets
+  #column_options(): Sorted years and months of the cleaned cells
+  #st.selectbox(): Dropdown selectors for year and month
+
+#Species Richness Calculation
+  #run_stage(pipeline.aggregate): Number of unique bird species per habitat for the selected year and month
+  #richness_sketch.distinct_species(): Exact over the cube cells, or merged HyperLogLog sketches on large cubes
+  #.rename(...): Formats the result with a user-friendly column name
+  #richness_sketch.use_sketch() + st.caption(): Notes the error bound when the counts are estimated
+
+#Plotting
+  #pipeline.figures(): Creates a bar chart using Plotly Express to visualize species richness across habitat types
+  #show_chart(..., use_container_width=True): Renders the chart in the app, expanding to container width
+  #template='plotly_dark': Applies a dark-themed plot style
+  #st.warning(): Displays a warning message if the filtered dataset is empty
+
+#Processes
+#Data Input - Forest and grassland observation counts come from the snapshot's aggregate cube for unified analysis.
+#Cleaning and Preparation
+   #Removes cells missing key data (e.g., Common_Name, Year, Location_Type)
+   #Year and Month for filtering are derived from the Date column at ingest
+#Interactive Filtering
+   #Dropdowns allow users to filter the data by a specific year and month
+   #These filters dynamically update the dataset before calculating species richness
+#Species Richness Calculation - Uses groupby on Location_Type and counts the number of unique bird species (Common_Name) in each habitat
+#Visualization - Plotly bar chart is generated to show species richness by habitat; if no data matches the filters, a warning message is displayed instead of a chart
@@ -0,0 +1,40 @@
+#SQL Pages
+  #Each .sql file in sql_pages/ is one page: its query runs on the embedded SQL engine and the
+  #"-- chart / x / y / color" header lines choose the chart (see dashboard_pages.sql_pages)
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+import plotly.express as px        #Plotly for creating interactive visualizations
+from dashboard_pages.common import show_chart, load_query   #Shared page helpers
+
+
+#page -> header settings and SQL of one .sql file (dashboard_pages.sql_pages)
+def render(page):
+    st.header(page['title'])
+    if page['description']:
+        st.markdown(page['description'])
+
+    #Run the page's query (aggregation happens inside the database engine)
+    result = load_query(page['sql'])
+
+    if result.empty:
+        st.warning("The query returned no rows.")
+    else:
+        if page['chart'] in ('bar', 'line') and page['x'] and page['y']:
+            chart = px.bar if page['chart'] == 'bar' else px.line
+            fig = chart(
+                result,
+                x=page['x'],
+                y=page['y'],
+                color=page['color'],
+                title=page['title'],
+                template='plotly_dark'
+            )
+            show_chart(fig, use_container_width=True)
+        st.dataframe(result)
+
+#Commands Used
+#dashboard_pages.sql_pages() – Reads the SQL page files and their header settings
+#sql_engine.query()          – Runs the page's SQL on DuckDB (or SQLite) and returns a DataFrame
+#px.bar() / px.line()        – Chart chosen by the page's "-- chart:" line
+#st.dataframe()              – Shows the query result as a table
@@ -0,0 +1,72 @@
+#Temperature Bin by Habitat
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import column_options, load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("🌡️ Temperature Bin by Habitat")
+    st.markdown("Explore the distribution of temperature data across different habitat types.")
+
+    #Observation counts per habitat / temperature bin from the aggregate cube
+    pipeline, cube = load_page_source("Temperature Bin by Habitat")
+    
+    #Temperature bins (0-10°C, 10-20°C, ... 40-50°C) are assigned when the cube is built (aggregate_cube.TEMPERATURE_BINS);
+    #missing, non-numeric or out-of-range temperatures have no bin
+    df = run_stage(pipeline.clean, cube)  # Drop cells with missing temperature bin or location type
+    
+    #Sidebar filters
+    habitats = column_options(df, 'Location_Type')
+    selected_habitat = st.selectbox("Select Habitat", options=[None] + habitats, index=0)
+    
+    #Apply Habitat filter, then count the number of observations in each temperature bin by habitat
+    result = run_stage(pipeline.aggregate, cube, df, habitat=selected_habitat)
+    
+    #Plot
+    if result[0].empty:
+        st.warning("No data available for the selected habitat.")
+    else:
+        fig, = pipeline.figures(result)
+        show_chart(fig, use_container_width=True)
+
+#Commands        
+#Data Loading & Cleaning
+   #load_page_source(): Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py).
+   #run_stage(pipeline.clean, cube): Observation counts per habitat and temperature bin (cube.rollup()).
+   #dropna(): Removes cells missing the temperature bin or Location_Type.
+
+#Temperature Binning
+   #Assigned when the cube is built (aggregate_cube.TEMPERATURE_BINS); non-numeric or out-of-range temperatures have no bin:
+   #Bins: [0, 10, 20, 30, 40, 50]
+   #Labels: ['0-10°C', '10-20°C', '20-30°C', '30-40°C', '40-50°C']
+
+#Filters & Widgets
+   #column_options(): Sorted habitats of the cleaned cells
+   #st.selectbox(): Dropdown to select a habitat type
+
+#Aggregation & Plotting
+   #run_stage(pipeline.aggregate): cube.select() keeps the cells of the selected habitat,
+   #groupby([...])['Count'].sum(): Counts how many entries fall in each temperature bin for each habitat.
+   #pipeline.figures(): Builds a bar chart using Plotly Express to visualize the count distribution by temperature bin and habitat.
+   #show_chart(..., use_container_width=True): Displays the chart in the Streamlit app, expanding to full width.
+   #st.warning(): Shows a message if there's no data for the selected habitat.
+
+#Short Note: Temperature Bin by Habitat feature categorizes temperature observations into bins and visualizes the distribution of temperatures across different habitats, allowing users to compare temperature patterns by habitat type        
+
+#Key Notes
+#Load Data - Forest and Grassland observation counts come from the snapshot's aggregate cube (load_page_source())
+#Data Cleaning - Drop cells with missing data in the columns of interest (temperature bin and Location_Type) using dropna()
+#Temperature Conversion
+  #Temperature values are parsed as numbers at ingest; invalid values (non-numeric entries) become missing and get no bin
+#Temperature Binning
+  #Temperature is divided into bins when the cube is built. Temperature bins are defined as: [0, 10, 20, 30, 40, 50], representing temperature ranges (e.g., 0-10°C)
+  #labels array defines labels for these bins (e.g., '0-10°C', '10-20°C')
+#Filtering by Habitat - Sidebar filter allows the user to select a habitat (Forest or Grassland); if a habitat is selected, only its cube cells are selected (cube.select())
+#Group by Temperature Bin
+  #Data is grouped by both Location_Type (habitat) and Temperature_Bin to calculate the count of observations in each bin using groupby()['Count'].sum()
+  #Result is reset into a new DataFrame with a column Observation Count
+#Plotting
+  #Bar chart is created using plotly.express.bar(), with temperature bins on the x-axis and the observation count on the y-axis
+  #Color argument is used to differentiate the habitats visually and chart is displayed with show_chart()
+#Error Handling - If no data is available for the selected habitat or filters, a warning message is displayed using st.warning()
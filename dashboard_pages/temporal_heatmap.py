@@ -0,0 +1,81 @@
+#Temporal heatmaps for year-wise and month-wise observations
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import column_options, load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    #Page Header and Description
+    st.header("📊 Temporal Heatmaps - Year-wise and Month-wise Observations")
+    st.markdown("Visualize seasonal patterns of bird observations across years and months.")
+    #Displays the main heading and a brief introduction to the page’s purpose
+
+    #Per-species day / week / month / year count matrices of the snapshot (temporal_rollups.py)
+    pipeline, rollups = load_page_source("Temporal Heatmap")
+
+    #Clean and prepare the data
+    df = run_stage(pipeline.clean, rollups)
+    #Species / habitat pairs with dated observations (rows whose date is missing or invalid are not in the rollups)
+
+    #'Year' and 'Month' (used by the heatmap) are derived once at ingest
+
+    #Sidebar filters
+    species_list = column_options(df, 'Common_Name', dropna=False)
+    habitat_list = column_options(df, 'Location_Type', dropna=False)
+    #Creates alphabetically sorted lists - All species names and habitat types
+
+    with st.sidebar.expander("🔍 Filter Options"):
+        species_filter = st.multiselect("Select Species", options=species_list, default=species_list)
+        habitat_filter = st.multiselect("Select Habitat", options=habitat_list, default=habitat_list)
+    #Adds multi-select filters in the sidebar to allow users to narrow results by specific bird species and habitat types
+    #Defaults to selecting all values to show complete data
+
+    #🗓️ Year range slider (support single-year case)
+    # if df['Year'].nunique() > 1:
+    #     min_year, max_year = int(df['Year'].min()), int(df['Year'].max())
+    #     selected_years = st.sidebar.slider("Select Year Range", min_value=min_year, max_value=max_year, value=(min_year, max_year))
+    # else:
+    #     st.warning("Not enough year data to show a year range slider.")
+    #     selected_years = (df['Year'].min(), df['Year'].max())
+
+    # df = df[(df['Year'] >= selected_years[0]) & (df['Year'] <= selected_years[1])]
+
+    # 📅 Month slider (support single-month case)
+    # if df['Month'].nunique() > 1:
+    #     selected_months = st.sidebar.slider("Select Month Range", min_value=1, max_value=12, value=(1, 12))
+    # else:
+    #     st.warning("Not enough month data to show a month range slider.")
+    #     selected_months = (1, 12)
+
+    # df = df[(df['Month'] >= selected_months[0]) & (df['Month'] <= selected_months[1])]
+
+    #Apply species and habitat filter (rows / habitat slices of the count matrices)
+    #Sums the selected habitats' year and month matrices for the selected species
+    result = run_stage(pipeline.aggregate, rollups, df, species=species_filter, habitats=habitat_filter)
+    # Applies the selected filters from the sidebar to the full dataframe to get filtered_df for visualization
+
+    #📊 Year-wise Heatmap (categorical year axis: no decimals on x-axis)
+    #📊 Month-wise Heatmap (categorical month axis)
+    fig_year, monthly_heatmap = pipeline.figures(result)
+
+    st.subheader("Year-wise Observations Heatmap")
+    show_chart(fig_year, use_container_width=True)
+
+    st.subheader("Month-wise Observations Heatmap")
+    show_chart(monthly_heatmap, use_container_width=True)
+    #Creates and displays a similar heatmap for month-wise distribution
+
+#Commands
+#st.header("📊 Temporal Heatmaps...") - Adds a clear page title.
+#load_page_source(...) - Page pipeline and the snapshot's per-species count matrices (temporal_rollups.py).
+#run_stage(pipeline.clean, rollups) - Species / habitat pairs with dated observations (rollups.pairs()).
+#column_options(..., dropna=False) - Sorted species and habitats, a missing value offered last.
+#st.sidebar.expander(...) + st.multiselect(...) - Sidebar filters to select specific species and habitats.
+#pipeline.aggregate(..., species=..., habitats=...) - Picks the selected species' rows and habitats' slices of the rollup matrices.
+#rollups.counts('year') & rollups.month_of_year() - Species × year and species × month blocks of the count matrices.
+#go.Heatmap(z=...) - Creates heatmaps straight from the count matrices to show frequency of observations.
+#show_chart(...) - Renders the heatmaps in the Streamlit interface (st.plotly_chart()).
+
+#Visualizing bird observations across years and months using merged forest and grassland datasets.
+#Users - Easily explore temporal trends in bird observations and discover seasonal or long-term patterns effectively.
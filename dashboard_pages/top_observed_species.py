@@ -0,0 +1,70 @@
+#Top Observed Species
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import column_options, load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("🔝 Top Observed Species")
+    st.markdown("Discover the top 10 most frequently observed bird species based on selected year and month.")
+
+    #Observation counts per species / year / month from the aggregate cube
+    pipeline, cube = load_page_source("Top Observed Species")
+
+    #Drop duplicates → exact duplicate rows are left out of the cube's 'Distinct_Count' measure
+    #Drop cells with missing values in essential columns ('Year' is missing exactly when 'Date' is)
+    df = run_stage(pipeline.clean, cube)
+
+    #'Year' and 'Month' are derived from 'Date' once at ingest
+
+    #Sidebar filters
+    years = column_options(df, 'Year')
+    months = column_options(df, 'Month')
+
+    selected_year = st.selectbox("Select Year", options=[None] + years, index=0)
+    selected_month = st.selectbox("Select Month", options=[None] + months, index=0)
+
+    #Apply filters (None = all years / months)
+    #Group and count observations → top 10 species by distinct observations
+    species_counts = run_stage(pipeline.aggregate, cube, df, year=selected_year, month=selected_month)
+
+    if species_counts.empty:
+        st.warning("No species observations found for the selected filters.")
+    else:
+        fig, = pipeline.figures(species_counts)
+        show_chart(fig, use_container_width=True)
+
+#Header and Description: Displays a title and description about the analysis of bird species observations.
+
+#Loading Data: Observation counts for FOREST & GRASSLAND come from the snapshot's aggregate cube.
+
+#Data Cleaning:
+   #Exact duplicate rows are left out of the cube's 'Distinct_Count' measure.
+   #Drops cells with missing values in essential columns (such as Common_Name and Year; invalid dates have no year).
+
+#Date Extraction: The year and month are derived from the Date column once at ingest (Year and Month).
+
+#Sidebar Filters: Creates dropdown menus for selecting the year and month using st.selectbox. These values are dynamically populated from the available years and months in the data.
+
+#Filtering Data: Applies filters based on the selected year and month. If both are selected, it filters the data accordingly. If only one is selected, it filters by either year or month.
+
+#Grouping and Counting Observations: 
+   #Counts the number of observations for each species (Common_Name) over the selected cube cells.
+   #Retrieves the top 10 species without sorting every species (heavy_hitters.top_species()).
+
+#Visualization:
+  #If there are observations for the selected filters, it generates a bar chart using Plotly to visualize the top 10 species by their observation counts.
+  #If no data is found, it shows a warning message.
+
+#Commands:
+#load_page_source():Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py).
+#run_stage(pipeline.clean, cube):Observation counts per species, year and month (cube.rollup()), Distinct_Count > 0.
+#df.dropna():Drops cells with missing values in specified columns.
+#column_options():Sorted years and months of the cleaned cells.
+#st.selectbox():Creates a dropdown menu in Streamlit for selecting options.
+#run_stage(pipeline.aggregate):Top 10 species by distinct observations (heavy_hitters.top_species()).
+#pipeline.figures():Creates a bar chart using Plotly.
+#show_chart():Renders the chart (st.plotly_chart()).
+
+#Short Note: This code filters and visualizes the top 10 most frequently observed bird species from forest and grassland ecosystems based on selected year and month using Streamlit, pandas, and Plotly        
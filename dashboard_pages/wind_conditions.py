@@ -0,0 +1,50 @@
+#Wind Conditions by Habitat
+
+#Import required libraries
+import streamlit as st             #Streamlit library for building the web app
+from dashboard_pages.common import load_page_source, run_stage, show_chart   #Shared page helpers
+
+
+def render():
+    st.header("🍃 Wind Conditions by Habitat")
+    st.markdown("Compare wind conditions across forest and grassland habitats based on field observations.")
+
+    #Observation counts per habitat / wind description from the aggregate cube
+    pipeline, cube = load_page_source("Wind Conditions")
+
+    #Drop cells with missing values in key columns, standardize Wind values and map the descriptive
+    #values to simplified categories (page_pipelines.WIND_MAPPING); unrecognized descriptions are dropped
+    df = run_stage(pipeline.clean, cube)
+
+    #Group by habitat and wind category
+    wind_counts = run_stage(pipeline.aggregate, cube, df)
+
+    #Plot
+    if wind_counts.empty:
+        st.warning("No valid wind condition data available.")
+    else:
+        fig, = pipeline.figures(wind_counts)
+        show_chart(fig, use_container_width=True)
+
+#'Wind' Column   - Uses actual column name confirmed from both datasets.
+#String Clean-up- Converts wind values to lowercase and trims spaces.
+#Valid Filters  - Optional filter to include common wind descriptions.
+#Grouped Bar Plot- Shows how wind types differ by habitat.
+
+#Short Note: This code compares wind conditions (e.g., High, Medium, Low) across forest and grassland habitats, visualizing the observation counts for each wind condition using a grouped bar chart
+
+#Commands:
+
+#load_page_source(): Page pipeline and the snapshot's aggregate cube (shared result cache, see common.py).
+#run_stage(pipeline.clean, cube): Observation counts per habitat and wind description (cube.rollup()).
+#df.dropna(): Drops cells with missing values in specified columns.
+#str.strip().str.lower(): Converts text to lowercase for standardization.
+#map(WIND_MAPPING): Maps descriptive wind values to simplified categories; unrecognized ones are dropped.
+#run_stage(pipeline.aggregate): groupby()['Count'].sum() by habitat and wind category.
+#pipeline.figures(): Creates a grouped bar chart using Plotly.
+#show_chart(): Renders the chart (st.plotly_chart()).
+
+#Explanation:
+#This code takes bird observation counts for both forest and grassland habitats from the aggregate cube and drops cells without a Wind value. 
+#It standardizes the Wind values (e.g., "High", "Medium", "Low"), filters out invalid conditions, and counts observations by habitat and wind condition. 
+#The results are visualized using a grouped bar chart to compare wind conditions across habitats.
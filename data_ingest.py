@@ -0,0 +1,343 @@
+#Shared Ingest Layer
+  #Parses each bird monitoring workbook once per process and hands every dashboard page the same cleaned frame.
+  #Why? → Every page used to re-read both Excel files on each Streamlit rerun, costing seconds per widget click.
+
+#Invalidation
+  #A workbook is re-parsed only when its file changes on disk.
+  #mtime is checked first (cheap); if it moved, the content hash decides whether the bytes really changed.
+
+#Appending New Survey Workbooks
+  #New season workbooks are registered (register_workbook / `python data_ingest.py register forest FILE.XLSX`)
+  #instead of replacing the two base workbooks. Only the new workbook is parsed; its rows are deduplicated
+  #against the data already loaded on the 'observation' key set (Common_Name, Date, Plot_Name; see dedup.py) and appended to the cached snapshot,
+  #and derived structures such as the aggregate cube are updated with just the new rows.
+
+#Import required libraries
+import argparse                    #Command line for registering new workbooks
+import hashlib                     #Content hash of each workbook for cache invalidation
+import json                        #Registry of appended workbooks
+import os                          #File paths, environment overrides and modification times
+import threading                   #Guards the process-wide cache against concurrent Streamlit sessions
+
+import numpy as np                 #NumPy ecosystem codes of the combined frame
+import pandas as pd                #Pandas to read and manipulate the observation data
+import dedup                       #Hashed key indexes (duplicate detection and counts per key set)
+import schema                      #Typed columns applied once at ingest
+import snapshot_cache              #Typed Parquet snapshots of each workbook sheet
+import arrow_store                 #Memory-mapped Arrow store shared by every worker process (BIRD_STORAGE=arrow)
+
+#Dataset Path - Excel
+#Override with the BIRD_FOREST_XLSX / BIRD_GRASSLAND_XLSX environment variables on other machines
+FOREST_PATH = os.environ.get(
+    "BIRD_FOREST_XLSX",
+    r"C:\Users\Bala Sowntharya\Documents\Project 2 - Bird Species Observation Analysis in Forest and Grassland Ecosystem\data_raw_excel files\Bird_Monitoring_Data_FOREST.XLSX"
+)
+GRASSLAND_PATH = os.environ.get(
+    "BIRD_GRASSLAND_XLSX",
+    r"C:\Users\Bala Sowntharya\Documents\Project 2 - Bird Species Observation Analysis in Forest and Grassland Ecosystem\data_raw_excel files\Bird_Monitoring_Data_GRASSLAND.XLSX"
+)
+
+#Registry of workbooks appended after the two base workbooks (override with BIRD_WORKBOOK_REGISTRY)
+REGISTRY_PATH = os.environ.get(
+    "BIRD_WORKBOOK_REGISTRY",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "workbooks.json")
+)
+
+HABITATS = ['forest', 'grassland']
+ECOSYSTEMS = ['Forest', 'Grassland']   #Display names of the habitats, in the same order
+
+#Key set identifying one observation when appending workbooks (see dedup.KEY_SETS)
+DEDUP_KEY_SET = 'observation'
+
+_HASH_BLOCK_SIZE = 1 << 20         #Read workbooks in 1 MB blocks while hashing
+
+_workbook_cache = {}               #absolute path -> (mtime_ns, sha256, parsed DataFrame)
+_digest_cache = {}                 #absolute path -> (mtime_ns, sha256)
+_snapshot_cache = {}               #((forest sha256, grassland sha256), ((habitat, sha256), ...)) -> ObservationSnapshot
+_cache_lock = threading.RLock()
+
+
+#Cached Snapshot of the Cleaned Observations
+class ObservationSnapshot:
+    #forest / grassland -> cleaned per-habitat frames, all admin-unit sheets (used by pages that compare the two files)
+    #frame              -> combined forest + grassland frame shared by every page
+    #token              -> identifies this version of the data; changes whenever a workbook changes
+    #derived(name, ...) -> structures computed from this data (aggregate cube, ...), built once and dropped with it
+    #append(...)        -> new snapshot with the rows of an appended workbook
+    def __init__(self, forest, grassland, token):
+        #One dictionary per category column shared by both habitats, so the combined frame stays categorical
+        dtypes = schema.shared_categories([forest, grassland])
+        self.forest = schema.apply_categories(forest.copy(deep=False), dtypes)
+        self.grassland = schema.apply_categories(grassland.copy(deep=False), dtypes)
+        self.frame = pd.concat([self.forest, self.grassland], ignore_index=True)
+        self.token = token
+        self._derived = {}
+        self._updates = {}
+        self._derived_lock = threading.RLock()
+
+    #Snapshot over an already combined frame (forest rows first), e.g. mapped from the shared Arrow store
+      #forest / grassland are row slices of the frame, so nothing is copied
+    @classmethod
+    def from_frame(cls, frame, forest_rows, token):
+        snapshot = cls.__new__(cls)
+        snapshot.frame = frame
+        snapshot.forest = frame.iloc[:forest_rows]
+        snapshot.grassland = frame.iloc[forest_rows:].reset_index(drop=True)
+        snapshot.token = token
+        snapshot._derived = {}
+        snapshot._updates = {}
+        snapshot._derived_lock = threading.RLock()
+        return snapshot
+
+    #Returns the structure stored under name, calling build(snapshot) the first time it is asked for
+      #update(value, new snapshot, appended rows, habitat) carries the structure over to appended snapshots;
+      #structures without one are rebuilt on first use after an append
+    def derived(self, name, build, update=None):
+        with self._derived_lock:
+            if name not in self._derived:
+                self._derived[name] = build(self)
+                if update is not None:
+                    self._updates[name] = update
+            return self._derived[name]
+
+    #Position in ECOSYSTEMS of each row's source workbook (frame holds forest rows, then grassland rows)
+    def ecosystem_codes(self):
+        return np.repeat(np.arange(len(ECOSYSTEMS), dtype=np.int8), [len(self.forest), len(self.grassland)])
+
+    #Distinct keys of a key set (dedup.KEY_SETS name) with the rows seen for each, built once per key set
+      #and carried over to appended snapshots with only the appended rows hashed
+    def key_index(self, keys=DEDUP_KEY_SET):
+        return self.derived(
+            f'key_index:{keys}',
+            lambda snapshot: dedup.build_index(snapshot.frame, keys),
+            lambda index, snapshot, rows, habitat: index.add(rows)[1]
+        )
+
+    #Returns a new snapshot with the rows of an appended workbook of the given habitat
+      #Rows whose key is already loaded (or repeated within the workbook) are dropped
+    def append(self, habitat, rows, digest):
+        keep, _ = self.key_index(DEDUP_KEY_SET).add(rows)
+        rows = rows[keep].reset_index(drop=True)
+
+        forest, grassland = self.forest, self.grassland
+        if habitat == 'forest':
+            forest = schema.concat_categorical([forest.copy(deep=False), rows])
+        else:
+            grassland = schema.concat_categorical([grassland.copy(deep=False), rows])
+        token = hashlib.sha256(f"{self.token}|{habitat}|{digest}".encode()).hexdigest()[:16]
+        snapshot = ObservationSnapshot(forest, grassland, token)
+
+        #Appended rows with the new snapshot's dictionaries, for the incremental updates
+        dtypes = {col: snapshot.frame[col].dtype for col in rows.columns if isinstance(snapshot.frame[col].dtype, pd.CategoricalDtype)}
+        rows = schema.apply_categories(rows, dtypes)
+        with self._derived_lock:
+            for name, update in self._updates.items():
+                snapshot._derived[name] = update(self._derived[name], snapshot, rows, habitat)
+                snapshot._updates[name] = update
+        return snapshot
+
+
+#Content hash of a file, read block by block so large workbooks are never fully in memory
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+#Content hashes of several workbooks (a workbook is hashed again only when its mtime moved)
+def workbook_digests(paths):
+    digests = []
+    for path in paths:
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        cached = _digest_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, file_sha256(path))
+            _digest_cache[path] = cached
+        digests.append(cached[1])
+    return digests
+
+
+#Returns [(cleaned frame, content hash)] for several workbooks, re-reading only the ones that changed
+  #Every sheet of every changed workbook is loaded in one batch so the sheets parse in parallel
+def read_workbooks(paths):
+    paths = [os.path.abspath(path) for path in paths]
+
+    with _cache_lock:
+        stale = {}
+        for path in paths:
+            mtime = os.stat(path).st_mtime_ns
+            cached = _workbook_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                continue
+
+            #mtime moved → confirm with the content hash before reading the workbook again
+            digest = workbook_digests([path])[0]
+            if cached is not None and cached[1] == digest:
+                _workbook_cache[path] = (mtime, digest, cached[2])
+                continue
+            stale[path] = (mtime, digest)
+
+        if stale:
+            #Parquet snapshots when they match the hash, otherwise a parallel XLSX parse that rebuilds them
+            loaded = snapshot_cache.load_workbooks({path: digest for path, (_, digest) in stale.items()})
+            for path, (mtime, digest) in stale.items():
+                frame = clean_observations(combine_sheets(loaded[path]))
+                _workbook_cache[path] = (mtime, digest, frame)
+
+        return [(_workbook_cache[path][2], _workbook_cache[path][1]) for path in paths]
+
+
+#Returns (cleaned frame, content hash) for one workbook
+def read_workbook(path):
+    return read_workbooks([path])[0]
+
+
+#Combines the admin-unit sheets of a workbook into one frame
+  #Each sheet holds one admin unit (ANTI, CATO, ...); rows without an Admin_Unit_Code take the sheet name
+  #Text columns are dictionary-encoded with one dictionary across all sheets (see schema.CATEGORY_COLUMNS)
+def combine_sheets(sheets):
+    frames = []
+    for name, frame in sheets.items():
+        if "Admin_Unit_Code" in frame.columns:
+            frame["Admin_Unit_Code"] = frame["Admin_Unit_Code"].fillna(name)
+        else:
+            frame.insert(0, "Admin_Unit_Code", name)
+        frames.append(frame)
+    return schema.concat_categorical(frames)
+
+
+#Cleaning shared by every page
+  #Strips column names, applies the schema dtypes and derives Year/Month/Season/Hour once;
+  #page-specific filters (dropna on page columns) stay in the pages
+def clean_observations(df):
+    df.columns = df.columns.str.strip()
+    return schema.add_time_columns(schema.apply_base_dtypes(df))
+
+
+#Registered workbooks as [(habitat, absolute path)] in registration order
+def registered_workbooks():
+    try:
+        with open(REGISTRY_PATH, encoding="utf-8") as handle:
+            return [(entry["habitat"], entry["path"]) for entry in json.load(handle)]
+    except FileNotFoundError:
+        return []
+
+
+#Adds a workbook to the registry (append-only) and returns the updated snapshot
+def register_workbook(path, habitat):
+    if habitat not in HABITATS:
+        raise ValueError(f"Unknown habitat '{habitat}' (expected one of: {', '.join(HABITATS)})")
+    path = os.path.abspath(path)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+
+    with _cache_lock:
+        entries = registered_workbooks()
+        if path not in [entry_path for _, entry_path in entries]:
+            entries.append((habitat, path))
+            temp_path = REGISTRY_PATH + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump([{"habitat": h, "path": p} for h, p in entries], handle, indent=2)
+            os.replace(temp_path, REGISTRY_PATH)   #Atomic, so a Streamlit server never reads half a registry
+        return load_snapshot()
+
+
+#Returns the ObservationSnapshot for the two base workbooks plus every registered workbook
+  #Only changed workbooks are re-read; when the only change is newly registered workbooks,
+  #their rows are appended to the cached snapshot instead of rebuilding it
+  #With BIRD_STORAGE=arrow, a snapshot already written by any process is memory-mapped instead (see arrow_store.py)
+def load_snapshot(forest_path=FOREST_PATH, grassland_path=GRASSLAND_PATH):
+    with _cache_lock:
+        appended = registered_workbooks()
+        paths = [forest_path, grassland_path] + [path for _, path in appended]
+
+        #Shared Arrow store: only the workbooks' hashes are needed to find it, nothing is parsed
+        if arrow_store.ENABLED:
+            digests = workbook_digests(paths)
+            key = (tuple(digests[:2]), tuple((habitat, digest) for (habitat, _), digest in zip(appended, digests[2:])))
+            snapshot = _snapshot_cache.get(key)
+            if snapshot is not None:
+                return snapshot
+            stored = arrow_store.read_store(key)
+            if stored is not None:
+                snapshot = ObservationSnapshot.from_frame(*stored)
+                _snapshot_cache.clear()
+                _snapshot_cache[key] = snapshot
+                return snapshot
+
+        loaded = read_workbooks(paths)
+        (forest, forest_digest), (grassland, grassland_digest) = loaded[:2]
+
+        base_key = (forest_digest, grassland_digest)
+        appended_key = tuple((habitat, digest) for (habitat, _), (_, digest) in zip(appended, loaded[2:]))
+        key = (base_key, appended_key)
+        snapshot = _snapshot_cache.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        #Start from a cached snapshot of the same base workbooks holding a prefix of the appended ones
+        snapshot, done = None, 0
+        for (cached_base, cached_appended), cached in _snapshot_cache.items():
+            if cached_base == base_key and appended_key[:len(cached_appended)] == cached_appended:
+                snapshot, done = cached, len(cached_appended)
+        if snapshot is None:
+            token = hashlib.sha256("|".join(base_key).encode()).hexdigest()[:16]
+            snapshot = ObservationSnapshot(forest, grassland, token)
+
+        for (habitat, digest), (rows, _) in zip(appended_key[done:], loaded[2 + done:]):
+            snapshot = snapshot.append(habitat, rows.copy(deep=False), digest)
+
+        #Written once for every other worker; this process keeps its parsed frame (and any derived structures)
+        if arrow_store.ENABLED:
+            arrow_store.write_store(key, snapshot.frame, len(snapshot.forest), snapshot.token)
+
+        _snapshot_cache.clear()            #Only the latest version of the data is kept in memory
+        _snapshot_cache[key] = snapshot
+        return snapshot
+
+
+#Utility Function to Load and Clean Data
+  #Combined forest + grassland frame with stripped column names and schema dtypes
+def load_and_clean_data(forest_path=FOREST_PATH, grassland_path=GRASSLAND_PATH):
+    return load_snapshot(forest_path, grassland_path).frame
+
+
+#Drops every cached workbook and snapshot (e.g. after replacing files in place with an identical mtime)
+def clear_cache():
+    with _cache_lock:
+        _workbook_cache.clear()
+        _digest_cache.clear()
+        _snapshot_cache.clear()
+
+#Command line: python data_ingest.py register forest|grassland FILE.XLSX  /  python data_ingest.py list
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Register new bird monitoring workbooks for append-only ingest")
+    commands = parser.add_subparsers(dest="command", required=True)
+    register = commands.add_parser("register", help="append a workbook to the registry and ingest its rows")
+    register.add_argument("habitat", choices=HABITATS)
+    register.add_argument("path")
+    commands.add_parser("list", help="show the registered workbooks")
+    args = parser.parse_args(argv)
+
+    if args.command == "register":
+        snapshot = register_workbook(args.path, args.habitat)
+        print(f"Registered {args.path} ({args.habitat}); {len(snapshot.frame)} observations loaded")
+    else:
+        for habitat, path in registered_workbooks():
+            print(f"{habitat:10s} {path}")
+
+
+if __name__ == "__main__":
+    main()
+
+#Commands Used
+#os.stat().st_mtime_ns  – Cheap change check before hashing
+#hashlib.sha256()       – Content hash; identical bytes reuse the parsed frame even if mtime moved
+#threading.RLock()      – One parse per workbook even when several sessions rerun at once
+#combine_sheets()       – Stacks every admin-unit sheet (not just the first) into one frame
+#snapshot_cache         – Reads the typed Parquet snapshot, parsing the XLSX only on first use or after a change
+#KeyIndex.add()         – Drops appended rows whose (Common_Name, Date, Plot_Name) key is already loaded
+#arrow_store.read_store() – Maps the snapshot another worker already wrote (BIRD_STORAGE=arrow)
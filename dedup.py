@@ -0,0 +1,181 @@
+#Hash-Based Deduplication
+  #One deduplication stage for the observations: every row's key (a set of columns) is reduced to a 64-bit hash
+  #with vectorized row hashing, and a KeyIndex keeps the sorted distinct hashes with how often each was seen.
+  #Why? → Pages used to call drop_duplicates() on every rerun, with different key columns on each page and in the notebook;
+  #the keys are now hashed once at ingest and the same index answers "seen before?" and "how many copies?".
+
+#Key sets (KEY_SETS, extend with BIRD_DEDUP_KEYS='{"name": ["Col", ...]}')
+  #exact       → every column (exact duplicate rows; the aggregate cube's Distinct_Count measure)
+  #observation → Common_Name, Date, Plot_Name (one species per plot and day; appended workbooks are deduplicated on it)
+  #visit       → Date, Observer, Plot_Name (one survey visit, as deduplicated in the notebook)
+
+#Chunked and incremental
+  #KeyIndex.add(chunk) returns which rows of the chunk are first occurrences and a new index that includes them,
+  #so a file larger than memory is deduplicated chunk by chunk (only the hashes stay in memory, 12 bytes per key)
+  #and appended workbooks are checked against the keys already loaded without touching the loaded rows.
+
+#Usage
+  #python dedup.py                                     → duplicate report of the loaded workbooks
+  #python dedup.py --file survey_export.csv --keys visit --top 10
+
+#Import required libraries
+import argparse                    #Command line for duplicate reports
+import json                        #Extra key sets from the environment
+import os                          #BIRD_DEDUP_KEYS override
+
+import numpy as np                 #Sorted hash arrays, searchsorted lookups and counts
+import pandas as pd                #Vectorized row hashing (hash_pandas_object)
+
+#Key sets by name (None = every column)
+KEY_SETS = {
+    'exact': None,
+    'observation': ['Common_Name', 'Date', 'Plot_Name'],
+    'visit': ['Date', 'Observer', 'Plot_Name']
+}
+KEY_SETS.update(json.loads(os.environ.get("BIRD_DEDUP_KEYS", "{}")))
+
+
+#Columns of a key set: a name from KEY_SETS or a list of columns
+def key_columns(keys):
+    return KEY_SETS[keys] if isinstance(keys, str) else keys
+
+
+#64-bit hash of every row's key (missing key columns hash as missing values)
+  #Category columns hash by value, so frames with different dictionaries give the same hashes
+def row_hashes(frame, keys=None):
+    columns = key_columns(keys)
+    keys = frame.reindex(columns=columns) if columns is not None else frame.copy(deep=False)
+    for col in keys.columns:
+        if isinstance(keys[col].dtype, np.dtype) and keys[col].dtype.kind == 'M':
+            keys[col] = keys[col].astype('datetime64[ns]')   #Same unit whether parsed or read from Parquet
+    if columns is not None and 'Date' in columns and not pd.api.types.is_datetime64_any_dtype(keys['Date']):
+        keys['Date'] = pd.to_datetime(keys['Date']).astype('datetime64[ns]')
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+
+#True for the first row of every hash in the array (later copies → False)
+def first_occurrences(hashes):
+    return ~pd.Series(hashes).duplicated().to_numpy()
+
+
+#Distinct Keys of One Key Set with Their Counts
+class KeyIndex:
+    #keys   -> key set name (KEY_SETS) or list of columns
+    #hashes -> sorted distinct key hashes
+    #counts -> rows seen for each hash (same order)
+    def __init__(self, keys, hashes=None, counts=None):
+        self.keys = keys
+        self.hashes = np.empty(0, dtype=np.uint64) if hashes is None else hashes
+        self.counts = np.empty(0, dtype=np.uint32) if counts is None else counts
+
+    #Position of each hash in the index (-1 when not in it)
+    def positions(self, hashes):
+        positions = np.searchsorted(self.hashes, hashes)
+        found = positions < len(self.hashes)
+        found[found] = self.hashes[positions[found]] == hashes[found]
+        return np.where(found, positions, -1)
+
+    #True for rows whose key is already in the index
+    def contains(self, frame):
+        return self.positions(row_hashes(frame, self.keys)) >= 0
+
+    #(first-occurrence mask of the chunk, new index including every row of the chunk)
+      #First occurrence = key not in the index and not repeated earlier in the chunk; the index itself is not modified
+    def add(self, frame):
+        hashes = row_hashes(frame, self.keys)
+        first = (self.positions(hashes) < 0) & first_occurrences(hashes)
+        new_hashes, new_counts = np.unique(hashes, return_counts=True)
+        hashes = np.concatenate([self.hashes, new_hashes])
+        counts = np.concatenate([self.counts, new_counts.astype(np.uint32)])
+        merged, inverse = np.unique(hashes, return_inverse=True)
+        return first, KeyIndex(self.keys, merged, np.bincount(inverse, weights=counts).astype(np.uint32))
+
+    #Rows seen for each row's key (1 = unique)
+    def occurrences(self, frame):
+        positions = self.positions(row_hashes(frame, self.keys))
+        return np.where(positions >= 0, self.counts[np.maximum(positions, 0)], 0)
+
+    #Rows, distinct keys and duplicates seen by the index
+    def summary(self):
+        rows = int(self.counts.sum())
+        return {
+            'rows': rows,
+            'keys': len(self.hashes),
+            'duplicate_rows': rows - len(self.hashes),
+            'duplicated_keys': int((self.counts > 1).sum()),
+            'max_copies': int(self.counts.max()) if len(self.counts) else 0
+        }
+
+
+#Index of every row of a frame
+def build_index(frame, keys):
+    return KeyIndex(keys).add(frame)[1]
+
+
+#First occurrence of every key across chunks (stream of frames); returns the final index once the stream ends
+  #yields (deduplicated chunk, index so far)
+def dedup_chunks(chunks, keys):
+    index = KeyIndex(keys)
+    for chunk in chunks:
+        first, index = index.add(chunk)
+        yield chunk[first].reset_index(drop=True), index
+
+
+#Key values of the keys that occur more than once in the frame, with the number of copies the index has seen
+def duplicate_keys(frame, index, top=None):
+    copies = index.occurrences(frame)
+    columns = key_columns(index.keys) or list(frame.columns)
+    keys = frame.loc[copies > 1, columns].assign(Copies=copies[copies > 1])
+    keys = keys[first_occurrences(row_hashes(keys, columns))]
+    keys = keys.sort_values('Copies', ascending=False, kind='stable')
+    return (keys.head(top) if top else keys).reset_index(drop=True)
+
+
+#Summary table of several indexes (one row per key set)
+def report(indexes):
+    return pd.DataFrame([dict(key_set=name, **index.summary()) for name, index in indexes.items()])
+
+
+#Command line: duplicate report of the loaded observations, or of a workbook / CSV export read chunk by chunk
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count duplicate observations per key set")
+    parser.add_argument("--file", help="workbook or CSV export to scan chunk by chunk (default: the loaded workbooks)")
+    parser.add_argument("--keys", nargs="+", default=list(KEY_SETS), choices=list(KEY_SETS), help="key sets to report")
+    parser.add_argument("--top", type=int, default=0, help="also list the N most duplicated keys of each key set")
+    args = parser.parse_args(argv)
+
+    if args.file:
+        import stream_reader
+        indexes = {name: KeyIndex(name) for name in args.keys}
+        for chunk in stream_reader.read_chunks(args.file):
+            for name in args.keys:
+                indexes[name] = indexes[name].add(chunk)[1]
+    else:
+        import data_ingest
+        snapshot = data_ingest.load_snapshot()
+        indexes = {name: snapshot.key_index(name) for name in args.keys}
+
+    with pd.option_context("display.width", 200, "display.max_columns", 20):
+        print(report(indexes).to_string(index=False))
+        if args.top:
+            for name in args.keys:
+                if args.file:
+                    frames = (duplicate_keys(chunk, indexes[name]) for chunk in stream_reader.read_chunks(args.file))
+                    duplicates = pd.concat(frames, ignore_index=True)
+                    duplicates = duplicates[first_occurrences(row_hashes(duplicates, key_columns(name)))]
+                    duplicates = duplicates.sort_values('Copies', ascending=False, kind='stable').head(args.top)
+                else:
+                    duplicates = duplicate_keys(snapshot.frame, indexes[name], args.top)
+                print(f"\nMost duplicated keys – {name}")
+                print(duplicates.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
+
+#Commands Used
+#pd.util.hash_pandas_object(index=False) – Vectorized 64-bit hash of each row's key columns
+#np.searchsorted()                       – Looks hashes up in the sorted distinct-key array
+#np.unique(return_counts / return_inverse) + np.bincount() – Merges a chunk's key counts into the index
+#Series.duplicated()                     – First occurrence of each hash inside a chunk
+#KeyIndex.add()                          – Chunk-wise / incremental dedup without re-reading earlier rows
@@ -0,0 +1,137 @@
+#Page Stage Diagnostics
+  #Opt-in timers and tracemalloc measurements around every stage of a page: snapshot (workbook parsing / Parquet read),
+  #load, clean, aggregate, figures, render (st.plotly_chart) and SQL queries.
+  #Why? → When a page is slow, shows whether the time goes to Excel parsing, cleaning, groupby or Plotly serialization.
+
+#Where the measurements go
+  #Sidebar panel → the stages of the current run (visualization.py, "🩺 Diagnostics" checkbox)
+  #Log file      → one JSON line per stage in a rotating log (BIRD_DIAGNOSTICS_LOG, default logs/diagnostics.log),
+  #                5 files of 1 MB kept, so regressions in production can be compared over days
+
+#Switching it on
+  #Off by default; tick "🩺 Diagnostics" in the sidebar, or set BIRD_DIAGNOSTICS=1 to have it ticked for every session.
+  #Memory is measured with tracemalloc (Python and NumPy allocations), started the first time a stage is traced;
+  #it slows allocations down for the rest of the process, so keep it for investigations.
+  #tracemalloc's peak is process-wide: stages of several sessions running at the same moment share it.
+
+#Import required libraries
+import json                        #One JSON line per stage in the log
+import logging                     #Rotating log file
+import logging.handlers            #RotatingFileHandler
+import os                          #Log path and BIRD_DIAGNOSTICS switch
+import threading                   #Sets the log handler up once per process
+import time                        #Wall-clock timing
+import tracemalloc                 #Python / NumPy memory allocated by each stage
+from datetime import datetime      #Timestamp of each record
+
+#Stages ticked on for every session (override per session with the sidebar checkbox)
+ENABLED = os.environ.get("BIRD_DIAGNOSTICS", "").strip().lower() in ("1", "true", "yes", "on")
+
+#Rotating log file (override with the BIRD_DIAGNOSTICS_LOG environment variable)
+LOG_PATH = os.environ.get(
+    "BIRD_DIAGNOSTICS_LOG",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs", "diagnostics.log")
+)
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUP_COUNT = 5
+
+#Session state key holding the StageTrace of the current run (read by the page helpers)
+SESSION_KEY = "stage_trace"
+
+_logger = logging.getLogger("bird_dashboard.diagnostics")
+_logger_lock = threading.Lock()
+
+
+#Logger writing to the rotating log file (handler added once per process; None when the file cannot be opened)
+def stage_logger(path=LOG_PATH):
+    with _logger_lock:
+        if not _logger.handlers:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+                )
+            except OSError:
+                return None
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            _logger.addHandler(handler)
+            _logger.setLevel(logging.INFO)
+            _logger.propagate = False
+        return _logger
+
+
+#Stage Measurements of One Page Run
+class StageTrace:
+    #page    -> page being rendered (sidebar title)
+    #enabled -> False makes measure() a plain call (no timing, no tracemalloc)
+    #records -> one dict per measured stage, in the order they ran
+    def __init__(self, page, enabled=ENABLED):
+        self.page = page
+        self.enabled = enabled
+        self.records = []
+
+    #Runs fn(*args, **kwargs) and records its wall time and the memory it allocated
+      #alloc_peak_kb → highest traced memory above the level at the start of the stage
+      #alloc_net_kb  → traced memory still held when the stage ended (results, caches)
+    def measure(self, stage, fn, *args, **kwargs):
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        error = None
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            wall = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            self.record(stage, wall, peak - before, current - before, error)
+
+    #Adds one record and writes it to the log
+    def record(self, stage, wall, alloc_peak, alloc_net, error=None):
+        record = {
+            'time': datetime.now().isoformat(timespec='milliseconds'),
+            'page': self.page,
+            'stage': stage,
+            'wall_ms': round(wall * 1000, 2),
+            'alloc_peak_kb': round(max(alloc_peak, 0) / 1024, 1),
+            'alloc_net_kb': round(alloc_net / 1024, 1),
+            'error': error
+        }
+        self.records.append(record)
+        logger = stage_logger()
+        if logger is not None:
+            logger.info(json.dumps(record))
+        return record
+
+    #PagePipeline whose load / clean / aggregate / figures stages are measured (unchanged when disabled)
+    def instrument(self, pipeline):
+        if not self.enabled:
+            return pipeline
+        import page_pipelines          #Imported here so the Home page does not load pandas / Plotly
+        def timed(stage, fn):
+            return lambda *args, **kwargs: self.measure(stage, fn, *args, **kwargs)
+        return page_pipelines.PagePipeline(
+            pipeline.title,
+            timed('load', pipeline.load),
+            timed('clean', pipeline.clean),
+            timed('aggregate', pipeline.aggregate),
+            timed('figures', pipeline.figures),
+            pipeline.defaults
+        )
+
+    #Total wall time (ms) of the measured stages
+    def total_ms(self):
+        return round(sum(record['wall_ms'] for record in self.records), 2)
+
+#Commands Used
+#time.perf_counter()                   – Wall time of each stage
+#tracemalloc.reset_peak()              – Starts a fresh peak for the stage
+#tracemalloc.get_traced_memory()       – (current, peak) bytes allocated by Python and NumPy
+#logging.handlers.RotatingFileHandler  – Log file capped at LOG_MAX_BYTES, LOG_BACKUP_COUNT old files kept
+#json.dumps(record)                    – One machine-readable line per stage
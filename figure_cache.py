@@ -0,0 +1,72 @@
+#Page Figure Cache
+  #Memoizes the aggregate result and the Plotly figures of a page view, keyed on
+  #(data snapshot token, page title, normalized filter values).
+  #Why? → Switching back and forth between Year / Month / Habitat selections rebuilt the same figures every time;
+  #a repeated view now skips both the aggregation and the figure construction.
+
+#Sharing and eviction
+  #Results and figures are stored in the process-wide result cache (result_cache.py), so every Streamlit session
+  #on the server shares them; its byte budget (BIRD_RESULT_CACHE_MB), LRU order and TTL decide what stays.
+  #A new snapshot token means new keys; old ones age out.
+
+#How pages use it
+  #cached_pipeline(pipeline, token) returns the page's PagePipeline with memoized clean and aggregate stages;
+  #its figures stage returns the figures stored with a cached result (built on the first call).
+  #Cleaned frames, results and figures are shared between sessions and must not be modified by the page.
+
+#Import required libraries
+import numpy as np                 #NumPy scalars in filter values
+import pandas as pd                #Index filter values
+import page_pipelines              #PagePipeline wrapped with the cached stages
+import result_cache                #Process-wide byte-budgeted LRU / TTL cache
+
+
+#Hashable, order-independent form of a filter value
+  #Lists / sets (multiselect) → sorted tuples; tuples (ranges) keep their order; NumPy scalars → Python values
+def normalize_filter(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, set, frozenset, pd.Index, np.ndarray)):
+        return tuple(sorted((normalize_filter(v) for v in value), key=repr))
+    if isinstance(value, tuple):
+        return tuple(normalize_filter(v) for v in value)
+    return value
+
+
+#Filters as a sorted tuple of (name, normalized value); None (no filter) is left out, as when the filter is not given
+def filter_key(filters):
+    return tuple(sorted((name, normalize_filter(value)) for name, value in filters.items() if value is not None))
+
+
+#PagePipeline whose cleaned data, aggregate results and figures are memoized per (snapshot token, page, filters)
+  #The figures of a result are found through the aggregate key it was built for (kept for this pipeline object,
+  #which lives for one page run)
+def cached_pipeline(pipeline, token, cache=result_cache.RESULT_CACHE):
+    keys = {}                          #id(result) -> (key, result); the reference keeps the id from being reused
+
+    def clean(source):
+        return cache.get(('clean', token, pipeline.title), lambda: pipeline.clean(source), 'clean')
+
+    def aggregate(source, data, **filters):
+        key = (token, pipeline.title, filter_key(filters))
+        result = cache.get(('aggregate',) + key, lambda: pipeline.aggregate(source, data, **filters), 'aggregate')
+        keys[id(result)] = (key, result)
+        return result
+
+    def figures(result):
+        key, _ = keys.get(id(result), (None, None))
+        if key is None:
+            return pipeline.figures(result)
+        return cache.get(('figures',) + key, lambda: pipeline.figures(result), 'figures')
+
+    return page_pipelines.PagePipeline(pipeline.title, pipeline.load, clean, aggregate, figures, pipeline.defaults)
+
+
+#Widget options of a column of a page's cleaned data (see page_pipelines.sorted_options), cached per (snapshot token, page)
+def cached_options(token, title, df, column, dropna=True, cache=result_cache.RESULT_CACHE):
+    return cache.get(('options', token, title, column, dropna), lambda: page_pipelines.sorted_options(df[column], dropna), 'options')
+
+#Commands Used
+#filter_key()                                    – Order-independent, hashable key of the widget selections
+#cached_options()                                – Widget option lists shared by every session (and the warm-up)
+#ResultCache.get(key, compute, kind)             – Shared, byte-budgeted lookup of cleaned data, results and figures
@@ -0,0 +1,198 @@
+#Heavy Hitters (Top-K Species)
+  #Top-K species for any filter combination from bounded Space-Saving summaries: every cell of the aggregate cube
+  #(ecosystem, habitat, year, month, flyover) keeps at most CAPACITY species with their counts, and a page's
+  #filters merge the summaries of the cells they select.
+  #Why? → Top Observed Species, Flyover Observed Species and the Top 5 At-Risk Species grouped every species,
+  #sorted all of them and kept the first 10 / 5; a summary answers from CAPACITY entries per cell and
+  #top_k() picks the K largest with a partial selection instead of a full sort.
+
+#Summaries (Space-Saving, mergeable)
+  #Each cell stores (species, count, error) for its CAPACITY largest species plus a floor: no species left out
+  #of the cell has a count above it. A species' true count lies in [count - error, count].
+  #Merging cells (a query) or summaries (an appended workbook) adds counts, counting a species missing from a cell
+  #at that cell's floor (added to both its count and its error), then keeps the CAPACITY largest again.
+  #Built from the cube's exact cell counts, so entries start with error 0; errors appear only where a cell holds
+  #more than CAPACITY species.
+
+#Exact counts for small cells (BIRD_TOPK_MODE)
+  #exact  → group the cube's rollup cells and pick the top K (as before, without the full sort)
+  #sketch → always merge the summaries
+  #auto   → summaries only when the selected cells hold more than EXACT_OBSERVATIONS observations
+  #         (BIRD_TOPK_EXACT_ROWS, default 1,000,000); smaller selections are counted exactly
+
+#Import required libraries
+import os                          #Capacity, mode and threshold from the environment
+
+import numpy as np                 #Partial selection (np.partition) and per-cell floors
+import pandas as pd                #Merging summaries and grouping entries
+import bitmap_index                #Packed bitsets resolving filters on the summary cells
+import schema                      #Shared category dictionaries when merging summaries
+
+#Cells of the summaries (cube dimensions the top-K pages filter on)
+SUMMARY_DIMS = ['Ecosystem', 'Location_Type', 'Year', 'Month', 'Flyover_Observed']
+SPECIES = 'Common_Name'
+
+#Species kept per cell (override with BIRD_TOPK_CAPACITY)
+CAPACITY = int(os.environ.get("BIRD_TOPK_CAPACITY", 64))
+
+#Top-K mode and the selection size above which 'auto' merges summaries
+MODE = os.environ.get("BIRD_TOPK_MODE", "auto").strip().lower()
+EXACT_OBSERVATIONS = int(os.environ.get("BIRD_TOPK_EXACT_ROWS", 1_000_000))
+
+
+#The k rows with the largest `value`, largest first (ties keep their row order, as a stable sort + head(k))
+  #np.partition finds the k-th largest value in linear time; only the k rows at or above it are sorted
+def top_k(frame, value, k):
+    values = frame[value].to_numpy()
+    if len(values) > k > 0:
+        threshold = np.partition(values, len(values) - k)[len(values) - k]
+        greater = np.flatnonzero(values > threshold)
+        equal = np.flatnonzero(values == threshold)[:k - len(greater)]
+        positions = np.sort(np.concatenate([greater, equal]))
+    else:
+        positions = np.arange(len(values) if k > 0 else 0)
+    order = positions[np.argsort(-values[positions], kind='stable')]
+    return frame.iloc[order]
+
+
+#Entries of each cell reduced to its `capacity` largest; returns (kept entries, floor per cell)
+  #floor = largest count left out of the cell (0 when nothing was left out), at least the given floors
+def _truncate(entries, floors, capacity):
+    rank = entries.groupby('cell', sort=False)['count'].rank(method='first', ascending=False)
+    dropped = entries[rank > capacity]
+    floors = floors.copy()
+    if len(dropped):
+        highest = dropped.groupby('cell')['count'].max()
+        floors[highest.index] = np.maximum(floors[highest.index], highest.to_numpy())
+    return entries[rank <= capacity].reset_index(drop=True), floors
+
+
+#Bounded Top-K Summaries of the Cube Cells
+class TopKSummary:
+    #cells    -> one row per cell (values of the summary dimensions)
+    #entries  -> cell, Common_Name, count, error (at most capacity rows per cell)
+    #floors   -> per cell, bound on the count of every species not in its entries
+    #totals   -> per cell, observations counted (exact)
+    #measure  -> cube measure summarized ('Count' or 'Distinct_Count')
+    def __init__(self, cells, entries, floors, totals, measure, capacity=CAPACITY):
+        self.cells = cells
+        self.dims = list(cells.columns)
+        self.entries = entries
+        self.floors = floors
+        self.totals = totals
+        self.measure = measure
+        self.capacity = capacity
+        self._index = None
+
+    #Summaries of the cells of a frame with the summary dimensions, Common_Name and the measure (cube cells)
+    @classmethod
+    def from_frame(cls, frame, measure, dims=SUMMARY_DIMS, capacity=CAPACITY):
+        dims = [dim for dim in dims if dim in frame.columns]
+        frame = frame[frame[measure] > 0]
+        cell_ids = frame.groupby(dims, observed=True, dropna=False, sort=False).ngroup().to_numpy()
+        _, first = np.unique(cell_ids, return_index=True)
+        cells = frame[dims].take(first).reset_index(drop=True)
+        totals = np.bincount(cell_ids, weights=frame[measure].to_numpy(), minlength=len(cells)).astype(np.int64)
+
+        counts = pd.DataFrame({'cell': cell_ids, SPECIES: frame[SPECIES].array, 'count': frame[measure].to_numpy()})
+        counts = counts.dropna(subset=[SPECIES]).groupby(['cell', SPECIES], observed=True)['count'].sum().reset_index()
+        counts['error'] = 0
+        entries, floors = _truncate(counts, np.zeros(len(cells), dtype=np.int64), capacity)
+        return cls(cells, entries, floors, totals, measure, capacity)
+
+    #Summaries of both (cells with the same values are merged species by species)
+    def merge(self, other):
+        if other.dims != self.dims or other.measure != self.measure:
+            raise ValueError("Summaries of different dimensions or measures cannot be merged")
+        both = schema.concat_categorical([self.cells, other.cells])
+        cell_ids = both.groupby(self.dims, observed=True, dropna=False, sort=False).ngroup().to_numpy()
+        _, first = np.unique(cell_ids, return_index=True)
+        cells = both.take(first).reset_index(drop=True)
+
+        #Floor and total of each side per merged cell (0 where the side has no such cell)
+        sides = []
+        for offset, summary in ((0, self), (len(self.cells), other)):
+            ids = cell_ids[offset:offset + len(summary.cells)]
+            floors = np.zeros(len(cells), dtype=np.int64)
+            floors[ids] = summary.floors
+            totals = np.zeros(len(cells), dtype=np.int64)
+            totals[ids] = summary.totals
+            entries = summary.entries.assign(cell=ids[summary.entries['cell'].to_numpy()])
+            entries[SPECIES] = entries[SPECIES].astype(object)
+            sides.append((entries, floors, totals))
+
+        (a, floors_a, totals_a), (b, floors_b, totals_b) = sides
+        merged = a.merge(b, on=['cell', SPECIES], how='outer', suffixes=('_a', '_b'))
+        cell = merged['cell'].to_numpy()
+        for side, floors in (('_a', floors_a), ('_b', floors_b)):
+            missing = merged[f'count{side}'].isna().to_numpy()
+            merged[f'count{side}'] = np.where(missing, floors[cell], merged[f'count{side}'])
+            merged[f'error{side}'] = np.where(missing, floors[cell], merged[f'error{side}'])
+        entries = pd.DataFrame({
+            'cell': cell,
+            SPECIES: merged[SPECIES].astype('category'),
+            'count': (merged['count_a'] + merged['count_b']).astype(np.int64),
+            'error': (merged['error_a'] + merged['error_b']).astype(np.int64)
+        })
+        entries, floors = _truncate(entries, floors_a + floors_b, self.capacity)
+        return TopKSummary(cells, entries, floors, totals_a + totals_b, self.measure, self.capacity)
+
+    #Bitmap index of the cells (built the first time the summary is filtered)
+    def index(self):
+        if self._index is None:
+            self._index = bitmap_index.BitmapIndex(self.cells, self.dims)
+        return self._index
+
+    #Cell positions matching the filters (as in AggregateCube.select; notna columns outside the cells are ignored)
+    def positions(self, notna=(), **filters):
+        return self.index().positions([col for col in notna if col in self.dims], **filters)
+
+    #Observations in the cells matching the filters
+    def observations(self, notna=(), **filters):
+        return int(self.totals[self.positions(notna, **filters)].sum())
+
+    #Top k species over the cells matching the filters: Common_Name, measure (upper bound), Error
+      #A species missing from a selected cell is counted at that cell's floor (count and error)
+    def top(self, k, notna=(), **filters):
+        positions = self.positions(notna, **filters)
+        selected = np.zeros(len(self.cells), dtype=bool)
+        selected[positions] = True
+        entries = self.entries[selected[self.entries['cell'].to_numpy()]]
+        floor_total = int(self.floors[positions].sum())
+        cell_floor = self.floors[entries['cell'].to_numpy()]
+        sums = (
+            entries.assign(count=entries['count'] - cell_floor, error=entries['error'] - cell_floor)
+            .groupby(SPECIES, observed=True)[['count', 'error']].sum()
+            .reset_index()
+        )
+        sums['count'] += floor_total
+        sums['error'] += floor_total
+        sums = sums.rename(columns={'count': self.measure, 'error': 'Error'})
+        return top_k(sums, self.measure, k).reset_index(drop=True)
+
+    #Bytes held by the entries, floors, totals and the cell table
+    def nbytes(self):
+        return int(self.entries.memory_usage(deep=True).sum() + self.cells.memory_usage(deep=True).sum()) + self.floors.nbytes + self.totals.nbytes
+
+
+#Top k species by a cube measure for the cells matching the filters: Common_Name, measure (largest first)
+  #dims → rollup the exact path groups (must hold Common_Name and the filtered columns)
+  #Summaries are used when the mode allows it, every filter is a summary dimension and the selection is large
+def top_species(cube, measure, k, dims, notna=(), mode=None, **filters):
+    mode = mode or MODE
+    filtered = [col for col, value in filters.items() if value is not None]
+    if mode != 'exact' and all(col in SUMMARY_DIMS and col in cube.dimensions for col in filtered):
+        summary = cube.top_summary(measure)
+        if mode == 'sketch' or summary.observations(notna, **filters) > EXACT_OBSERVATIONS:
+            return summary.top(k, notna, **filters)[[SPECIES, measure]]
+    cells = cube.select(dims, notna=notna, **filters)
+    cells = cells[cells[measure] > 0]
+    counts = cells.groupby(SPECIES, observed=True)[measure].sum().reset_index()
+    return top_k(counts, measure, k).reset_index(drop=True)
+
+#Commands Used
+#np.partition()                        – k-th largest count in linear time (no full sort of every species)
+#groupby().rank(method='first')        – Keeps the CAPACITY largest species of each cell
+#DataFrame.merge(how='outer')          – Merges two summaries species by species (missing → cell floor)
+#BitmapIndex.positions()               – Cells matching a page's filters
+#totals[positions].sum()               – Size of the selection, deciding between exact counts and summaries
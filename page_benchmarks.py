@@ -0,0 +1,249 @@
+#Dashboard Page Benchmarks
+  #Runs every built-in page's load → clean → aggregate → figures pipeline (page_pipelines.py) headlessly
+  #on synthetic data of growing size and records, per stage:
+    #wall_s        → wall-clock time of the stage
+    #peak_rss_mb   → highest resident memory of the process while the stage ran
+    #payload_bytes → size of the figures' JSON (what Streamlit sends to the browser; serialize stage only)
+  #and, for the cube stage, the cells of each cube table (cells, cells_per_row). A size whose cube holds more than
+  #MAX_CELLS_PER_ROW cells per observation is flagged: its rollups would scan about as many cells as rows.
+  #Why? → Shows which pages stop scaling between the current ~4K rows and 10M rows, and whether a change helped.
+
+#Synthetic rows
+  #Rows come from synthetic_data.py: forest- and grassland-shaped observations with the workbooks' schemas,
+  #cardinalities, seasonality and messy values, typed chunk by chunk exactly as data_ingest types the real files.
+  #Why? → Resampling the ~4K real rows only repeated their few plots/dates; sizes up to 10M now have realistic cardinality.
+
+#Usage
+  #python page_benchmarks.py                                  → 4K, 100K, 1M and 10M rows, every page
+  #python page_benchmarks.py --rows 4000 100000 --pages "Temporal Heatmap" --output before.json
+  #python page_benchmarks.py --rows 4000 100000 --output after.json --compare before.json
+  #Each row count runs in its own worker process, so one size's memory never shows up in the next one's peak RSS.
+
+#Import required libraries
+import argparse                    #Command-line options
+import json                        #Results file
+import multiprocessing             #spawn context for the per-size worker process
+import os                          #/proc memory reading and page size
+import platform                    #Machine description stored with the results
+import statistics                  #Median over repeated runs
+import threading                   #Background RSS sampler
+import time                        #Wall-clock timing
+from concurrent.futures import ProcessPoolExecutor   #Runs each row count in a fresh process
+from datetime import datetime, timezone              #Timestamp of the run
+
+import numpy as np                 #NumPy version for the results metadata
+import pandas as pd                #Pandas version for the results metadata
+import plotly                      #Plotly version for the results metadata
+import synthetic_data              #Schema-faithful synthetic observations
+import aggregate_cube              #Cube build is timed as its own ingest stage
+import page_pipelines              #Stages of every built-in page
+
+#psutil is optional – without it memory is read from /proc (Linux) or getrusage (peak of the whole process)
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+#Row counts benchmarked by default (~4K is the size of the current forest + grassland workbooks)
+ROW_COUNTS = [4_000, 100_000, 1_000_000, 10_000_000]
+
+#Stages timed for every page, in pipeline order
+STAGES = ['load', 'clean', 'aggregate', 'figures', 'serialize']
+
+#Page name used for the stages shared by every page (building the snapshot and its cube)
+INGEST = '(ingest)'
+
+#Highest cube cells per observation before a size is flagged (checked from CHECK_CELLS_ROWS rows up; below
+#that nearly every observation is its own combination)
+MAX_CELLS_PER_ROW = 0.5
+CHECK_CELLS_ROWS = 100_000
+
+#Seconds between two RSS samples while a stage runs
+SAMPLE_INTERVAL = 0.005
+
+
+#Resident memory of this process in bytes (None when it cannot be read on this platform)
+def current_rss():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024   #kB on Linux; process-wide peak
+    except ImportError:
+        return None
+
+
+#Peak Memory While a Stage Runs
+class PeakMemory:
+    #peak -> highest RSS (bytes) sampled between __enter__ and __exit__
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        return False
+
+
+#Runs stage() and returns (its result, wall seconds, peak RSS in MB)
+def measure(stage):
+    with PeakMemory() as memory:
+        start = time.perf_counter()
+        result = stage()
+        wall = time.perf_counter() - start
+    peak_mb = round(memory.peak / 2**20, 1) if memory.peak is not None else None
+    return result, wall, peak_mb
+
+
+#Median wall time and highest peak over repeated runs of one stage
+def _summary(rows, page, stage, runs, payload_bytes=None):
+    peaks = [peak for _, peak in runs if peak is not None]
+    return {
+        'rows': rows,
+        'page': page,
+        'stage': stage,
+        'wall_s': round(statistics.median(wall for wall, _ in runs), 6),
+        'peak_rss_mb': max(peaks) if peaks else None,
+        'payload_bytes': payload_bytes
+    }
+
+
+#Benchmarks every requested page at one row count (runs inside a worker process)
+def benchmark_size(rows, titles, seed=0, repeat=1):
+    results = []
+
+    snapshot, wall, peak = measure(lambda: synthetic_data.synthetic_snapshot(rows, seed))
+    results.append(_summary(rows, INGEST, 'snapshot', [(wall, peak)]))
+    cube, wall, peak = measure(lambda: aggregate_cube.cube_for(snapshot))
+    results.append(_summary(rows, INGEST, 'cube', [(wall, peak)]))
+    results[-1]['cells'] = cube.cell_counts()
+    results[-1]['cells_per_row'] = round(sum(results[-1]['cells'].values()) / rows, 4)
+    del cube
+
+    for title in titles:
+        pipeline = page_pipelines.PIPELINES[title]
+        runs = {stage: [] for stage in STAGES}
+        payload_bytes = None
+        for _ in range(repeat):
+            source, wall, peak = measure(lambda: pipeline.load(snapshot))
+            runs['load'].append((wall, peak))
+            data, wall, peak = measure(lambda: pipeline.clean(source))
+            runs['clean'].append((wall, peak))
+            filters = pipeline.defaults(data)
+            result, wall, peak = measure(lambda: pipeline.aggregate(source, data, **filters))
+            runs['aggregate'].append((wall, peak))
+            figures, wall, peak = measure(lambda: pipeline.figures(result))
+            runs['figures'].append((wall, peak))
+            payloads, wall, peak = measure(lambda: [fig.to_json() for fig in figures])
+            runs['serialize'].append((wall, peak))
+            payload_bytes = sum(len(payload.encode('utf-8')) for payload in payloads)
+            del source, data, result, figures, payloads
+        for stage in STAGES:
+            results.append(_summary(rows, title, stage, runs[stage], payload_bytes if stage == 'serialize' else None))
+    return results
+
+
+#Benchmarks each row count in its own spawned worker process and returns the results document
+def run_benchmarks(row_counts=ROW_COUNTS, titles=None, seed=0, repeat=1):
+    titles = list(titles or page_pipelines.PIPELINES)
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for rows in row_counts:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.extend(pool.submit(benchmark_size, rows, titles, seed, repeat).result())
+        print_results([r for r in results if r['rows'] == rows])
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'plotly': plotly.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'row_counts': list(row_counts),
+            'seed': seed,
+            'repeat': repeat
+        },
+        'results': results
+    }
+
+
+#Prints results as a table
+def print_results(results):
+    for r in results:
+        payload = f"{r['payload_bytes']:>12,d} B" if r['payload_bytes'] is not None else ""
+        peak = f"{r['peak_rss_mb']:>9.1f} MB" if r['peak_rss_mb'] is not None else ""
+        print(f"{r['rows']:>11,d}  {r['page'][:48]:48s} {r['stage']:10s} {r['wall_s']:>10.4f} s {peak} {payload}")
+        if 'cells' in r:
+            tables = ", ".join(f"{name} {cells:,}" for name, cells in r['cells'].items())
+            flag = "  ← above MAX_CELLS_PER_ROW" if r['rows'] >= CHECK_CELLS_ROWS and r['cells_per_row'] > MAX_CELLS_PER_ROW else ""
+            print(f"{'':13s}cube cells: {tables} ({r['cells_per_row']:.3f} per row){flag}")
+
+
+#Prints the wall-time ratio (current / baseline) of every stage found in both result files
+def compare_results(current, baseline):
+    previous = {(r['rows'], r['page'], r['stage']): r for r in baseline['results']}
+    for r in current['results']:
+        old = previous.get((r['rows'], r['page'], r['stage']))
+        if old is None:
+            continue
+        ratio = r['wall_s'] / old['wall_s'] if old['wall_s'] else float('nan')
+        print(f"{r['rows']:>11,d}  {r['page'][:48]:48s} {r['stage']:10s} {old['wall_s']:>10.4f} s → {r['wall_s']:>10.4f} s  ×{ratio:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every dashboard page pipeline on synthetic data")
+    parser.add_argument("--rows", type=int, nargs="+", default=ROW_COUNTS, help="synthetic row counts")
+    parser.add_argument("--pages", nargs="+", choices=list(page_pipelines.PIPELINES), metavar="PAGE", help="pages to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per page; wall_s is the median")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the synthetic rows")
+    parser.add_argument("--output", default="page_benchmarks.json", help="results file (JSON)")
+    parser.add_argument("--compare", metavar="BASELINE", help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    document = run_benchmarks(args.rows, args.pages, args.seed, max(args.repeat, 1))
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            compare_results(document, json.load(handle))
+
+
+if __name__ == "__main__":
+    main()
+
+#Commands Used
+#page_pipelines.PIPELINES           – load / clean / aggregate / figures stages of every page, no Streamlit involved
+#synthetic_data.synthetic_snapshot() – Typed synthetic forest + grassland observations, generated in chunks
+#AggregateCube.cell_counts()         – Cells of each cube table, compared with the row count
+#time.perf_counter()                 – Wall time of each stage
+#/proc/self/statm (or psutil)        – Resident memory, sampled every 5 ms while a stage runs
+#fig.to_json()                       – Figure payload size in bytes
+#ProcessPoolExecutor(spawn)          – One fresh process per row count
@@ -0,0 +1,837 @@
+#Dashboard Page Pipelines
+  #The data and chart logic of every built-in dashboard page, outside of Streamlit.
+  #Why? → visualization.py only draws widgets and charts; the same pipelines run headlessly in the
+  #benchmark suite (page_benchmarks.py) and anywhere else a page's figures are needed.
+
+#Stages of a page
+  #load(snapshot)                  → what the page reads: the snapshot's aggregate cube, or columns of the observation frame
+  #clean(source)                   → cleaned data the page's widgets take their options from
+  #aggregate(source, data, **filters) → the grouped tables behind the charts (filters left out / None = all)
+  #figures(result)                 → list of Plotly figures for the result
+  #defaults(data)                  → filters the page selects on first render (first species, 'Forest', ...)
+
+#Large figures
+  #Figures with one trace (or one x position) per species keep the MAX_SPECIES_TRACES largest species and draw
+  #the rest as one 'Other' trace; scatter/strip figures above WEBGL_POINTS points switch to WebGL and are
+  #downsampled to MAX_POINTS on the server.
+  #Why? → At millions of observations the browser payload ran to tens of MB and the page froze.
+
+#Import required libraries
+import os                          #Rendering settings from environment variables
+import numpy as np                 #Month axis of the temporal count matrices, NaN option of missing values
+import pandas as pd                #Pandas to filter, group and reshape the observations
+import plotly.express as px        #Plotly Express charts
+import plotly.graph_objects as go  #Plotly heatmap
+import aggregate_cube              #Precomputed observation count cube (built once per data snapshot)
+import heavy_hitters               #Top-K species: exact, or merged bounded summaries at scale
+import richness_sketch             #Unique-species counts: exact, or merged HyperLogLog sketches at scale
+import schema                      #Typed/categorical observation schema helpers
+import temporal_rollups            #Dense per-species day / week / month / year count matrices
+
+#Rendering of large figures (override with environment variables)
+  #BIRD_RENDER_MODE        → 'auto' (WebGL above WEBGL_POINTS), 'svg' (never) or 'webgl' (always)
+  #BIRD_WEBGL_POINTS       → points above which scatter/strip figures use WebGL
+  #BIRD_MAX_POINTS         → points kept (random sample) in a WebGL scatter figure
+  #BIRD_MAX_SPECIES_TRACES → species drawn on their own; the rest become 'Other'
+RENDER_MODE = os.environ.get("BIRD_RENDER_MODE", "auto").strip().lower()
+WEBGL_POINTS = int(os.environ.get("BIRD_WEBGL_POINTS", 2_000))
+MAX_POINTS = int(os.environ.get("BIRD_MAX_POINTS", 20_000))
+MAX_SPECIES_TRACES = int(os.environ.get("BIRD_MAX_SPECIES_TRACES", 20))
+OTHER = 'Other'
+
+
+#True when a scatter figure of `points` points should be drawn with WebGL
+def use_webgl(points, mode=RENDER_MODE):
+    return mode == 'webgl' or (mode == 'auto' and points > WEBGL_POINTS)
+
+
+#Relabels every value of `column` outside the `limit` largest (by total `value`) as OTHER
+  #combine=True sums the relabelled rows per keys + column (bars); False keeps each row (scatter points)
+  #Returns (frame, order) – order lists the kept values largest first, then OTHER
+def collapse_tail(df, column, value, keys=(), limit=MAX_SPECIES_TRACES, combine=True):
+    totals = df.groupby(column, observed=True)[value].sum().sort_values(ascending=False)
+    order = list(totals.index)
+    if len(order) <= limit:
+        return df, order
+    top = order[:limit]
+    df = df.copy()
+    df[column] = df[column].astype(object).where(df[column].isin(top), OTHER)
+    if combine:
+        df = df.groupby(list(keys) + [column], sort=False)[value].sum().reset_index()
+    return df, top + [OTHER]
+
+
+#Sorted distinct values of a column (widget options and their defaults)
+  #dropna=False adds one missing value (NaN) after the sorted values when the column has any, so "missing" can be
+  #selected like any other value (sorting text and NaN together raises a TypeError)
+def sorted_options(values, dropna=True):
+    options = sorted(values.dropna().unique())
+    if not dropna and values.isna().any():
+        options.append(np.nan)
+    return options
+
+
+#At most `limit` rows, drawn at random (fixed seed, so reruns show the same points)
+def downsample(df, limit=MAX_POINTS):
+    if len(df) <= limit:
+        return df
+    return df.sample(n=limit, random_state=0).sort_index()
+
+
+#Stages of One Dashboard Page
+class PagePipeline:
+    #title     -> page name in the sidebar navigation
+    #load      -> snapshot -> source
+    #clean     -> source -> cleaned data (widget options)
+    #aggregate -> (source, data, **filters) -> result
+    #figures   -> result -> [figures]
+    #defaults  -> data -> filters selected when the page first renders
+    def __init__(self, title, load, clean, aggregate, figures, defaults=None):
+        self.title = title
+        self.load = load
+        self.clean = clean
+        self.aggregate = aggregate
+        self.figures = figures
+        self.defaults = defaults or (lambda data: {})
+
+
+#Aggregate cube of the snapshot (most pages are answered from its cells)
+def load_cube(snapshot):
+    return aggregate_cube.cube_for(snapshot)
+
+
+#Combined forest + grassland observation frame (pages that need row-level columns)
+def load_frame(snapshot):
+    return snapshot.frame
+
+
+#Species Distribution - Distance & Flyover Trends
+DISTANCE_COLUMNS = ['Distance', 'Initial_Three_Min_Cnt', 'Common_Name']
+
+#Distance bands → numeric midpoints for visualization (band order and midpoints live in schema.py)
+DISTANCE_MAPPING = dict(zip(schema.DISTANCE_BANDS, schema.DISTANCE_MIDPOINTS.tolist()))
+
+
+def distribution_load(snapshot):
+    return snapshot.frame[DISTANCE_COLUMNS]
+
+
+#Distance is already an ordered band code and Initial_Three_Min_Cnt a bool (parsed at ingest, see schema.py):
+  #placeholders are missing values, so cleaning is a dropna and the midpoint is an array lookup by band code
+def distribution_clean(df):
+    df = df.dropna(subset=DISTANCE_COLUMNS)
+    df['Initial_Three_Min_Cnt'] = df['Initial_Three_Min_Cnt'].astype('int8')   #True/False → 1/0 (summed per group)
+    df['Distance_Numeric'] = schema.distance_midpoints(df['Distance'])
+    return df
+
+
+#(counts per species per distance, same rows for the top 10 species by total count)
+def distribution_aggregate(source, df):
+    grouped_df = df.groupby(['Distance_Numeric', 'Common_Name'], observed=True).agg({'Initial_Three_Min_Cnt': 'sum'}).reset_index()
+    top_species = grouped_df.groupby("Common_Name", observed=True)["Initial_Three_Min_Cnt"].sum().nlargest(10).index
+    filtered_df = grouped_df[grouped_df["Common_Name"].isin(top_species)]
+    return grouped_df, filtered_df
+
+
+def distribution_figures(result):
+    grouped_df, filtered_df = result
+    labels = {
+        "Distance_Numeric": "Distance (Midpoint in Meters)",
+        "Initial_Three_Min_Cnt": "Bird Count",
+        "Common_Name": "Species"
+    }
+    bar_fig = px.bar(
+        filtered_df,
+        x='Distance_Numeric',
+        y='Initial_Three_Min_Cnt',
+        color='Common_Name',
+        barmode='group',
+        title="Top 10 Species Count by Distance (Grouped View)",
+        labels=labels,
+        template='seaborn'  #A clean, visually appealing style
+    )
+
+    #Tail species share one 'Other' colour; large point sets are drawn with WebGL from a server-side sample
+    points, order = collapse_tail(grouped_df, 'Common_Name', 'Initial_Three_Min_Cnt', combine=False)
+    if use_webgl(len(points)):
+        sample = downsample(points)
+        title = "Species Distribution by Distance (Numeric)"
+        if len(sample) < len(points):
+            title += f" – sample of {len(sample):,} / {len(points):,} points"
+        scatter_fig = px.scatter(
+            sample,
+            x='Distance_Numeric',
+            y='Initial_Three_Min_Cnt',
+            color='Common_Name',
+            category_orders={'Common_Name': order},
+            render_mode='webgl',
+            title=title,
+            labels=labels,
+            template='seaborn'
+        )
+    else:
+        scatter_fig = px.strip(
+            points,
+            x='Distance_Numeric',
+            y='Initial_Three_Min_Cnt',
+            color='Common_Name',
+            category_orders={'Common_Name': order},
+            title="Species Distribution by Distance (Numeric)",
+            labels=labels,
+            template='seaborn'
+        )
+    return [bar_fig, scatter_fig]
+
+
+#Temporal Heatmap
+#Per-species count matrices of the snapshot (year and month heatmaps are blocks of them)
+def load_temporal(snapshot):
+    return temporal_rollups.rollups_for(snapshot)
+
+
+#Species / habitat pairs with dated observations (widget options; rows without a 'Date' are not in the rollups)
+def temporal_clean(rollups):
+    return rollups.pairs()
+
+
+#(species, years, species × year counts, months, species × month counts) for the selected species and habitats
+  #Only species, years and months with observations are kept (missing species left out, as groupby() does)
+def temporal_aggregate(rollups, df, species=None, habitats=None):
+    years, names, yearly = rollups.counts('year', species, habitats)
+    _, monthly = rollups.month_of_year(species, habitats)
+    rows = pd.notna(names) & (yearly.sum(axis=1) > 0)
+    yearly, monthly = yearly[rows], monthly[rows]
+    year_columns, month_columns = yearly.sum(axis=0) > 0, monthly.sum(axis=0) > 0
+    months = np.arange(1, 13)
+    return names[rows], years[year_columns], yearly[:, year_columns], months[month_columns], monthly[:, month_columns]
+
+
+#Heatmaps drawn straight from the count matrices (species rows in dictionary order, i.e. alphabetical)
+def temporal_figures(result):
+    names, years, yearly, months, monthly = result
+
+    #Year-wise heatmap on a categorical axis (no decimals between years)
+    fig_year = go.Figure(data=go.Heatmap(
+        z=yearly,
+        x=[str(year) for year in years],
+        y=names,
+        colorscale='Viridis',
+        colorbar=dict(title="Observation Count")
+    ))
+    fig_year.update_layout(
+        title="Year-wise Observations Heatmap",
+        xaxis_title="Year",
+        yaxis_title="Species",
+        xaxis=dict(type='category')
+    )
+
+    monthly_heatmap = go.Figure(data=go.Heatmap(
+        z=monthly,
+        x=[str(month) for month in months],
+        y=names,
+        colorscale='Viridis',
+        colorbar=dict(title="Observation Count")
+    ))
+    monthly_heatmap.update_layout(
+        title="Month-wise Observations Heatmap",
+        xaxis_title="Month",
+        yaxis_title="Species",
+        xaxis=dict(type='category')
+    )
+    return [fig_year, monthly_heatmap]
+
+
+#Every species and habitat selected (the page's multiselects start with all values)
+def temporal_defaults(df):
+    return {'species': sorted_options(df['Common_Name'], dropna=False), 'habitats': sorted_options(df['Location_Type'], dropna=False)}
+
+
+#Species Filters (same rollups; missing species and habitats are offered as "Unknown")
+def species_filters_clean(rollups):
+    df = rollups.pairs()
+    df['Common_Name'] = schema.fill_category(df['Common_Name'], "Unknown")
+    df['Location_Type'] = schema.fill_category(df['Location_Type'], "Unknown")
+    return df
+
+
+#(year-wise counts, month-wise counts, total observations, species) for one species in the selected habitats
+def species_filters_aggregate(rollups, df, species=None, habitats=None):
+    selected = [] if species is None else [species]
+    years, _, yearly = rollups.counts('year', selected, habitats, missing="Unknown")
+    _, monthly = rollups.month_of_year(selected, habitats, missing="Unknown")
+    yearly, monthly = yearly.sum(axis=0), monthly.sum(axis=0)
+    year_trend = pd.DataFrame({'Year': years[yearly > 0], 'Observation Count': yearly[yearly > 0]})
+    month_trend = pd.DataFrame({'Month': np.arange(1, 13)[monthly > 0], 'Observation Count': monthly[monthly > 0]})
+    return year_trend, month_trend, int(yearly.sum()), species
+
+
+def species_filters_figures(result):
+    year_trend, month_trend, total_obs, species = result
+    fig_year = px.line(year_trend, x='Year', y='Observation Count', markers=True,
+                       title=f"Year-wise Observation Trend for {species}")
+    fig_month = px.bar(month_trend, x='Month', y='Observation Count',
+                       title=f"Month-wise Observation Count for {species}")
+    return [fig_year, fig_month]
+
+
+def species_filters_defaults(df):
+    species_list = sorted(df['Common_Name'].unique())
+    return {'species': species_list[0] if species_list else None, 'habitats': sorted(df['Location_Type'].unique())}
+
+
+#Geographic Mapping - Forest vs Grassland
+GEOGRAPHIC_DIMS = ['Ecosystem', 'Year', 'Month', 'Common_Name']
+
+
+def geographic_clean(cube):
+    return cube.rollup(GEOGRAPHIC_DIMS)
+
+
+#Unique species per period and ecosystem ('Ecosystem' = source workbook), forest rows first
+  #Duplicate rows never change a unique-species count, so no drop_duplicates() pass is needed
+  #Counts come from the cube cells, or from merged species sketches on large cubes (richness_sketch.py)
+def _species_per_period(cube, period):
+    counts = richness_sketch.distinct_species(cube, ['Ecosystem', period], GEOGRAPHIC_DIMS)
+    counts = counts.rename(columns={'Common_Name': 'Species Count'})
+    counts['Ecosystem'] = counts['Ecosystem'].astype(object)
+    return counts[[period, 'Species Count', 'Ecosystem']]
+
+
+#(monthly unique species, yearly unique species), forest rows first
+def geographic_aggregate(cube, df):
+    return _species_per_period(cube, 'Month'), _species_per_period(cube, 'Year')
+
+
+def geographic_figures(result):
+    monthly_species, yearly_species = result
+    fig_month = px.bar(
+        monthly_species,
+        x='Month',
+        y='Species Count',
+        color='Ecosystem',
+        barmode='group',
+        title='Monthly Unique Bird Species Count: Forest vs Grassland',
+        text='Species Count'
+    )
+    fig_year = px.bar(
+        yearly_species,
+        x='Year',
+        y='Species Count',
+        color='Ecosystem',
+        barmode='group',
+        title='Yearly Unique Bird Species Count: Forest vs Grassland',
+        text='Species Count'
+    )
+    return [fig_month, fig_year]
+
+
+#Species Richness
+RICHNESS_DIMS = ['Location_Type', 'Common_Name', 'Year', 'Month']
+RICHNESS_REQUIRED = ['Common_Name', 'Location_Type', 'Year']
+
+
+def richness_clean(cube):
+    return cube.rollup(RICHNESS_DIMS).dropna(subset=RICHNESS_REQUIRED)
+
+
+#Unique species per habitat (exact over the cube cells, or merged species sketches on large cubes)
+def richness_aggregate(cube, df, year=None, month=None):
+    richness = richness_sketch.distinct_species(
+        cube, ['Location_Type'], RICHNESS_DIMS, notna=RICHNESS_REQUIRED, Year=year, Month=month
+    )
+    return richness.rename(columns={'Common_Name': 'Unique Species Count'})
+
+
+def richness_figures(richness):
+    fig = px.bar(
+        richness,
+        x='Location_Type',
+        y='Unique Species Count',
+        title="Species Richness by Habitat Type",
+        labels={'Location_Type': 'Habitat', 'Unique Species Count': 'Number of Species'},
+        color='Location_Type',
+        template='plotly_dark'
+    )
+    return [fig]
+
+
+#Top Observed Species
+TOP_DIMS = ['Common_Name', 'Year', 'Month']
+
+
+#Exact duplicate rows are left out of the cube's 'Distinct_Count' measure
+def top_clean(cube):
+    df = cube.rollup(TOP_DIMS)
+    df = df[df['Distinct_Count'] > 0]
+    return df.dropna(subset=['Common_Name', 'Year'])
+
+
+#Top 10 species by distinct observations (None = all years / months)
+def top_aggregate(cube, df, year=None, month=None):
+    species_counts = heavy_hitters.top_species(
+        cube, 'Distinct_Count', 10, TOP_DIMS, notna=['Common_Name', 'Year'], Year=year, Month=month
+    )
+    return species_counts.rename(columns={'Distinct_Count': 'Observation Count'})
+
+
+def top_figures(species_counts):
+    fig = px.bar(
+        species_counts,
+        x='Common_Name',
+        y='Observation Count',
+        title="Top 10 Observed Bird Species",
+        labels={'Common_Name': 'Species', 'Observation Count': 'Number of Observations'},
+        color='Observation Count',
+        template='plotly_dark',
+        text='Observation Count'
+    )
+    fig.update_traces(texttemplate='%{text}', textposition='outside')
+    return [fig]
+
+
+#Species Activity by Region and Season
+ACTIVITY_DIMS = ['Common_Name', 'Plot_Name', 'Season']
+
+
+def activity_clean(cube):
+    return cube.rollup(ACTIVITY_DIMS).dropna(subset=ACTIVITY_DIMS)   #'Season' is missing exactly when 'Date' is
+
+
+#(counts per plot and season for the species, species)
+def activity_aggregate(cube, df, species=None):
+    filtered = cube.select(ACTIVITY_DIMS, notna=ACTIVITY_DIMS, Common_Name=species)
+    return filtered.rename(columns={'Count': 'Observation_Count'}), species
+
+
+def activity_figures(result):
+    filtered, species = result
+    fig = px.bar(
+        filtered,
+        x='Plot_Name',
+        y='Observation_Count',
+        color='Season',
+        barmode='group',
+        title=f"{species} Activity by Region and Season",
+        labels={'Plot_Name': 'Region', 'Observation_Count': 'Observation Count'},
+        template='plotly_dark'
+    )
+    return [fig]
+
+
+def activity_defaults(df):
+    species_list = sorted(df['Common_Name'].unique())
+    return {'species': species_list[0] if species_list else None}
+
+
+#Temperature Bin by Habitat
+TEMPERATURE_DIMS = ['Location_Type', 'Temperature_Bin']
+
+
+#Missing, non-numeric or out-of-range temperatures have no bin (aggregate_cube.TEMPERATURE_BINS)
+def temperature_clean(cube):
+    return cube.rollup(TEMPERATURE_DIMS).dropna(subset=['Temperature_Bin', 'Location_Type'])
+
+
+#(counts per habitat and temperature bin, habitat)
+def temperature_aggregate(cube, df, habitat=None):
+    filtered_df = cube.select(TEMPERATURE_DIMS, notna=TEMPERATURE_DIMS, Location_Type=habitat)
+    bin_counts = (
+        filtered_df.groupby(['Location_Type', 'Temperature_Bin'], observed=True)['Count']
+        .sum()
+        .reset_index(name='Observation Count')
+    )
+    return bin_counts, habitat
+
+
+def temperature_figures(result):
+    bin_counts, habitat = result
+    fig = px.bar(
+        bin_counts,
+        x='Temperature_Bin',
+        y='Observation Count',
+        color='Location_Type',
+        title=f"Temperature Distribution by Habitat ({habitat if habitat else 'All Habitats'})",
+        labels={'Temperature_Bin': 'Temperature Bin', 'Observation Count': 'Number of Observations'},
+        template='plotly_dark'
+    )
+    return [fig]
+
+
+#Humidity Bin by Habitat
+HUMIDITY_DIMS = ['Common_Name', 'Location_Type', 'Year', 'Month', 'Humidity_Bin']
+HUMIDITY_REQUIRED = ['Common_Name', 'Location_Type', 'Year', 'Humidity_Bin']
+
+
+#Missing or out-of-range humidity has no bin (aggregate_cube.HUMIDITY_BINS)
+def humidity_clean(cube):
+    return cube.rollup(HUMIDITY_DIMS).dropna(subset=HUMIDITY_REQUIRED)
+
+
+def humidity_aggregate(cube, df, year=None, month=None):
+    filtered_df = cube.select(HUMIDITY_DIMS, notna=HUMIDITY_REQUIRED, Year=year, Month=month)
+    return (
+        filtered_df.groupby(['Location_Type', 'Humidity_Bin'], observed=True)['Count']
+        .sum()
+        .reset_index(name='Count')
+    )
+
+
+def humidity_figures(humidity_bin_counts):
+    fig = px.bar(
+        humidity_bin_counts,
+        x='Location_Type',
+        y='Count',
+        color='Humidity_Bin',
+        title="Humidity Bin Distribution by Habitat",
+        labels={'Location_Type': 'Habitat', 'Count': 'Number of Observations'},
+        color_discrete_map={'Low': 'blue', 'Medium': 'orange', 'High': 'red'},
+        template='plotly_dark'
+    )
+    return [fig]
+
+
+#Sky Conditions
+SKY_CONDITIONS = ['clear', 'cloudy', 'partly cloudy', 'overcast']
+
+
+#Sky values standardized (trimmed, lowercase) and limited to the expected conditions
+def sky_clean(cube):
+    df = cube.rollup(['Location_Type', 'Sky']).dropna(subset=['Location_Type', 'Sky'])
+    df['Sky'] = df['Sky'].str.strip().str.lower()
+    return df[df['Sky'].isin(SKY_CONDITIONS)]
+
+
+def sky_aggregate(cube, df):
+    return df.groupby(['Location_Type', 'Sky'], observed=True)['Count'].sum().reset_index(name='Count')
+
+
+def sky_figures(sky_counts):
+    fig = px.bar(
+        sky_counts,
+        x='Sky',
+        y='Count',
+        color='Location_Type',
+        barmode='group',
+        title="Sky Conditions by Habitat",
+        labels={'Sky': 'Sky Condition', 'Count': 'Observation Count'},
+        template='plotly_dark'
+    )
+    return [fig]
+
+
+#Wind Conditions
+#Descriptive wind values (trimmed, lowercase) → simplified categories
+WIND_MAPPING = {
+    'calm (< 1 mph) smoke rises vertically': 'Calm',
+    'light breeze (4-7 mph) wind felt on face': 'Low',
+    'gentle breeze (8-12 mph) leaves rustle': 'Medium',
+    'moderate breeze (13-18 mph) small branches move': 'High',
+    # Add more mappings as needed
+}
+
+
+#Cells with an unrecognized wind description are dropped
+def wind_clean(cube):
+    df = cube.rollup(['Location_Type', 'Wind']).dropna(subset=['Location_Type', 'Wind'])
+    df['Wind'] = df['Wind'].str.strip().str.lower()
+    df['Wind_Category'] = df['Wind'].map(WIND_MAPPING)
+    return df.dropna(subset=['Wind_Category'])
+
+
+def wind_aggregate(cube, df):
+    return df.groupby(['Location_Type', 'Wind_Category'], observed=True)['Count'].sum().reset_index(name='Count')
+
+
+def wind_figures(wind_counts):
+    fig = px.bar(
+        wind_counts,
+        x='Wind_Category',
+        y='Count',
+        color='Location_Type',
+        barmode='group',
+        title="Wind Conditions by Habitat",
+        labels={'Wind_Category': 'Wind Condition', 'Count': 'Observation Count'},
+        template='plotly_dark'
+    )
+    return [fig]
+
+
+#Seasonal Observation Counts
+SEASONAL_DIMS = ['Common_Name', 'Location_Type', 'Year', 'Season']
+SEASONAL_REQUIRED = ['Common_Name', 'Location_Type', 'Year']
+
+
+def seasonal_clean(cube):
+    return cube.rollup(SEASONAL_DIMS).dropna(subset=SEASONAL_REQUIRED)
+
+
+def seasonal_aggregate(cube, df, year=None, season=None):
+    filtered_df = cube.select(SEASONAL_DIMS, notna=SEASONAL_REQUIRED, Year=year, Season=season)
+    return (
+        filtered_df.groupby('Season', observed=True)['Count']
+        .sum()
+        .reset_index()
+        .rename(columns={'Count': 'Observation Count'})
+    )
+
+
+def seasonal_figures(seasonal_counts):
+    fig = px.bar(
+        seasonal_counts,
+        x='Season',
+        y='Observation Count',
+        title="Seasonal Observation Counts",
+        labels={'Season': 'Season', 'Observation Count': 'Number of Observations'},
+        color='Season',
+        template='plotly_dark'
+    )
+    return [fig]
+
+
+#Seasonal Time Factor
+TIME_FACTOR_DIMS = ['Common_Name', 'Location_Type', 'Season', 'Month']
+TIME_FACTOR_REQUIRED = ['Common_Name', 'Month', 'Location_Type']
+
+
+def time_factor_clean(cube):
+    return cube.rollup(TIME_FACTOR_DIMS).dropna(subset=TIME_FACTOR_REQUIRED)   #'Month' is missing exactly when 'Date' is
+
+
+def time_factor_aggregate(cube, df, season=None, month=None):
+    filtered_df = cube.select(TIME_FACTOR_DIMS, notna=TIME_FACTOR_REQUIRED, Season=season, Month=month)
+    return (
+        filtered_df.groupby(['Season', 'Common_Name'], observed=True)['Count']
+        .sum()
+        .reset_index(name='Observation Count')
+    )
+
+
+#One bar trace per species: species beyond MAX_SPECIES_TRACES are summed into 'Other'
+def time_factor_figures(seasonal_time_factor):
+    bars, order = collapse_tail(seasonal_time_factor, 'Common_Name', 'Observation Count', keys=['Season'])
+    fig = px.bar(
+        bars,
+        x='Season',
+        y='Observation Count',
+        color='Common_Name',
+        category_orders={'Common_Name': order},
+        barmode='group',
+        title="Seasonal Time Factor - Observations by Season and Species",
+        labels={'Season': 'Season', 'Observation Count': 'Number of Observations'},
+        template='plotly_dark'
+    )
+    return [fig]
+
+
+#Flyover Observed Species
+FLYOVER_DIMS = ['Common_Name', 'Flyover_Observed']
+
+
+def flyover_clean(cube):
+    return cube.rollup(FLYOVER_DIMS).dropna(subset=['Flyover_Observed', 'Common_Name'])
+
+
+#Top 10 species by flyover observations, most observed first
+def flyover_aggregate(cube, df):
+    flyover_counts = heavy_hitters.top_species(cube, 'Count', 10, FLYOVER_DIMS, notna=FLYOVER_DIMS, Flyover_Observed=True)
+    return flyover_counts.rename(columns={'Count': 'Flyover_Count'})
+
+
+def flyover_figures(flyover_counts_sorted):
+    fig = px.bar(
+        flyover_counts_sorted.head(10),  # Show top 10 species
+        x='Common_Name',
+        y='Flyover_Count',
+        title="Top 10 Flyover Observed Species",
+        labels={'Common_Name': 'Species', 'Flyover_Count': 'Observation Count'},
+        template='plotly_dark'
+    )
+    return [fig]
+
+
+#Species Migration Patterns
+MIGRATION_DIMS = ['Common_Name', 'Season', 'Location_Type']
+
+
+#Cube counts become the 'Observation' column ('Season' is missing exactly when 'Date' is)
+def migration_clean(cube):
+    df = cube.rollup(MIGRATION_DIMS).dropna(subset=['Location_Type', 'Common_Name', 'Season'])
+    return df.rename(columns={'Count': 'Observation'})
+
+
+#Observations per species and season, one column per habitat
+def migration_aggregate(cube, df):
+    pivot_df = df.groupby(MIGRATION_DIMS, observed=True)['Observation'].sum().reset_index()
+    return pivot_df.pivot_table(index=['Common_Name', 'Season'], columns='Location_Type', values='Observation', fill_value=0, observed=True)
+
+
+#One bar per species in every facet: species beyond MAX_SPECIES_TRACES are summed into 'Other' (the table keeps them all)
+def migration_figures(migration_data):
+    melted = migration_data.reset_index().melt(id_vars=['Common_Name', 'Season'], var_name='Habitat', value_name='Count')
+    melted, order = collapse_tail(melted, 'Common_Name', 'Count', keys=['Season', 'Habitat'])
+    fig = px.bar(
+        melted,
+        x='Common_Name',
+        y='Count',
+        color='Habitat',
+        facet_col='Season',
+        category_orders={'Common_Name': order},
+        title="Species Migration Patterns by Habitat and Season",
+        labels={'Count': 'Observation Count', 'Common_Name': 'Species'},
+        template='plotly_dark'
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return [fig]
+
+
+#At-Risk Species & Conservation
+AT_RISK_DIMS = ['Common_Name', 'Location_Type', 'Year']
+
+
+def at_risk_clean(cube):
+    return cube.rollup(AT_RISK_DIMS).dropna(subset=['Location_Type', 'Common_Name', 'Year'])   #'Year' is missing exactly when 'Date' is
+
+
+#Species with a low sighting frequency or found in only one habitat, fewest observations first
+def at_risk_aggregate(cube, df):
+    species_counts = df.groupby('Common_Name', observed=True)['Count'].sum().reset_index(name='Total_Observations')
+    habitat_counts = df.groupby('Common_Name', observed=True)['Location_Type'].nunique().reset_index(name='Unique_Habitats')
+    summary = pd.merge(species_counts, habitat_counts, on='Common_Name')
+    return summary[
+        (summary['Total_Observations'] <= 5) |     # Low sighting frequency
+        (summary['Unique_Habitats'] == 1)          # Found in only one habitat
+    ].sort_values(by='Total_Observations')
+
+
+def at_risk_figures(at_risk_species):
+    fig = px.bar(
+        at_risk_species,
+        x='Common_Name',
+        y='Total_Observations',
+        color='Unique_Habitats',
+        title="At-Risk Species: Observation Count vs. Habitat Diversity",
+        labels={'Total_Observations': 'Observation Count', 'Unique_Habitats': 'Habitat Diversity'},
+        template='plotly_dark'
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return [fig]
+
+
+#At-Risk Species & Conservation - Top 5 At-Risk Species
+WATCHLIST_COLUMNS = ['Common_Name', 'Location_Type', 'Initial_Three_Min_Cnt', 'PIF_Watchlist_Status', 'Regional_Stewardship_Status']
+
+
+#Rows with a PIF Watchlist or Regional Stewardship status
+def watchlist_clean(df):
+    return df[(df['PIF_Watchlist_Status'].notna()) | (df['Regional_Stewardship_Status'].notna())]
+
+
+#(observations per species and habitat with their statuses, top 5 species by total observations)
+def watchlist_aggregate(source, at_risk_df):
+    risk_summary = at_risk_df.groupby(['Common_Name', 'Location_Type'], observed=True).agg({
+        'Initial_Three_Min_Cnt': 'sum',
+        'PIF_Watchlist_Status': 'first',
+        'Regional_Stewardship_Status': 'first'
+    }).reset_index().rename(columns={'Initial_Three_Min_Cnt': 'Observations'})
+    top_species = risk_summary.groupby('Common_Name', observed=True)['Observations'].sum().reset_index()
+    top_species = heavy_hitters.top_k(top_species, 'Observations', 5)
+    return risk_summary, top_species
+
+
+def watchlist_figures(result):
+    risk_summary, top_species = result
+    fig1 = px.bar(
+        risk_summary,
+        x='Common_Name',
+        y='Observations',
+        color='Location_Type',
+        barmode='group',
+        title="At-Risk Species by Habitat",
+        labels={'Common_Name': 'Species Name', 'Observations': 'Observation Count'},
+        template='plotly_dark'
+    )
+    fig2 = px.bar(
+        top_species,
+        x='Common_Name',
+        y='Observations',
+        title='Top 5 At-Risk Species by Total Observations',
+        labels={'Common_Name': 'Species Name', 'Observations': 'Total Observations'},
+        template='plotly_dark',
+        color='Common_Name'
+    )
+    return [fig1, fig2]
+
+
+#High Activity Zones
+ZONE_DIMS = ['Ecosystem', 'Common_Name', 'Plot_Name']
+
+
+def zones_clean(cube):
+    return cube.rollup(ZONE_DIMS)
+
+
+#Observations per plot for one ecosystem and species, busiest plots first
+def zones_aggregate(cube, df, ecosystem=None, species=None):
+    df = cube.select(ZONE_DIMS, Ecosystem=ecosystem, Common_Name=species)
+    plot_activity = df.groupby(['Plot_Name', 'Ecosystem'], observed=True)['Count'].sum().reset_index(name='Observation_Count')
+    return plot_activity.sort_values(by='Observation_Count', ascending=False)
+
+
+def zones_figures(plot_activity):
+    fig = px.bar(
+        plot_activity,
+        x='Plot_Name',
+        y='Observation_Count',
+        color='Ecosystem',
+        title='Observation Density by Plot Name',
+        labels={'Plot_Name': 'Plot Name', 'Observation_Count': 'Observation Count'},
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return [fig]
+
+
+def zones_defaults(df):
+    species_list = sorted(df['Common_Name'].dropna().unique())
+    return {'ecosystem': aggregate_cube.ECOSYSTEMS[0], 'species': species_list[0] if species_list else None}
+
+
+#Every built-in page, in sidebar order
+PIPELINES = {pipeline.title: pipeline for pipeline in [
+    PagePipeline("Species Distribution", distribution_load, distribution_clean, distribution_aggregate, distribution_figures),
+    PagePipeline("Temporal Heatmap", load_temporal, temporal_clean, temporal_aggregate, temporal_figures, temporal_defaults),
+    PagePipeline("Geographic Mapping - Forest vs Grassland", load_cube, geographic_clean, geographic_aggregate, geographic_figures),
+    PagePipeline("Species Filters", load_temporal, species_filters_clean, species_filters_aggregate, species_filters_figures, species_filters_defaults),
+    PagePipeline("Species Richness", load_cube, richness_clean, richness_aggregate, richness_figures),
+    PagePipeline("Top Observed Species", load_cube, top_clean, top_aggregate, top_figures),
+    PagePipeline("Species Activity by Region and Season", load_cube, activity_clean, activity_aggregate, activity_figures, activity_defaults),
+    PagePipeline("Temperature Bin by Habitat", load_cube, temperature_clean, temperature_aggregate, temperature_figures),
+    PagePipeline("Humidity Bin by Habitat", load_cube, humidity_clean, humidity_aggregate, humidity_figures),
+    PagePipeline("Sky Conditions", load_cube, sky_clean, sky_aggregate, sky_figures),
+    PagePipeline("Wind Conditions", load_cube, wind_clean, wind_aggregate, wind_figures),
+    PagePipeline("Seasonal Observation Counts", load_cube, seasonal_clean, seasonal_aggregate, seasonal_figures),
+    PagePipeline("Seasonal Time Factor", load_cube, time_factor_clean, time_factor_aggregate, time_factor_figures),
+    PagePipeline("Flyover Observed Species", load_cube, flyover_clean, flyover_aggregate, flyover_figures),
+    PagePipeline("Species Migration Patterns", load_cube, migration_clean, migration_aggregate, migration_figures),
+    PagePipeline("At-Risk Species & Conservation", load_cube, at_risk_clean, at_risk_aggregate, at_risk_figures),
+    PagePipeline("At-Risk Species & Conservation - Top 5 At-Risk Species", load_frame, watchlist_clean, watchlist_aggregate, watchlist_figures),
+    PagePipeline("High Activity Zones", load_cube, zones_clean, zones_aggregate, zones_figures, zones_defaults),
+]}
+
+
+#Runs a page end to end for a snapshot and returns its figures (defaults filled in for filters not given)
+def render_page(title, snapshot, **filters):
+    pipeline = PIPELINES[title]
+    source = pipeline.load(snapshot)
+    data = pipeline.clean(source)
+    filters = dict(pipeline.defaults(data), **filters)
+    return pipeline.figures(pipeline.aggregate(source, data, **filters))
+
+#Commands Used
+#PagePipeline(load, clean, aggregate, figures) – One page's stages as plain functions (no Streamlit calls)
+#cube.rollup() / cube.select()                 – Page data from the aggregate cube, filtered through its bitmap index
+#rollups.counts() / month_of_year()            – Year / month × species blocks of the temporal count matrices
+#groupby(observed=True).sum() / nunique()      – Grouped tables behind each chart
+#px.bar() / px.line() / go.Heatmap()           – Figures returned to the caller instead of drawn
+#render_page()                                 – Headless run of a page (benchmarks, exports)
+#collapse_tail()                               – Keeps the largest species as traces, the rest become one 'Other' trace
+#px.scatter(render_mode='webgl') + downsample() – WebGL points from a fixed-seed server-side sample above WEBGL_POINTS
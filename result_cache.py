@@ -0,0 +1,229 @@
+#Shared Result Cache
+  #One process-wide cache for the intermediate results of the dashboard pages: cleaned page frames,
+  #aggregate results, figures and widget option lists, keyed on the data snapshot token and what produced them.
+  #Why? → Apart from the parsed snapshot, every intermediate was recomputed per session; with dozens of rangers and
+  #analysts on one server the same cleaned frames and aggregates were built over and over, with no bound on memory.
+
+#Budget and eviction
+  #Entries are sized when stored (memory_usage(deep=True) for frames, the trace data arrays for figures) and the cache keeps
+  #their total under BIRD_RESULT_CACHE_MB (default 256 MB): least recently used entries are evicted first.
+  #Entries older than BIRD_RESULT_CACHE_TTL seconds (default 3600, 0 = never) are dropped when they are next looked up
+  #or when the cache evicts, so results of a replaced snapshot do not sit in memory until the budget pushes them out.
+  #A result larger than the whole budget is returned but not stored.
+  #Structures held elsewhere for the life of a snapshot (e.g. the temporal rollups) reserve their bytes with reserve():
+  #they are never evicted, but count against the budget and show up in the statistics under their kind.
+
+#Statistics
+  #stats() → entries, bytes, hits, misses, evictions and expirations, in total and per kind
+  #('clean', 'aggregate', 'figures', 'options'); shown in the sidebar diagnostics panel.
+
+#Sharing
+  #Cached values are shared between sessions and must not be modified by the caller.
+  #Computations run outside the lock, so a slow aggregate never blocks other sessions' lookups;
+  #two sessions missing the same key at once both compute it and the first stored value is kept.
+
+#Import required libraries
+import os                          #Budget and TTL from the environment
+import sys                         #Size estimate of small Python objects
+import threading                   #Guards the cache against concurrent Streamlit sessions
+import time                        #Entry ages for the TTL
+from collections import OrderedDict   #Least-recently-used order of the entries
+
+import numpy as np                 #Size estimate of figure data arrays
+import pandas as pd                #Size estimate of cached frames
+import plotly.graph_objects as go  #Size estimate of cached figures
+
+#Memory budget (BIRD_RESULT_CACHE_MB; BIRD_FIGURE_CACHE_MB is still read when it is the only one set)
+MEMORY_BUDGET = int(float(os.environ.get("BIRD_RESULT_CACHE_MB", os.environ.get("BIRD_FIGURE_CACHE_MB", 256))) * 2**20)
+
+#Seconds an entry stays valid after it was stored (BIRD_RESULT_CACHE_TTL, 0 = no expiry)
+TTL_SECONDS = float(os.environ.get("BIRD_RESULT_CACHE_TTL", 3600))
+
+#Kinds of results the pages store (statistics are kept per kind)
+KINDS = ['clean', 'aggregate', 'figures', 'options', 'rollups']
+
+
+#Trace properties holding per-point data (the bulk of a figure) and a fixed allowance for layout / trace settings
+FIGURE_ARRAYS = ['x', 'y', 'z', 'lat', 'lon', 'text', 'hovertext', 'customdata', 'ids', 'labels', 'values', 'locations']
+MARKER_ARRAYS = ['color', 'size']
+FIGURE_OVERHEAD = 8 * 1024
+TRACE_OVERHEAD = 1024
+
+
+#Estimated bytes of one trace property (arrays by nbytes, sequences at 8 bytes per item, strings by length)
+def _array_size(value):
+    if value is None:
+        return 0
+    if isinstance(value, np.ndarray):
+        return value.size * 8 if value.dtype == object else value.nbytes
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return 8 * len(value)
+    return 0
+
+
+#Estimated memory (bytes) of a figure from its traces' data arrays (no JSON encoding on the store path)
+def figure_size(figure):
+    size = FIGURE_OVERHEAD
+    for trace in figure.data:
+        size += TRACE_OVERHEAD
+        for name in FIGURE_ARRAYS:
+            size += _array_size(getattr(trace, name, None))
+        marker = getattr(trace, 'marker', None)
+        for name in MARKER_ARRAYS:
+            size += _array_size(getattr(marker, name, None))
+    return size
+
+
+#Estimated memory (bytes) of a cached value
+def estimate_size(value):
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        size = value.memory_usage(deep=True)
+        return int(size.sum() if hasattr(size, 'sum') else size)
+    if isinstance(value, go.Figure):
+        return figure_size(value)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+#Byte-Budgeted LRU / TTL Cache Shared by Every Session
+class ResultCache:
+    #budget -> bytes of cached values kept before the least recently used entries are evicted
+    #ttl    -> seconds an entry stays valid (0 / None = until evicted)
+    #clock  -> time source (time.monotonic), replaceable to test expiry
+    def __init__(self, budget=MEMORY_BUDGET, ttl=TTL_SECONDS, clock=time.monotonic):
+        self.budget = budget
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()   #key -> {'value', 'kind', 'size', 'stored'}
+        self._size = 0
+        self._reserved = {}             #key -> (kind, bytes) held outside the cache
+        self._counters = {}             #kind -> {'hits', 'misses', 'evictions', 'expirations'}
+        self._lock = threading.Lock()
+
+    def _count(self, kind, counter):
+        counters = self._counters.setdefault(kind, {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0})
+        counters[counter] += 1
+
+    def _expired(self, entry):
+        return bool(self.ttl) and self.clock() - entry['stored'] > self.ttl
+
+    def _remove(self, key, counter=None):
+        entry = self._entries.pop(key)
+        self._size -= entry['size']
+        if counter:
+            self._count(entry['kind'], counter)
+
+    #Cached value of the key, or `default` (expired entries are dropped; a hit or miss is counted for the kind)
+    def lookup(self, key, kind='result', default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                self._remove(key, 'expirations')
+                entry = None
+            if entry is None:
+                self._count(kind, 'misses')
+                return default
+            self._entries.move_to_end(key)
+            self._count(kind, 'hits')
+            return entry['value']
+
+    #Stores a value (size estimated unless given); returns the value kept for the key
+      #An entry another session stored meanwhile wins, so every session gets the same object
+    def store(self, key, value, kind='result', size=None):
+        size = estimate_size(value) if size is None else size
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._expired(entry):
+                return entry['value']
+            if entry is not None:
+                self._remove(key, 'expirations')
+            if size > self.budget:
+                return value                   #Larger than the whole cache → not kept
+            self._entries[key] = {'value': value, 'kind': kind, 'size': size, 'stored': self.clock()}
+            self._size += size
+            self._evict()
+        return value
+
+    #Cached value of the key, computing and storing it (outside the lock) on a miss
+    def get(self, key, compute, kind='result'):
+        missing = object()
+        value = self.lookup(key, kind, missing)
+        if value is not missing:
+            return value
+        return self.store(key, compute(), kind)
+
+    #Records (or updates) bytes held outside the cache under a key; cached entries are evicted to make room
+    def reserve(self, key, size, kind='result'):
+        with self._lock:
+            self._reserved[key] = (kind, int(size))
+            self._evict()
+
+    #Forgets a reservation (when the structure holding the memory is dropped)
+    def release(self, key):
+        with self._lock:
+            self._reserved.pop(key, None)
+
+    def _reserved_size(self):
+        return sum(size for _, size in self._reserved.values())
+
+    #Drops expired entries, then least recently used ones until the cache (and the reservations) fit its budget
+    def _evict(self):
+        if self.ttl:
+            for key in [key for key, entry in self._entries.items() if self._expired(entry)]:
+                self._remove(key, 'expirations')
+        reserved = self._reserved_size()
+        while self._size + reserved > self.budget and self._entries:
+            self._remove(next(iter(self._entries)), 'evictions')
+
+    #Totals and per-kind entries, bytes, hits, misses, evictions and expirations
+    def stats(self):
+        with self._lock:
+            kinds = {}
+            for kind, counters in self._counters.items():
+                kinds[kind] = dict(entries=0, bytes=0, **counters)
+            held = [(entry['kind'], entry['size']) for entry in self._entries.values()] + list(self._reserved.values())
+            for kind, size in held:
+                row = kinds.setdefault(kind, {'entries': 0, 'bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0})
+                row['entries'] += 1
+                row['bytes'] += size
+            lookups = sum(row['hits'] + row['misses'] for row in kinds.values())
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'reserved': self._reserved_size(),
+                'budget': self.budget,
+                'ttl': self.ttl,
+                'hits': sum(row['hits'] for row in kinds.values()),
+                'misses': sum(row['misses'] for row in kinds.values()),
+                'hit_rate': round(sum(row['hits'] for row in kinds.values()) / lookups, 3) if lookups else None,
+                'kinds': kinds
+            }
+
+    #stats() per kind as a table (one row per kind, for the diagnostics panel)
+    def stats_table(self):
+        kinds = self.stats()['kinds']
+        return pd.DataFrame([dict(kind=kind, **row) for kind, row in kinds.items()],
+                            columns=['kind', 'entries', 'bytes', 'hits', 'misses', 'evictions', 'expirations'])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+#Process-wide cache shared by every session
+RESULT_CACHE = ResultCache()
+
+#Commands Used
+#OrderedDict.move_to_end() / next(iter())   – Least-recently-used order and eviction
+#time.monotonic()                           – Entry age for the TTL (not affected by clock changes)
+#memory_usage(deep=True) / trace nbytes     – Size estimate of cached frames and figures (no JSON encode)
+#threading.Lock()                           – One cache shared safely by every Streamlit session
+#reserve() / release()                      – Memory held by long-lived structures counted against the budget
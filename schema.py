@@ -0,0 +1,188 @@
+#Observation Schema
+  #Column dtypes the dashboard pages rely on, applied once at ingest instead of on every page.
+  #Why? → Every cached copy of the data (in memory or on disk) then carries the same types.
+
+#Import required libraries
+import numpy as np                 #NumPy lookup table for month → season
+import pandas as pd                #Pandas to convert column dtypes
+
+#Date columns → datetime64
+DATE_COLUMNS = ['Date']
+
+#TRUE/FALSE columns → bool (nullable 'boolean' only when a workbook leaves cells empty)
+BOOL_COLUMNS = [
+    'Flyover_Observed',
+    'PIF_Watchlist_Status',
+    'Regional_Stewardship_Status',
+    'Initial_Three_Min_Cnt',
+    'Previously_Obs'
+]
+
+#Spellings of TRUE/FALSE found in the workbooks and CSV exports
+BOOL_VALUES = {'TRUE': True, 'FALSE': False, '1': True, '0': False, '1.0': True, '0.0': False}
+
+#Low-cardinality text columns → pandas categoricals (dictionary-encoded)
+  #Why? → The same few hundred strings repeat across millions of rows; storing small integer codes
+  #plus one dictionary cuts memory several times over and makes groupby on these columns faster
+CATEGORY_COLUMNS = [
+    'Admin_Unit_Code',
+    'Site_Name',
+    'Plot_Name',
+    'Location_Type',
+    'Observer',
+    'Interval_Length',
+    'ID_Method',
+    'Sex',
+    'Common_Name',
+    'Scientific_Name',
+    'AOU_Code',
+    'Sky',
+    'Wind',
+    'Disturbance'
+]
+
+#Distance bands, nearest first → ordered categorical with a fixed dictionary (code 0 = '<= 50 Meters', -1 = missing)
+  #Placeholders ('n/a', '-', blanks) and any text that is not one of the bands become missing
+  #Why? → The Species Distribution page stripped placeholder strings and mapped each band to its midpoint
+  #with a dict on every rerun; the band code now indexes DISTANCE_MIDPOINTS directly
+DISTANCE_COLUMN = 'Distance'
+DISTANCE_BANDS = [
+    '<= 50 Meters',
+    '50 - 100 Meters',
+    '100 - 200 Meters',
+    '200 - 300 Meters',
+    '300 - 500 Meters',
+    '500+ Meters'
+]
+DISTANCE_DTYPE = pd.CategoricalDtype(DISTANCE_BANDS, ordered=True)
+
+#Midpoint (meters) of each distance band, indexed by band code
+DISTANCE_MIDPOINTS = np.array([25, 75, 150, 250, 400, 600], dtype=np.int16)
+
+#Seasons, in calendar order starting with winter
+  #Winter: December, January, February
+  #Spring: March, April, May
+  #Summer: June, July, August
+  #Fall: September, October, November
+SEASONS = ['Winter', 'Spring', 'Summer', 'Fall']
+SEASON_DTYPE = pd.CategoricalDtype(SEASONS)
+
+#Season code for each month number (index 0 stands for an unknown month → code -1 = missing)
+MONTH_TO_SEASON_CODE = np.array([-1, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0], dtype=np.int8)
+
+
+#Converts a TRUE/FALSE column to bool; anything unrecognised ('n/a', '-', blanks) becomes <NA>
+def to_bool(series):
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    parsed = series.astype('string').str.strip().str.upper().map(BOOL_VALUES)
+    if parsed.isna().any():
+        return parsed.astype('boolean')
+    return parsed.astype(bool)
+
+
+#Converts a Distance column to band codes (DISTANCE_DTYPE); only the distinct texts are compared
+def to_distance_band(series):
+    if series.dtype == DISTANCE_DTYPE:
+        return series
+    codes, uniques = pd.factorize(series)
+    labels = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    band_codes = np.append(DISTANCE_DTYPE.categories.get_indexer(labels), -1)   #Extra slot for code -1 (missing cell)
+    return pd.Series(pd.Categorical.from_codes(band_codes[codes], dtype=DISTANCE_DTYPE), index=series.index)
+
+
+#Midpoint (meters) of each row's distance band as float (missing band → NaN)
+def distance_midpoints(series):
+    codes = series.cat.codes.to_numpy()
+    return np.where(codes >= 0, DISTANCE_MIDPOINTS[codes], np.nan)
+
+
+#Applies the base dtypes to a raw workbook frame (columns the frame does not have are skipped)
+def apply_base_dtypes(df):
+    for col in DATE_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+    for col in BOOL_COLUMNS:
+        if col in df.columns:
+            df[col] = to_bool(df[col])
+    if DISTANCE_COLUMN in df.columns:
+        df[DISTANCE_COLUMN] = to_distance_band(df[DISTANCE_COLUMN])
+    return df
+
+
+#Hour of day (0-23) from a Start_Time column holding datetime.time objects or 'HH:MM:SS' strings
+  #Only the distinct times are parsed (a survey has a few hundred start times), then mapped back by code
+def hour_of_day(series):
+    codes, uniques = pd.factorize(series)
+    seconds = pd.to_timedelta(pd.Series(uniques, dtype=object).astype(str), errors='coerce').dt.total_seconds()
+    hours = np.append((seconds // 3600).to_numpy(), np.nan)   #Extra slot for code -1 (missing time)
+    return pd.Series(hours[codes], index=series.index).astype('Int8')
+
+
+#Derives Year, Month, Season and Hour once at ingest as compact columns
+  #Why? → Pages used to run a Python season function row by row (.apply), which dominates at 10M rows;
+  #here the season comes from a 13-entry lookup array indexed by month number
+def add_time_columns(df):
+    if 'Date' in df.columns:
+        month = df['Date'].dt.month
+        df['Year'] = df['Date'].dt.year.astype('Int16')
+        df['Month'] = month.astype('Int8')
+        season_codes = MONTH_TO_SEASON_CODE[month.fillna(0).to_numpy(dtype=np.int8)]
+        df['Season'] = pd.Categorical.from_codes(season_codes, dtype=SEASON_DTYPE)
+    if 'Start_Time' in df.columns:
+        df['Hour'] = hour_of_day(df['Start_Time'])
+    return df
+
+
+#Shared dictionaries for the category columns across several frames (column -> CategoricalDtype)
+  #Categories are the sorted union of every frame's values, so forest and grassland (and every sheet)
+  #encode the same species/plot/sky value with the same code, whatever order the files arrive in
+def shared_categories(frames, columns=CATEGORY_COLUMNS):
+    dtypes = {}
+    for col in columns:
+        values = set()
+        for frame in frames:
+            if col not in frame.columns:
+                continue
+            if isinstance(frame[col].dtype, pd.CategoricalDtype):
+                values.update(frame[col].cat.categories)
+            else:
+                values.update(frame[col].dropna().unique())
+        if values:
+            dtypes[col] = pd.CategoricalDtype(sorted(values, key=str))
+    return dtypes
+
+
+#Encodes (or re-encodes) the category columns of a frame with the given dictionaries
+def apply_categories(df, dtypes):
+    for col, dtype in dtypes.items():
+        if col in df.columns:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+#Stacks frames whose category columns share one dictionary, so the result stays categorical
+  #(pd.concat falls back to object columns when the dictionaries differ)
+def concat_categorical(frames):
+    dtypes = shared_categories(frames)
+    frames = [apply_categories(frame, dtypes) for frame in frames]
+    return pd.concat(frames, ignore_index=True)
+
+
+#fillna() for a category column: the fill value is added to the dictionary first if it is new
+def fill_category(series, value):
+    if isinstance(series.dtype, pd.CategoricalDtype) and value not in series.cat.categories:
+        series = series.cat.add_categories([value])
+    return series.fillna(value)
+
+#Commands Used
+#pd.to_datetime(..., errors='coerce') – Invalid dates become NaT
+#astype('string').str.upper().map()   – Vectorized TRUE/FALSE parsing (no per-row Python calls)
+#astype('boolean')                    – Nullable bool, used only when some cells are missing
+#DISTANCE_DTYPE.categories.get_indexer() – Distinct distance texts → ordered band codes (unknown → -1)
+#DISTANCE_MIDPOINTS[codes]            – Vectorized band → midpoint lookup (replaces the DISTANCE_MAPPING dict)
+#pd.CategoricalDtype(sorted(...))     – One stable dictionary per column, shared by forest and grassland
+#astype(CategoricalDtype)             – Encodes strings (or re-maps codes) to the shared dictionary
+#MONTH_TO_SEASON_CODE[month]          – Vectorized month → season lookup (replaces get_season/map_season)
+#pd.Categorical.from_codes()          – Builds the Season column straight from the looked-up codes
+#pd.factorize() + pd.to_timedelta()   – Parses each distinct start time once to get the hour of day
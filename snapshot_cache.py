@@ -0,0 +1,182 @@
+#Columnar Snapshot Cache
+  #Converts every sheet of a workbook to a typed Parquet file the first time the workbook is loaded.
+  #Later loads (including fresh processes after a restart) read the Parquet files instead of parsing XLSX.
+  #Why? → openpyxl parsing is by far the slowest step of every page; a Parquet read takes milliseconds.
+
+#Invalidation
+  #A manifest next to the snapshot records the workbook's content hash (sha256).
+  #When the workbook's hash no longer matches, all of its sheets are converted again.
+
+#Import required libraries
+import json                        #Manifest describing which Parquet file holds which sheet
+import os                          #Snapshot folder, file paths and atomic renames
+import hashlib                     #Short hash of the workbook path so same-named files never collide
+import multiprocessing             #spawn context for the sheet-parsing process pool
+from concurrent.futures import ProcessPoolExecutor   #Parses sheets in parallel worker processes
+
+import pandas as pd                #Pandas to read Excel and Parquet files
+import stream_reader               #Chunked openpyxl read-only parsing of each sheet
+
+#pyarrow is optional – without it workbooks are simply parsed with openpyxl on every cold start
+try:
+    import pyarrow                 #Parquet engine used by pandas
+except ImportError:
+    pyarrow = None
+
+#Snapshot folder (override with the BIRD_SNAPSHOT_DIR environment variable)
+SNAPSHOT_DIR = os.environ.get(
+    "BIRD_SNAPSHOT_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".snapshots")
+)
+
+#Bump when the snapshot dtypes change so snapshots written by older code are rebuilt
+SNAPSHOT_VERSION = 3
+
+#Worker processes used to parse stale sheets (override with the BIRD_INGEST_WORKERS environment variable)
+MAX_WORKERS = int(os.environ.get("BIRD_INGEST_WORKERS", os.cpu_count() or 1))
+
+
+#File name prefix for a workbook's snapshot files: workbook stem + short hash of its absolute path
+def _snapshot_prefix(path):
+    path = os.path.abspath(path)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{stem}-{hashlib.sha1(path.encode()).hexdigest()[:8]}"
+
+
+def _manifest_path(path):
+    return os.path.join(SNAPSHOT_DIR, _snapshot_prefix(path) + ".manifest.json")
+
+
+def _read_manifest(path):
+    try:
+        with open(_manifest_path(path), encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+#Arrow needs one type per column; text columns mixing times, numbers and strings are stored as strings
+def _arrow_safe(df):
+    for col in df.columns:
+        if df[col].dtype == object:
+            kinds = df[col].dropna().map(type).unique()
+            if len(kinds) > 1:
+                df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+#Writes next to the target first, then renames, so readers never see a half-written file
+def _replace_atomic(target, write):
+    temp_path = target + ".tmp"
+    write(temp_path)
+    os.replace(temp_path, target)
+
+
+#Parses one sheet with the base dtypes applied (runs inside a worker process)
+  #Streamed in chunks (see stream_reader.py), so only one chunk of raw cells is held as Python objects at a time
+def read_typed_sheet(path, sheet_name):
+    chunks = list(stream_reader.xlsx_chunks(path, sheets=[sheet_name], categories=False))
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True)
+
+
+#Parses many (workbook, sheet) pairs at once, one sheet per worker process
+  #Why? → One sheet per admin unit; parsing them concurrently scales with cores instead of park count
+def parse_sheets(jobs, max_workers=MAX_WORKERS):
+    if len(jobs) <= 1 or max_workers <= 1:
+        return {job: read_typed_sheet(*job) for job in jobs}
+    #spawn (not fork) because the Streamlit server is multi-threaded
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs)), mp_context=context) as pool:
+        futures = {job: pool.submit(read_typed_sheet, *job) for job in jobs}
+        return {job: future.result() for job, future in futures.items()}
+
+
+#Sheet names of a workbook in workbook order
+def sheet_names(path):
+    with pd.ExcelFile(path) as workbook:
+        return workbook.sheet_names
+
+
+#Saves already-parsed sheets as Parquet snapshots (one file per sheet) plus the manifest
+def write_snapshot(path, digest, sheets):
+    if pyarrow is None:
+        return
+
+    prefix = _snapshot_prefix(path)
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "source": os.path.abspath(path),
+        "sha256": digest,
+        "sheets": {}
+    }
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        for position, (name, frame) in enumerate(sheets.items()):
+            file_name = f"{prefix}__{position:03d}.parquet"   #Sheet names may hold characters unsafe in file names
+            _replace_atomic(
+                os.path.join(SNAPSHOT_DIR, file_name),
+                lambda temp_path, frame=frame: _arrow_safe(frame.copy()).to_parquet(temp_path, index=False)
+            )
+            manifest["sheets"][name] = file_name
+
+        def write_manifest(temp_path):
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump(manifest, handle, indent=2)
+        _replace_atomic(_manifest_path(path), write_manifest)
+    except (OSError, ValueError, TypeError):
+        pass                           #Read-only folders or untypable columns still get the parsed sheets, just no snapshot
+
+
+#Reads a workbook's sheets from its Parquet snapshot; None when the snapshot is missing or stale
+def read_snapshot(path, digest):
+    manifest = _read_manifest(path)
+    if (
+        pyarrow is None
+        or manifest is None
+        or manifest.get("version") != SNAPSHOT_VERSION
+        or manifest.get("sha256") != digest
+    ):
+        return None
+    try:
+        return {
+            name: pd.read_parquet(os.path.join(SNAPSHOT_DIR, file_name))
+            for name, file_name in manifest["sheets"].items()
+        }
+    except OSError:
+        return None                    #Snapshot file deleted or unreadable → caller rebuilds it
+
+
+#Returns every sheet of several workbooks ({path: sha256} -> {path: {sheet name: DataFrame}})
+  #Fresh snapshots are read from Parquet; all sheets of all stale workbooks are parsed in one process pool
+def load_workbooks(digests, max_workers=MAX_WORKERS):
+    loaded = {}
+    stale = {}
+    for path, digest in digests.items():
+        sheets = read_snapshot(path, digest)
+        if sheets is None:
+            stale[path] = sheet_names(path)
+        else:
+            loaded[path] = sheets
+
+    jobs = [(path, name) for path, names in stale.items() for name in names]
+    parsed = parse_sheets(jobs, max_workers)
+    for path, names in stale.items():
+        sheets = {name: parsed[(path, name)] for name in names}
+        write_snapshot(path, digests[path], sheets)
+        loaded[path] = sheets
+    return loaded
+
+
+#Returns every sheet of one workbook, from its Parquet snapshot when it matches the workbook's hash
+def load_workbook_sheets(path, digest):
+    return load_workbooks({path: digest})[path]
+
+#Commands Used
+#pd.ExcelFile().sheet_names     – Lists the admin-unit sheets of a workbook
+#ProcessPoolExecutor            – Parses stale sheets concurrently, one sheet per worker process
+#stream_reader.xlsx_chunks()    – Parses one sheet in chunks (only when the snapshot is stale)
+#DataFrame.to_parquet()         – Writes a typed, columnar snapshot of one sheet
+#pd.read_parquet()              – Reads the snapshot back with dtypes intact (datetime64, bool)
+#os.replace()                   – Atomic rename so concurrent readers never see partial files
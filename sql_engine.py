@@ -0,0 +1,138 @@
+#Embedded SQL Query Engine
+  #Loads the cleaned forest + grassland observations into a file-backed analytical database
+  #(DuckDB when installed, SQLite otherwise) and answers SQL queries against it.
+  #Why? → Ad-hoc cuts and new pages can be written as one SQL statement instead of a new pandas pipeline,
+  #and DuckDB runs the aggregation vectorized on every core instead of scanning the frame in Python.
+
+#Table
+  #observations → every column of the cleaned frame (Year, Month, Season and Hour included)
+  #               plus Ecosystem ('Forest' / 'Grassland', the workbook each row came from)
+  #The database is rebuilt when the data changes (its _snapshot table records the snapshot token);
+  #it lives next to the Parquet snapshots and is shared by every process on the machine.
+
+#Queries
+  #query("SELECT ... WHERE Year = ?", [2018]) → DataFrame; use ? placeholders, they work on both engines.
+  #SQL pages (.sql files in sql_pages/) are discovered by the page registry, dashboard_pages.sql_pages(),
+  #and run their statement through query().
+
+#Import required libraries
+import os                          #Database path, atomic renames
+import sqlite3                     #Fallback engine from the standard library
+import sys                         #Command-line query text
+import threading                   #One database rebuild at a time per process
+from contextlib import closing     #Closes SQLite connections after each query
+
+import pandas as pd                #Pandas to hand frames to the engine and return query results
+import data_ingest                 #Shared, cached ingest layer (ObservationSnapshot)
+import snapshot_cache              #Snapshot folder shared with the Parquet cache
+
+#DuckDB is optional – without it the same queries run on SQLite (single-threaded, row-oriented)
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+ENGINE = "duckdb" if duckdb is not None else "sqlite"
+
+#Database file (override with the BIRD_SQL_DB environment variable)
+DATABASE_PATH = os.environ.get(
+    "BIRD_SQL_DB",
+    os.path.join(snapshot_cache.SNAPSHOT_DIR, f"observations.{ENGINE}")
+)
+
+TABLE_NAME = "observations"
+
+_build_lock = threading.RLock()
+
+
+#Observation frame ready for the database: object columns (times, mixed text) become strings
+def observation_table(snapshot):
+    frame = snapshot.frame.copy(deep=False)
+    for col in frame.columns:
+        if frame[col].dtype == object:
+            frame[col] = frame[col].astype("string")
+    frame.insert(0, "Ecosystem", pd.Categorical.from_codes(snapshot.ecosystem_codes(), categories=data_ingest.ECOSYSTEMS))
+    return frame
+
+
+#Token of the data a database file holds (None when the file is missing or unreadable)
+def database_token(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        if duckdb is not None:
+            with duckdb.connect(path, read_only=True) as con:
+                return con.execute("SELECT token FROM _snapshot").fetchone()[0]
+        with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as con:
+            return con.execute("SELECT token FROM _snapshot").fetchone()[0]
+    except Exception:
+        return None
+
+
+#Writes the observations of a snapshot to a new database file, then swaps it in atomically
+  #The temp file is per process, so batch report workers and the dashboard rebuilding the same path at once
+  #never write into (or delete) each other's file; the last os.replace wins with a complete database
+def write_database(snapshot, path):
+    frame = observation_table(snapshot)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    _remove_files(temp_path)                       #Left over by an earlier process with the same id
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    try:
+        if duckdb is not None:
+            with duckdb.connect(temp_path) as con:
+                con.register("observation_frame", frame)
+                con.execute(f"CREATE TABLE {TABLE_NAME} AS SELECT * FROM observation_frame")
+                con.execute("CREATE TABLE _snapshot AS SELECT ? AS token", [snapshot.token])
+        else:
+            with closing(sqlite3.connect(temp_path)) as con:
+                frame.to_sql(TABLE_NAME, con, index=False, chunksize=50_000)
+                con.execute("CREATE TABLE _snapshot (token TEXT)")
+                con.execute("INSERT INTO _snapshot VALUES (?)", [snapshot.token])
+                con.commit()
+        os.replace(temp_path, path)
+    finally:
+        _remove_files(temp_path)                   #Half-written file (and its journal) after a failure
+
+
+#Removes a database file and the journal / WAL files next to it, if there are any
+def _remove_files(path):
+    for name in (path, path + ".wal", path + "-journal"):
+        try:
+            os.remove(name)
+        except FileNotFoundError:
+            pass
+
+
+#Returns the database path for a snapshot, (re)building the file only when it holds other data
+  #Checked once per snapshot; another process may already have written the same data
+def ensure_database(snapshot, path=DATABASE_PATH):
+    def build(snapshot):
+        with _build_lock:
+            if database_token(path) != snapshot.token:
+                write_database(snapshot, path)
+        return path
+    return snapshot.derived(f"sql_database:{path}", build)
+
+
+#Runs a query against the current observations and returns the result as a DataFrame
+def query(sql, params=None):
+    path = ensure_database(data_ingest.load_snapshot())
+    if duckdb is not None:
+        with duckdb.connect(path, read_only=True) as con:
+            return con.execute(sql, params or []).df()
+    with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as con:
+        return pd.read_sql_query(sql, con, params=params)
+
+
+#Command line: python sql_engine.py "SELECT Season, COUNT(*) FROM observations GROUP BY Season"
+if __name__ == "__main__":
+    with pd.option_context("display.max_rows", 200, "display.width", 200):
+        print(query(" ".join(sys.argv[1:])))
+
+#Commands Used
+#duckdb.connect(read_only=True)   – Vectorized, multi-threaded engine over the database file
+#con.register() + CREATE TABLE AS – Loads the cleaned frame straight from pandas (categoricals become ENUMs)
+#DataFrame.to_sql()               – SQLite fallback when duckdb is not installed
+#os.replace()                     – Swaps in a rebuilt database without readers seeing a partial file
+#os.getpid()                      – Per-process temp file, so concurrent rebuilds never touch each other's file
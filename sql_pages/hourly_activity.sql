@@ -0,0 +1,15 @@
+-- title: Hourly Activity
+-- description: Observations by survey start hour in each habitat, showing when birds are most often recorded.
+-- chart: line
+-- x: Hour
+-- y: Observations
+-- color: Location_Type
+SELECT
+    Hour,
+    Location_Type,
+    COUNT(*) AS Observations
+FROM observations
+WHERE Hour IS NOT NULL
+  AND Location_Type IS NOT NULL
+GROUP BY Hour, Location_Type
+ORDER BY Hour, Location_Type
@@ -0,0 +1,15 @@
+-- title: Observer Effort
+-- description: Observations and distinct species recorded by each observer in forest and grassland surveys.
+-- chart: bar
+-- x: Observer
+-- y: Observations
+-- color: Ecosystem
+SELECT
+    Observer,
+    Ecosystem,
+    COUNT(*) AS Observations,
+    COUNT(DISTINCT Common_Name) AS Species
+FROM observations
+WHERE Observer IS NOT NULL
+GROUP BY Observer, Ecosystem
+ORDER BY Observations DESC
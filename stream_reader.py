@@ -0,0 +1,192 @@
+#Streaming Workbook / CSV Reader
+  #Reads bird monitoring workbooks (openpyxl read-only mode) and CSV exports in chunks of rows,
+  #keeping only the columns the caller asks for, and yields each chunk already typed (schema.py dtypes).
+  #Why? → pd.read_excel builds every cell of all 29 columns as Python objects before the frame exists;
+  #a page such as "Sky Conditions" needs two of them, and multi-GB survey exports do not fit in memory at all.
+
+#Column projection
+  #columns=None reads every column; otherwise only the listed ones are kept (in that order).
+  #Derived columns can be requested too: Year / Month / Season are computed from Date and Hour from Start_Time,
+  #so those source columns are read and dropped again when they were not requested themselves.
+  #Admin_Unit_Code falls back to the sheet name for rows (or sheets) without one, as in data_ingest.combine_sheets.
+
+#Memory
+  #Only one chunk of raw rows (CHUNK_SIZE, override with BIRD_STREAM_CHUNK_ROWS) is held as Python objects at a time;
+  #category columns are dictionary-encoded per chunk, so a chunk costs a few bytes per kept cell.
+  #count_rows() aggregates a whole file chunk by chunk, so its peak memory does not grow with the file.
+
+#Usage
+  #python stream_reader.py Bird_Monitoring_Data_FOREST.XLSX --columns Location_Type Sky
+  #python stream_reader.py survey_export.csv --columns Year Common_Name --top 20
+
+#Import required libraries
+import argparse                    #Command line for streamed counts
+import os                          #File extensions and the chunk-size override
+
+import pandas as pd                #Pandas to build and type each chunk
+import schema                      #Typed columns (Date → datetime64, TRUE/FALSE → bool, categories)
+
+#Rows per chunk (override with the BIRD_STREAM_CHUNK_ROWS environment variable)
+CHUNK_SIZE = int(os.environ.get("BIRD_STREAM_CHUNK_ROWS", 100_000))
+
+#Columns computed by schema.add_time_columns → the raw column they come from
+DERIVED_COLUMNS = {'Year': 'Date', 'Month': 'Date', 'Season': 'Date', 'Hour': 'Start_Time'}
+
+#File extensions read as CSV (anything else is opened as a workbook)
+CSV_EXTENSIONS = ('.csv', '.csv.gz', '.csv.zip', '.txt')
+
+
+#Cell texts read as missing values (pandas' default na_values, so workbook chunks match pd.read_excel / pd.read_csv)
+NA_STRINGS = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+
+#Raw columns to read for the requested columns (derived columns replaced by their source), in order
+def source_columns(columns):
+    sources = []
+    for col in columns:
+        col = DERIVED_COLUMNS.get(col, col)
+        if col not in sources:
+            sources.append(col)
+    return sources
+
+
+#Missing-value texts → NaN in the text columns of a raw workbook chunk, then numeric columns retyped
+  #Columns left without any value become float64 NaN, as pd.read_excel returns them
+def na_cells(frame):
+    for col in frame.columns:
+        values = frame[col]
+        if not (values.dtype == object or pd.api.types.is_string_dtype(values.dtype)):
+            continue
+        values = values.mask(values.isin(NA_STRINGS))
+        frame[col] = values.astype('float64') if values.isna().all() else values.infer_objects()
+    return frame
+
+
+#Types one chunk of raw rows and keeps only the requested columns
+  #dtypes     → {column: CategoricalDtype} shared dictionaries; without them category columns get per-chunk dictionaries
+  #categories → False keeps text columns as plain objects (same as a pd.read_excel frame)
+def type_chunk(frame, columns=None, dtypes=None, categories=True):
+    frame.columns = frame.columns.str.strip()
+    frame = schema.add_time_columns(schema.apply_base_dtypes(frame))
+    if columns is not None:
+        frame = frame[[col for col in columns if col in frame.columns]]
+    if dtypes:
+        frame = schema.apply_categories(frame, dtypes)
+    elif categories:
+        for col in schema.CATEGORY_COLUMNS:
+            if col in frame.columns:
+                frame[col] = frame[col].astype('category')
+    return frame
+
+
+#Typed chunks of the sheets of a workbook (openpyxl read-only mode: rows are parsed as they are read)
+  #sheets → sheet names to read (default: every sheet, in workbook order)
+def xlsx_chunks(path, columns=None, chunk_size=CHUNK_SIZE, sheets=None, dtypes=None, categories=True):
+    from openpyxl import load_workbook
+
+    wanted = None if columns is None else source_columns(columns)
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for name in sheets or workbook.sheetnames:
+            rows = workbook[name].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                continue
+            header = ["" if cell is None else str(cell).strip() for cell in header]
+            keep = [i for i, col in enumerate(header) if col and (wanted is None or col in wanted)]
+            names = [header[i] for i in keep]
+            add_unit = (wanted is None or 'Admin_Unit_Code' in wanted) and 'Admin_Unit_Code' not in names
+
+            def chunk(block):
+                frame = na_cells(pd.DataFrame.from_records(block, columns=names, coerce_float=True))
+                if add_unit:
+                    frame.insert(0, 'Admin_Unit_Code', name)
+                elif 'Admin_Unit_Code' in frame.columns:
+                    frame['Admin_Unit_Code'] = frame['Admin_Unit_Code'].fillna(name)
+                return type_chunk(frame, columns, dtypes, categories)
+
+            block = []
+            empty = 0                          #Empty rows held back: kept between data rows, dropped at the end of the sheet
+            for row in rows:
+                if all(cell is None for cell in row):
+                    empty += 1
+                    continue
+                block.extend([None] * len(keep) for _ in range(empty))
+                empty = 0
+                block.append([row[i] if i < len(row) else None for i in keep])
+                if len(block) >= chunk_size:
+                    yield chunk(block)
+                    block = []
+            if block:
+                yield chunk(block)
+    finally:
+        workbook.close()                       #Read-only workbooks keep the file open until closed
+
+
+#Typed chunks of a CSV export (only the requested columns are parsed)
+def csv_chunks(path, columns=None, chunk_size=CHUNK_SIZE, dtypes=None, categories=True):
+    wanted = None if columns is None else set(source_columns(columns))
+    usecols = None if wanted is None else (lambda col: col.strip() in wanted)
+    #Text columns are read as strings so chunks do not guess different types for the same column
+    text = {col: str for col in schema.CATEGORY_COLUMNS + [schema.DISTANCE_COLUMN]}
+    for frame in pd.read_csv(path, usecols=usecols, chunksize=chunk_size, dtype=text, low_memory=False):
+        yield type_chunk(frame, columns, dtypes, categories)
+
+
+#Typed chunks of a workbook or CSV export, chosen by file extension
+def read_chunks(path, columns=None, chunk_size=CHUNK_SIZE, dtypes=None, categories=True):
+    if str(path).lower().endswith(CSV_EXTENSIONS):
+        return csv_chunks(path, columns, chunk_size, dtypes, categories)
+    return xlsx_chunks(path, columns, chunk_size, dtypes=dtypes, categories=categories)
+
+
+#Whole file as one frame of the requested columns (chunks stacked with one shared dictionary per category column)
+def read_frame(path, columns=None, chunk_size=CHUNK_SIZE):
+    frames = list(read_chunks(path, columns, chunk_size))
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return schema.concat_categorical(frames)
+
+
+#Observation counts per combination of the requested columns, aggregated chunk by chunk
+  #Only the running counts (one row per combination seen so far) are kept between chunks
+def count_rows(path, columns, chunk_size=CHUNK_SIZE):
+    columns = list(columns)
+    counts = None
+    for frame in read_chunks(path, columns, chunk_size, categories=False):
+        chunk_counts = frame.groupby(columns, dropna=False).size()
+        counts = chunk_counts if counts is None else counts.add(chunk_counts, fill_value=0)
+    if counts is None:
+        return pd.Series(dtype='int64', name='Count')
+    return counts.astype('int64').sort_values(ascending=False).rename('Count')
+
+
+#Command line: streamed counts per combination of columns
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream a workbook or CSV export and count observations per column values")
+    parser.add_argument("path", help="XLSX workbook or CSV export")
+    parser.add_argument("--columns", nargs="+", required=True, metavar="COLUMN", help="columns to group by (Year / Month / Season / Hour allowed)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="rows per chunk")
+    parser.add_argument("--top", type=int, default=50, help="combinations to print")
+    args = parser.parse_args(argv)
+
+    counts = count_rows(args.path, args.columns, args.chunk_size)
+    with pd.option_context("display.max_rows", args.top, "display.width", 200):
+        print(counts.head(args.top).to_string())
+    print(f"{int(counts.sum()):,} observations, {len(counts):,} combinations")
+
+
+if __name__ == "__main__":
+    main()
+
+#Commands Used
+#load_workbook(read_only=True, data_only=True) – Streams worksheet rows instead of loading every cell
+#ws.iter_rows(values_only=True)                 – One tuple of cell values per row
+#pd.DataFrame.from_records(block, columns=...)  – One chunk of the projected columns
+#Series.mask(isin(NA_STRINGS))                  – Same missing-value texts as pd.read_excel
+#pd.read_csv(usecols=..., chunksize=...)        – CSV exports parsed chunk by chunk, unused columns skipped
+#schema.apply_base_dtypes() / add_time_columns() – Same dtypes and Year / Month / Season / Hour as the ingest layer
+#Series.add(fill_value=0)                       – Running counts merged across chunks
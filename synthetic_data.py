@@ -0,0 +1,452 @@
+#Synthetic Bird Observations
+  #Generates forest- and grassland-shaped observation frames, workbooks and CSV files with the exact
+  #29-column schemas of the monitoring workbooks, for load and scale testing.
+  #Why? → The real workbooks hold ~4K rows and cannot leave the network; benchmarks and ingest tests need
+  #millions of rows that look like them (same columns, dtypes, cardinalities, seasonality and messy values).
+
+#What is reproduced
+  #Schemas     → forest has Site_Name + NPSTaxonCode, grassland has TaxonCode + Previously_Obs (same column order as the files)
+  #Surveys     → rows come in point-count visits: one plot / date / start time / observer / weather per visit, several species rows each
+  #Cardinality → 11 admin units for forest, 4 for grassland; PLOTS_PER_UNIT plots per unit; ~70 species with a few very common ones,
+                #habitat specialists recorded in their own habitat only
+  #Seasonality → most visits fall in the May-July breeding season; temperature follows the month
+  #Messy data  → missing Sex / Distance / AcceptedTSN, 'n/a' distances, exact duplicate rows in grassland (~13% in the real file)
+
+#Streaming
+  #generate_chunks() yields frames of at most chunk_size rows; nothing else is kept between chunks,
+  #so writing tens of millions of rows to CSV runs in constant memory.
+
+#Usage
+  #python synthetic_data.py csv grassland grassland_10m.csv --rows 10000000
+  #python synthetic_data.py workbook forest Bird_Monitoring_Data_FOREST.XLSX --rows 200000
+
+#Import required libraries
+import argparse                    #Command-line options
+import datetime as dt              #Start/End_Time cells as datetime.time (what openpyxl returns for the real files)
+import os                          #Output paths
+
+import numpy as np                 #NumPy vectorized random draws for each chunk
+import pandas as pd                #Pandas frames in the raw workbook shape
+import data_ingest                 #Cleaning shared with the real workbooks (ObservationSnapshot)
+import schema                      #Category columns of the typed schema
+
+#Column order of each workbook (29 columns each)
+FOREST_COLUMNS = [
+    'Admin_Unit_Code', 'Sub_Unit_Code', 'Site_Name', 'Plot_Name', 'Location_Type', 'Year', 'Date',
+    'Start_Time', 'End_Time', 'Observer', 'Visit', 'Interval_Length', 'ID_Method', 'Distance',
+    'Flyover_Observed', 'Sex', 'Common_Name', 'Scientific_Name', 'AcceptedTSN', 'NPSTaxonCode', 'AOU_Code',
+    'PIF_Watchlist_Status', 'Regional_Stewardship_Status', 'Temperature', 'Humidity', 'Sky', 'Wind',
+    'Disturbance', 'Initial_Three_Min_Cnt'
+]
+GRASSLAND_COLUMNS = [
+    'Admin_Unit_Code', 'Sub_Unit_Code', 'Plot_Name', 'Location_Type', 'Year', 'Date',
+    'Start_Time', 'End_Time', 'Observer', 'Visit', 'Interval_Length', 'ID_Method', 'Distance',
+    'Flyover_Observed', 'Sex', 'Common_Name', 'Scientific_Name', 'AcceptedTSN', 'TaxonCode', 'AOU_Code',
+    'PIF_Watchlist_Status', 'Regional_Stewardship_Status', 'Temperature', 'Humidity', 'Sky', 'Wind',
+    'Disturbance', 'Previously_Obs', 'Initial_Three_Min_Cnt'
+]
+COLUMNS = {'forest': FOREST_COLUMNS, 'grassland': GRASSLAND_COLUMNS}
+
+#Admin units (one sheet each) surveyed in each habitat
+ADMIN_UNITS = {
+    'forest': ['ANTI', 'CATO', 'CHOH', 'GWMP', 'HAFE', 'MANA', 'MONO', 'NACE', 'PRWI', 'ROCR', 'WOTR'],
+    'grassland': ['ANTI', 'HAFE', 'MANA', 'MONO']
+}
+
+#Plots per admin unit and the first plot number (forest and grassland plots never share a name)
+PLOTS_PER_UNIT = {'forest': 40, 'grassland': 25}
+FIRST_PLOT = {'forest': 1, 'grassland': 50}
+
+#Share of forest rows in the real forest + grassland workbooks (333 of 3,921)
+FOREST_SHARE = 333 / 3921
+
+#Exact duplicate rows in the real files (grassland: 458 of 3,588)
+DUPLICATE_RATE = {'forest': 0.0, 'grassland': 458 / 3588}
+
+#Species rows recorded per visit (average)
+ROWS_PER_VISIT = 8
+
+CHUNK_SIZE = 250_000
+YEARS = list(range(2014, 2024))
+
+#Species: (Common_Name, Scientific_Name, AOU_Code, preferred habitat or None)
+SPECIES = [
+    ('Eastern Towhee', 'Pipilo erythrophthalmus', 'EATO', 'forest'),
+    ('Wood Thrush', 'Hylocichla mustelina', 'WOTH', 'forest'),
+    ('Northern Cardinal', 'Cardinalis cardinalis', 'NOCA', None),
+    ('Field Sparrow', 'Spizella pusilla', 'FISP', 'grassland'),
+    ('American Crow', 'Corvus brachyrhynchos', 'AMCR', None),
+    ('Red-bellied Woodpecker', 'Melanerpes carolinus', 'RBWO', 'forest'),
+    ('White-breasted Nuthatch', 'Sitta carolinensis', 'WBNU', 'forest'),
+    ('Orchard Oriole', 'Icterus spurius', 'OROR', 'grassland'),
+    ('Northern Mockingbird', 'Mimus polyglottos', 'NOMO', 'grassland'),
+    ('Chipping Sparrow', 'Spizella passerina', 'CHSP', 'grassland'),
+    ('Indigo Bunting', 'Passerina cyanea', 'INBU', 'grassland'),
+    ('Baltimore Oriole', 'Icterus galbula', 'BAOR', None),
+    ('Blue-gray Gnatcatcher', 'Polioptila caerulea', 'BGGN', 'forest'),
+    ('Barn Swallow', 'Hirundo rustica', 'BARS', 'grassland'),
+    ('Song Sparrow', 'Melospiza melodia', 'SOSP', 'grassland'),
+    ('Eastern Kingbird', 'Tyrannus tyrannus', 'EAKI', 'grassland'),
+    ('Carolina Wren', 'Thryothorus ludovicianus', 'CARW', 'forest'),
+    ('Cedar Waxwing', 'Bombycilla cedrorum', 'CEDW', None),
+    ('Black Vulture', 'Coragyps atratus', 'BLVU', None),
+    ('Grasshopper Sparrow', 'Ammodramus savannarum', 'GRSP', 'grassland'),
+    ('Eastern Meadowlark', 'Sturnella magna', 'EAME', 'grassland'),
+    ('House Finch', 'Haemorhous mexicanus', 'HOFI', 'grassland'),
+    ('Eastern Bluebird', 'Sialia sialis', 'EABL', 'grassland'),
+    ('Scarlet Tanager', 'Piranga olivacea', 'SCTA', 'forest'),
+    ('Eastern Wood-Pewee', 'Contopus virens', 'EAWP', 'forest'),
+    ('Brown-headed Cowbird', 'Molothrus ater', 'BHCO', None),
+    ('Blue Jay', 'Cyanocitta cristata', 'BLJA', 'forest'),
+    ('European Starling', 'Sturnus vulgaris', 'EUST', 'grassland'),
+    ('Tree Swallow', 'Tachycineta bicolor', 'TRES', 'grassland'),
+    ('Red-winged Blackbird', 'Agelaius phoeniceus', 'RWBL', 'grassland'),
+    ('Fish Crow', 'Corvus ossifragus', 'FICR', None),
+    ('Common Grackle', 'Quiscalus quiscula', 'COGR', None),
+    ('Eastern Tufted Titmouse', 'Baeolophus bicolor', 'ETTI', 'forest'),
+    ('Mourning Dove', 'Zenaida macroura', 'MODO', 'grassland'),
+    ('American Redstart', 'Setophaga ruticilla', 'AMRE', 'forest'),
+    ('Horned Lark', 'Eremophila alpestris', 'HOLA', 'grassland'),
+    ('Gray Catbird', 'Dumetella carolinensis', 'GRCA', None),
+    ('Warbling Vireo', 'Vireo gilvus', 'WAVI', None),
+    ('American Robin', 'Turdus migratorius', 'AMRO', None),
+    ('American Goldfinch', 'Spinus tristis', 'AMGO', 'grassland'),
+    ('Yellow-billed Cuckoo', 'Coccyzus americanus', 'YBCU', 'forest'),
+    ('House Wren', 'Troglodytes aedon', 'HOWR', None),
+    ('Northern Parula', 'Setophaga americana', 'NOPA', 'forest'),
+    ('Downy Woodpecker', 'Dryobates pubescens', 'DOWO', 'forest'),
+    ('Great Crested Flycatcher', 'Myiarchus crinitus', 'GCFL', 'forest'),
+    ('Red-shouldered Hawk', 'Buteo lineatus', 'RSHA', 'forest'),
+    ('Acadian Flycatcher', 'Empidonax virescens', 'ACFL', 'forest'),
+    ('Carolina Chickadee', 'Poecile carolinensis', 'CACH', 'forest'),
+    ('Red-eyed Vireo', 'Vireo olivaceus', 'REVI', 'forest'),
+    ('Ovenbird', 'Seiurus aurocapilla', 'OVEN', 'forest'),
+    ('Pileated Woodpecker', 'Dryocopus pileatus', 'PIWO', 'forest'),
+    ('Hairy Woodpecker', 'Dryobates villosus', 'HAWO', 'forest'),
+    ('Louisiana Waterthrush', 'Parkesia motacilla', 'LOWA', 'forest'),
+    ('Kentucky Warbler', 'Geothlypis formosa', 'KEWA', 'forest'),
+    ('Worm-eating Warbler', 'Helmitheros vermivorum', 'WEWA', 'forest'),
+    ('Yellow-throated Vireo', 'Vireo flavifrons', 'YTVI', 'forest'),
+    ('White-eyed Vireo', 'Vireo griseus', 'WEVI', None),
+    ('Common Yellowthroat', 'Geothlypis trichas', 'COYE', 'grassland'),
+    ('Prairie Warbler', 'Setophaga discolor', 'PRAW', 'grassland'),
+    ('Yellow-breasted Chat', 'Icteria virens', 'YBCH', 'grassland'),
+    ('Northern Flicker', 'Colaptes auratus', 'NOFL', None),
+    ('Turkey Vulture', 'Cathartes aura', 'TUVU', None),
+    ('Eastern Phoebe', 'Sayornis phoebe', 'EAPH', None),
+    ('Ruby-throated Hummingbird', 'Archilochus colubris', 'RTHU', None),
+    ('Savannah Sparrow', 'Passerculus sandwichensis', 'SAVS', 'grassland'),
+    ('Bobolink', 'Dolichonyx oryzivorus', 'BOBO', 'grassland'),
+    ('Killdeer', 'Charadrius vociferus', 'KILL', 'grassland'),
+    ('Red-tailed Hawk', 'Buteo jamaicensis', 'RTHA', 'grassland'),
+    ('Wild Turkey', 'Meleagris gallopavo', 'WITU', None),
+    ('Hooded Warbler', 'Setophaga citrina', 'HOWA', 'forest'),
+]
+
+#Species on the Partners in Flight watchlist / of regional stewardship concern (per species, as in the files)
+WATCHLIST_SPECIES = {'WOTH', 'KEWA', 'PRAW', 'WEWA', 'BOBO', 'YBCU'}
+STEWARDSHIP_SPECIES = {'EATO', 'WOTH', 'FISP', 'GRSP', 'EAME', 'SCTA', 'ACFL', 'LOWA', 'KEWA', 'WEWA', 'PRAW', 'YBCH', 'RSHA', 'EAWP'}
+
+#Share of visits per month (January..December): surveys concentrate in the breeding season
+MONTH_WEIGHTS = np.array([1, 1, 2, 4, 22, 30, 24, 6, 4, 3, 2, 1], dtype=float)
+
+#Mean temperature (°C) per month (January..December)
+MONTH_TEMPERATURE = np.array([2, 4, 9, 15, 20, 25, 27, 26, 22, 16, 10, 4], dtype=float)
+
+#Text values and their relative frequency
+OBSERVERS = ['Elizabeth Oswald', 'Brian Swimelar', 'Kimberly Serno', 'Jennifer Hoffman', 'Sarah Hughes', 'Matthew Kemp']
+INTERVALS = (['0-2.5 min', '2.5 - 5 min', '5 - 7.5 min', '7.5 - 10 min'], [0.55, 0.2, 0.15, 0.1])
+ID_METHODS = (['Singing', 'Calling', 'Visualization'], [0.7, 0.2, 0.1])
+DISTANCES = {
+    'forest': (['<= 50 Meters', '50 - 100 Meters', '100 - 200 Meters', 'n/a', None], [0.5, 0.4, 0.06, 0.02, 0.02]),
+    'grassland': (['<= 50 Meters', '50 - 100 Meters', '100 - 200 Meters', '200 - 300 Meters', 'n/a', None], [0.35, 0.4, 0.15, 0.06, 0.02, 0.02])
+}
+SEXES = (['Male', 'Female', 'Undetermined', None], [0.28, 0.03, 0.03, 0.66])
+SKIES = (['Clear or Few Clouds', 'Partly Cloudy (scattered) or Variable Sky', 'Cloudy/Overcast', 'Fog', 'Mist/Drizzle'], [0.4, 0.3, 0.25, 0.03, 0.02])
+WINDS = ([
+    'Calm (< 1 mph) smoke rises vertically',
+    'Light air movement (1-3 mph) smoke drifts',
+    'Light breeze (4-7 mph) wind felt on face',
+    'Gentle breeze (8-12 mph) leaves rustle',
+    'Moderate breeze (13-18 mph) small branches move'
+], [0.35, 0.35, 0.2, 0.08, 0.02])
+DISTURBANCES = (['No effect on count', 'Slight effect on count', 'Moderate effect on count', 'Serious effect on count'], [0.8, 0.14, 0.05, 0.01])
+
+#Start times: every minute from 05:00 to 10:59; visits last 10 minutes
+START_MINUTES = np.arange(5 * 60, 11 * 60)
+TIMES = np.array([dt.time(minute // 60, minute % 60) for minute in range(24 * 60)], dtype=object)
+
+#Largest number of data rows in one Excel sheet (header row excluded)
+EXCEL_MAX_ROWS = 1_048_575
+
+
+#Species table with any extra synthetic species needed to reach `count` (common, scientific, AOU, habitat)
+def species_table(count=None):
+    species = list(SPECIES)
+    for number in range(len(species) + 1, (count or 0) + 1):
+        species.append((f'Synthetic Species {number:04d}', f'Avis synthetica {number:04d}', f'S{number:03d}'[-4:], None))
+    return species[:count] if count else species
+
+
+#Relative frequency of each species in a habitat: a few species dominate (Zipf-like),
+#preferred-habitat species are more common and specialists of the other habitat are never recorded
+  #Why? → In the real files many species occur in one habitat only (the At-Risk page depends on it)
+def species_weights(species, habitat, seed=0):
+    rank = np.random.default_rng(seed).permutation(len(species)) + 1
+    preference = np.array([3.0 if pref == habitat else 0.0 if pref else 1.0 for *_, pref in species])
+    weights = preference / rank ** 0.8
+    return weights / weights.sum()
+
+
+#Draws n values from (values, weights) as an object array (None stays a missing cell)
+def _choice(rng, n, values, weights=None):
+    weights = None if weights is None else np.asarray(weights, dtype=float) / np.sum(weights)
+    return np.array(values, dtype=object)[rng.choice(len(values), size=n, p=weights)]
+
+
+#Observation Generator for One Habitat
+class ObservationGenerator:
+    #habitat        -> 'forest' or 'grassland' (decides the columns, admin units, plots and species preferences)
+    #years          -> survey years
+    #species        -> number of species (extra synthetic species are added beyond the ~70 real ones)
+    #plots_per_unit -> plots in each admin unit
+    #duplicate_rate -> share of rows repeating the previous row exactly
+    def __init__(self, habitat, seed=0, years=YEARS, species=None, plots_per_unit=None, duplicate_rate=None):
+        if habitat not in COLUMNS:
+            raise ValueError(f"Unknown habitat {habitat!r}; expected one of {', '.join(COLUMNS)}")
+        self.habitat = habitat
+        self.columns = COLUMNS[habitat]
+        self.years = np.asarray(list(years), dtype=np.int64)
+        self.units = ADMIN_UNITS[habitat]
+        self.plots_per_unit = plots_per_unit or PLOTS_PER_UNIT[habitat]
+        self.duplicate_rate = DUPLICATE_RATE[habitat] if duplicate_rate is None else duplicate_rate
+        self.rng = np.random.default_rng([seed, data_ingest.HABITATS.index(habitat)])
+
+        #Plots (unit-major order) and the admin unit / site of each
+        first = FIRST_PLOT[habitat]
+        self.plot_names = np.array([
+            f"{unit}-{number:04d}" for unit in self.units for number in range(first, first + self.plots_per_unit)
+        ], dtype=object)
+        self.plot_units = np.repeat(np.array(self.units, dtype=object), self.plots_per_unit)
+        self.plot_sites = np.array([
+            f"{unit} {1 + index // 10}" for unit in self.units for index in range(self.plots_per_unit)
+        ], dtype=object)
+        self.plot_weights = self.rng.gamma(2.0, size=len(self.plot_names))
+        self.plot_weights /= self.plot_weights.sum()
+
+        #Species attributes, looked up by species index
+        species = species_table(species)
+        self.common_names = np.array([row[0] for row in species], dtype=object)
+        self.scientific_names = np.array([row[1] for row in species], dtype=object)
+        self.aou_codes = np.array([row[2] for row in species], dtype=object)
+        self.taxon_codes = 76625 + (np.arange(len(species)) * 7919) % 850000
+        self.tsn = (174999 + (np.arange(len(species)) * 104729) % 775000).astype(float)
+        self.watchlist = np.isin(self.aou_codes, list(WATCHLIST_SPECIES))
+        self.stewardship = np.isin(self.aou_codes, list(STEWARDSHIP_SPECIES))
+        self.species_weights = species_weights(species, habitat, seed)
+
+    #Visit-level columns (one value per survey visit)
+    def _visits(self, n):
+        rng = self.rng
+        plot = rng.choice(len(self.plot_names), size=n, p=self.plot_weights)
+        month = rng.choice(12, size=n, p=MONTH_WEIGHTS / MONTH_WEIGHTS.sum())
+        year = self.years[rng.integers(0, len(self.years), n)]
+        month_start = ((year - 1970) * 12 + month).astype('datetime64[M]')
+        days_in_month = ((month_start + 1).astype('datetime64[D]') - month_start.astype('datetime64[D]')).astype(np.int64)
+        date = month_start.astype('datetime64[D]') + (rng.random(n) * days_in_month).astype(np.int64)
+        start = START_MINUTES[rng.integers(0, len(START_MINUTES), n)]
+        return {
+            'plot': plot,
+            'Year': year,
+            'Date': date.astype('datetime64[ns]'),
+            'Start_Time': TIMES[start],
+            'End_Time': TIMES[start + 10],
+            'Observer': _choice(rng, n, OBSERVERS),
+            'Visit': rng.integers(1, 4, n),
+            'Temperature': np.round(MONTH_TEMPERATURE[month] + rng.normal(0, 4, n), 1),
+            'Humidity': np.round(np.clip(rng.normal(68, 14, n), 20, 99), 1),
+            'Sky': _choice(rng, n, *SKIES),
+            'Wind': _choice(rng, n, *WINDS),
+            'Disturbance': _choice(rng, n, *DISTURBANCES)
+        }
+
+    #One frame of n rows in the raw workbook shape (what pd.read_excel returns for a sheet)
+    def chunk(self, n):
+        rng = self.rng
+        visits = self._visits(max(1, -(-n // ROWS_PER_VISIT)))
+        visit = np.sort(rng.integers(0, len(visits['plot']), n))   #Rows of one visit stay together
+        plot = visits['plot'][visit]
+        species = rng.choice(len(self.common_names), size=n, p=self.species_weights)
+
+        columns = {
+            'Admin_Unit_Code': self.plot_units[plot],
+            'Sub_Unit_Code': np.full(n, np.nan),
+            'Site_Name': self.plot_sites[plot],
+            'Plot_Name': self.plot_names[plot],
+            'Location_Type': np.full(n, self.habitat.title(), dtype=object),
+            'Interval_Length': _choice(rng, n, *INTERVALS),
+            'ID_Method': _choice(rng, n, *ID_METHODS),
+            'Distance': _choice(rng, n, *DISTANCES[self.habitat]),
+            'Flyover_Observed': rng.random(n) < 0.02,
+            'Sex': _choice(rng, n, *SEXES),
+            'Common_Name': self.common_names[species],
+            'Scientific_Name': self.scientific_names[species],
+            'AcceptedTSN': np.where(rng.random(n) < 0.005, np.nan, self.tsn[species]),
+            'NPSTaxonCode': self.taxon_codes[species],
+            'TaxonCode': np.where(rng.random(n) < 0.0005, np.nan, self.taxon_codes[species]),
+            'AOU_Code': self.aou_codes[species],
+            'PIF_Watchlist_Status': self.watchlist[species],
+            'Regional_Stewardship_Status': self.stewardship[species],
+            'Previously_Obs': rng.random(n) < 0.1,
+            'Initial_Three_Min_Cnt': rng.random(n) < 0.6
+        }
+        for col, values in visits.items():
+            if col != 'plot':
+                columns[col] = values[visit]
+        frame = pd.DataFrame({col: columns[col] for col in self.columns})
+
+        #Exact duplicates: a row repeats the row before it
+        if self.duplicate_rate > 0 and n > 1:
+            source = np.arange(n)
+            repeat = np.flatnonzero(rng.random(n - 1) < self.duplicate_rate) + 1
+            source[repeat] = source[repeat - 1]
+            frame = frame.take(source).reset_index(drop=True)
+        return frame
+
+    #Yields frames of at most chunk_size rows until `rows` rows have been produced
+    def chunks(self, rows, chunk_size=CHUNK_SIZE):
+        produced = 0
+        while produced < rows:
+            n = min(chunk_size, rows - produced)
+            yield self.chunk(n)
+            produced += n
+
+    #Category dictionaries of this generator's text columns (typed frames from every chunk share them)
+    def category_dtypes(self):
+        values = {
+            'Admin_Unit_Code': self.units,
+            'Site_Name': self.plot_sites,
+            'Plot_Name': self.plot_names,
+            'Location_Type': [self.habitat.title()],
+            'Observer': OBSERVERS,
+            'Interval_Length': INTERVALS[0],
+            'ID_Method': ID_METHODS[0],
+            'Distance': DISTANCES[self.habitat][0],
+            'Sex': SEXES[0],
+            'Common_Name': self.common_names,
+            'Scientific_Name': self.scientific_names,
+            'AOU_Code': self.aou_codes,
+            'Sky': SKIES[0],
+            'Wind': WINDS[0],
+            'Disturbance': DISTURBANCES[0]
+        }
+        return {
+            col: pd.CategoricalDtype(sorted({value for value in values[col] if value is not None}, key=str))
+            for col in schema.CATEGORY_COLUMNS
+            if col in values and col in self.columns
+        }
+
+
+#Yields raw workbook-shaped frames for a habitat, chunk_size rows at a time
+def generate_chunks(habitat, rows, chunk_size=CHUNK_SIZE, seed=0, **options):
+    return ObservationGenerator(habitat, seed, **options).chunks(rows, chunk_size)
+
+
+#All rows as one raw workbook-shaped frame (small volumes; use generate_chunks for large ones)
+def generate_frame(habitat, rows, seed=0, **options):
+    frames = list(generate_chunks(habitat, rows, seed=seed, **options))
+    return pd.concat(frames, ignore_index=True) if frames else ObservationGenerator(habitat, seed, **options).chunk(0)
+
+
+#Cleaned, typed frame for a habitat (as data_ingest would load it); each chunk is typed before the next one is drawn
+def generate_typed_frame(habitat, rows, chunk_size=CHUNK_SIZE, seed=0, **options):
+    generator = ObservationGenerator(habitat, seed, **options)
+    dtypes = generator.category_dtypes()
+    frames = [
+        schema.apply_categories(data_ingest.clean_observations(chunk), dtypes)
+        for chunk in generator.chunks(rows, chunk_size)
+    ]
+    if not frames:
+        frames = [schema.apply_categories(data_ingest.clean_observations(generator.chunk(0)), dtypes)]
+    return pd.concat(frames, ignore_index=True)
+
+
+#ObservationSnapshot of `rows` synthetic observations split between forest and grassland like the real files
+def synthetic_snapshot(rows, seed=0, chunk_size=CHUNK_SIZE, forest_share=FOREST_SHARE, **options):
+    forest_rows = round(rows * forest_share)
+    forest = generate_typed_frame('forest', forest_rows, chunk_size, seed, **options)
+    grassland = generate_typed_frame('grassland', rows - forest_rows, chunk_size, seed, **options)
+    return data_ingest.ObservationSnapshot(forest, grassland, f"synthetic-{rows}-{seed}")
+
+
+#Streams rows to a CSV file (header once, then each chunk appended)
+def write_csv(path, habitat, rows, chunk_size=CHUNK_SIZE, seed=0, **options):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        for index, chunk in enumerate(generate_chunks(habitat, rows, chunk_size, seed, **options)):
+            chunk.to_csv(handle, header=index == 0, index=False)
+    return path
+
+
+#Cell value openpyxl can write (NaN / None → empty cell, numpy scalars → Python values)
+def _cell(value):
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value.item() if isinstance(value, np.generic) else value
+
+
+#Streams rows to an XLSX workbook with one sheet per admin unit (openpyxl write-only mode, constant memory)
+def write_workbook(path, habitat, rows, chunk_size=CHUNK_SIZE, seed=0, **options):
+    from openpyxl import Workbook
+
+    generator = ObservationGenerator(habitat, seed, **options)
+    workbook = Workbook(write_only=True)
+    sheets = {}
+    sheet_rows = {}
+    for chunk in generator.chunks(rows, chunk_size):
+        for unit, unit_rows in chunk.groupby('Admin_Unit_Code', sort=False):
+            if unit not in sheets:
+                sheets[unit] = workbook.create_sheet(title=unit)
+                sheets[unit].append(generator.columns)
+                sheet_rows[unit] = 0
+            sheet_rows[unit] += len(unit_rows)
+            if sheet_rows[unit] > EXCEL_MAX_ROWS:
+                raise ValueError(f"Sheet {unit} would exceed Excel's {EXCEL_MAX_ROWS:,} rows; write a CSV file for this volume")
+            for row in unit_rows.itertuples(index=False, name=None):
+                sheets[unit].append([_cell(value) for value in row])
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    workbook.save(path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic forest / grassland bird observations")
+    parser.add_argument("format", choices=["csv", "workbook"])
+    parser.add_argument("habitat", choices=list(COLUMNS))
+    parser.add_argument("path")
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--species", type=int, help="number of species (default: the ~70 built-in species)")
+    parser.add_argument("--plots-per-unit", type=int, help="plots in each admin unit")
+    args = parser.parse_args(argv)
+
+    write = write_csv if args.format == "csv" else write_workbook
+    write(args.path, args.habitat, args.rows, args.chunk_size, args.seed,
+          species=args.species, plots_per_unit=args.plots_per_unit)
+    print(f"Wrote {args.rows:,} {args.habitat} rows to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
+
+#Commands Used
+#np.random.default_rng([seed, habitat]) – Reproducible, independent streams for forest and grassland
+#rng.choice(p=...)                      – Weighted draws (species frequency, months, weather, messy values)
+#np.sort(rng.integers(...))             – Groups rows into survey visits sharing plot, date, time and weather
+#datetime64[M] + days                   – Vectorized survey dates inside the drawn month
+#DataFrame.take(source)                 – Exact duplicate rows (row repeats the previous one)
+#Workbook(write_only=True)              – Streams rows into XLSX sheets without holding them in memory
+#to_csv(handle, header=first chunk)     – Streams tens of millions of rows to CSV chunk by chunk
@@ -0,0 +1,300 @@
+#Temporal Rollups (Day / Week / Month / Year)
+  #Observation counts per habitat, species and period kept as dense NumPy matrices, built once per data snapshot:
+  #one (habitat, species, day) int32 matrix from the dated rows, summed into weeks, months and years on first use
+  #(months or years are the base instead of days when a day matrix would not fit the memory budget).
+  #Species and habitats are axis positions (their category codes), so a page's selection is an index into
+  #contiguous arrays and a heatmap is the selected block summed over habitats.
+  #Why? → Temporal Heatmap grouped and pivoted year × species and month × species tables on every filter change,
+  #and Species Filters grouped the year and month trends again for every species picked.
+
+#Layout
+  #axis 0 → Location_Type (one extra slot for a missing habitat)
+  #axis 1 → Common_Name (one extra slot for a missing species)
+  #axis 2 → every base period from the first to the last observation (periods without observations hold 0)
+  #Weeks start on Monday; months and years are calendar periods. Rows without a Date are left out, as both pages drop them.
+
+#Memory guards
+  #Dates outside BIRD_TEMPORAL_FIRST_YEAR..BIRD_TEMPORAL_LAST_YEAR (default 1950..next year) are left out and counted
+  #in `out_of_range`, so one mistyped year cannot stretch the period axis over centuries.
+  #The base period is the finest of day / month / year whose matrix fits BIRD_TEMPORAL_MB (default 64 MB);
+  #with a month base, day and week counts are not available (the pages only need months and years).
+  #Counts are added into the int32 matrix in place (np.add.at), with no int64 copy of it.
+  #nbytes() is reserved in the shared result cache (result_cache.py), so the rollups count against its budget and
+  #show up in its statistics as 'rollups'.
+
+#Appended Workbooks
+  #The rollups of the appended rows are added into the previous ones (axes are widened to the new species,
+  #habitats and periods), so the snapshot's rows are never counted again.
+
+#Usage
+  #python temporal_rollups.py --granularity week --species "Field Sparrow"  → counts per period of the species
+
+#Import required libraries
+import argparse                    #Command line for period counts of one species
+import datetime                    #Default last year of the date range
+import os                          #Date range and memory budget from the environment
+import threading                   #Guards the memoized coarser matrices against concurrent sessions
+import weakref                     #Releases the cache reservation when the rollups are dropped
+
+import numpy as np                 #Dense count matrices, add.at and reduceat
+import pandas as pd                #Species / habitat dictionaries of the observation frame
+import result_cache                #Shared byte budget the rollups are reserved in
+
+GRANULARITIES = ['day', 'week', 'month', 'year']
+SPECIES = 'Common_Name'
+HABITAT = 'Location_Type'
+
+#Base periods, finest first: NumPy unit and the granularities each one can be summed into
+BASES = {'day': ('D', GRANULARITIES), 'month': ('M', ['month', 'year']), 'year': ('Y', ['year'])}
+
+#Dates counted (override with BIRD_TEMPORAL_FIRST_YEAR / BIRD_TEMPORAL_LAST_YEAR)
+FIRST_YEAR = int(os.environ.get("BIRD_TEMPORAL_FIRST_YEAR", 1950))
+LAST_YEAR = int(os.environ.get("BIRD_TEMPORAL_LAST_YEAR", datetime.date.today().year + 1))
+
+#Largest base matrix built before falling back to a coarser base period (override with BIRD_TEMPORAL_MB)
+MEMORY_BUDGET = int(float(os.environ.get("BIRD_TEMPORAL_MB", 64)) * 2**20)
+
+
+#Axis labels and positions of a column (categories / sorted values; missing → the extra slot after the labels)
+def _axis(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        labels, codes = series.cat.categories, series.cat.codes.to_numpy()
+    else:
+        codes, labels = pd.factorize(series, sort=True)
+    return pd.Index(labels), np.where(codes < 0, len(labels), codes).astype(np.int64)
+
+
+#Start of the period each date falls in (datetime64[D] / [M] / [Y] dates → datetime64 labels)
+def period_labels(dates, granularity):
+    if granularity == 'day':
+        return dates
+    if granularity == 'week':
+        return dates - ((dates.astype(np.int64) + 3) % 7).astype('timedelta64[D]')   #1970-01-01 was a Thursday
+    if granularity == 'month':
+        return dates.astype('datetime64[M]')
+    if granularity == 'year':
+        return dates.astype('datetime64[Y]')
+    raise ValueError(f"Unknown granularity: {granularity} (expected one of {', '.join(GRANULARITIES)})")
+
+
+#Finest base period (at least as coarse as `coarsest`) whose (slots × periods) int32 matrix fits the budget
+def choose_base(slots, first_day, last_day, budget=MEMORY_BUDGET, coarsest='day'):
+    bases = list(BASES)
+    for base in bases[bases.index(coarsest):]:
+        unit = BASES[base][0]
+        span = int((last_day.astype(f'datetime64[{unit}]') - first_day.astype(f'datetime64[{unit}]')).astype(np.int64)) + 1
+        if slots * span * 4 <= budget:
+            return base
+    raise MemoryError(f"Temporal rollups of {slots:,} habitat × species slots do not fit BIRD_TEMPORAL_MB even by year")
+
+
+#Dense Per-Species Count Matrices of One Snapshot
+class TemporalRollups:
+    #species      -> Common_Name labels (axis 1; position len(species) = missing species)
+    #habitats     -> Location_Type labels (axis 0; position len(habitats) = missing habitat)
+    #base         -> 'day', 'month' or 'year': period of axis 2
+    #first        -> datetime64 (in the base unit) of period 0 (None when no row is dated)
+    #counts       -> int32 counts (habitat slots, species slots, base periods)
+    #out_of_range -> dated rows left out because their date is outside FIRST_YEAR..LAST_YEAR
+    def __init__(self, species, habitats, base, first, counts, out_of_range=0):
+        self.species = species
+        self.habitats = habitats
+        self.base = base
+        self.first = first
+        self.counts_matrix = counts
+        self.out_of_range = out_of_range
+        self._matrices = {}
+        self._cache_key = None
+        self._lock = threading.Lock()
+
+    #Rollups of the dated rows of an observation frame
+    @classmethod
+    def from_frame(cls, frame, budget=MEMORY_BUDGET, first_year=FIRST_YEAR, last_year=LAST_YEAR):
+        species, species_codes = _axis(frame[SPECIES])
+        habitats, habitat_codes = _axis(frame[HABITAT])
+        dates = frame['Date'].to_numpy().astype('datetime64[D]')
+        dated = ~np.isnat(dates)
+        in_range = dated & (dates >= np.datetime64(f'{first_year}-01-01')) & (dates <= np.datetime64(f'{last_year}-12-31'))
+        out_of_range = int(dated.sum() - in_range.sum())
+        dates = dates[in_range]
+        shape = (len(habitats) + 1, len(species) + 1)
+        if not len(dates):
+            return cls(species, habitats, 'day', None, np.zeros(shape + (0,), dtype=np.int32), out_of_range)
+
+        base = choose_base(shape[0] * shape[1], dates.min(), dates.max(), budget)
+        periods = dates.astype(f'datetime64[{BASES[base][0]}]')
+        first = periods.min()
+        offsets = (periods - first).astype(np.int64)
+        span = int(offsets.max()) + 1
+        flat = (habitat_codes[in_range] * shape[1] + species_codes[in_range]) * span + offsets
+        counts = np.zeros(shape[0] * shape[1] * span, dtype=np.int32)
+        np.add.at(counts, flat, 1)
+        return cls(species, habitats, base, first, counts.reshape(shape + (span,)), out_of_range)
+
+    #Rollups of both (axes widened to the union of species, habitats and periods; the base is the coarser of the
+    #two, or coarser still when the widened matrix would not fit the budget)
+    def merge(self, other, budget=MEMORY_BUDGET):
+        species = self.species.union(other.species)
+        habitats = self.habitats.union(other.habitats)
+        slots = (len(habitats) + 1) * (len(species) + 1)
+        out_of_range = self.out_of_range + other.out_of_range
+        parts = [part for part in (self, other) if part.first is not None]
+        if not parts:
+            return TemporalRollups(species, habitats, 'day', None, np.zeros((len(habitats) + 1, len(species) + 1, 0), dtype=np.int32), out_of_range)
+
+        bases = list(BASES)
+        coarsest = bases[max(bases.index(part.base) for part in parts)]
+        first_day = min(part.first.astype('datetime64[D]') for part in parts)
+        last_day = max(part._labels(part.base)[-1].astype('datetime64[D]') for part in parts)
+        base = choose_base(slots, first_day, last_day, budget, coarsest)
+        unit = BASES[base][0]
+        first = first_day.astype(f'datetime64[{unit}]')
+        span = int((last_day.astype(f'datetime64[{unit}]') - first).astype(np.int64)) + 1
+        counts = np.zeros((len(habitats) + 1, len(species) + 1, span), dtype=np.int32)
+        for part in parts:
+            labels, part_counts = part._matrix(base)
+            rows = np.append(habitats.get_indexer(part.habitats), len(habitats))
+            columns = np.append(species.get_indexer(part.species), len(species))
+            offset = int((labels[0] - first).astype(np.int64))
+            counts[np.ix_(rows, columns, np.arange(offset, offset + len(labels)))] += part_counts
+        return TemporalRollups(species, habitats, base, first, counts, out_of_range)
+
+    #Granularities the rollups can answer (every one for a day base; months and years for a month base; ...)
+    def granularities(self):
+        return list(BASES[self.base][1])
+
+    #Start of every base period on axis 2
+    def _labels(self, granularity):
+        return self._matrix(granularity)[0]
+
+    #(datetime64 period labels, counts) at a granularity, memoized
+    def _matrix(self, granularity):
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown granularity: {granularity} (expected one of {', '.join(GRANULARITIES)})")
+        if granularity not in BASES[self.base][1]:
+            raise ValueError(f"{granularity} counts are not kept: the rollups fell back to {self.base} periods (BIRD_TEMPORAL_MB)")
+        with self._lock:
+            if granularity not in self._matrices:
+                unit = BASES[self.base][0]
+                if self.first is None:
+                    labels = period_labels(np.empty(0, dtype=f'datetime64[{unit}]'), granularity)
+                    counts = self.counts_matrix
+                else:
+                    labels = period_labels(self.first + np.arange(self.counts_matrix.shape[2]), granularity)
+                    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+                    labels = labels[starts]
+                    counts = self.counts_matrix if granularity == self.base else np.add.reduceat(self.counts_matrix, starts, axis=2)
+                self._matrices[granularity] = (labels, counts)
+                self._report()
+            return self._matrices[granularity]
+
+    #(period labels, (habitat slots, species slots, periods) counts) at a granularity, memoized
+      #labels: datetime64[D] for days and weeks (week start), datetime64[M] for months, int years for years
+    def matrix(self, granularity):
+        labels, counts = self._matrix(granularity)
+        if granularity == 'year':
+            labels = labels.astype(np.int64) + 1970
+        return labels, counts
+
+    #Axis positions of the selected values (None = every slot; NaN or the `missing` label → the missing slot)
+    @staticmethod
+    def positions(labels, values, missing=None):
+        if values is None:
+            return np.arange(len(labels) + 1)
+        if isinstance(values, str) or not hasattr(values, '__iter__'):
+            values = [values]
+        values = list(values)
+        present = [value for value in values if not pd.isna(value)]
+        codes = labels.get_indexer(present) if present else np.empty(0, dtype=np.int64)
+        codes = codes[codes >= 0]
+        if any(pd.isna(value) or (missing is not None and value == missing) for value in values):
+            codes = np.append(codes, len(labels))
+        return np.unique(codes)
+
+    #(period labels, species labels, (species, periods) int64 counts) for the selected species and habitats
+      #The missing-species slot is labelled with `missing` (NaN when not given)
+    def counts(self, granularity, species=None, habitats=None, missing=None):
+        labels, matrix = self.matrix(granularity)
+        rows = self.positions(self.habitats, habitats, missing)
+        columns = self.positions(self.species, species, missing)
+        counts = matrix[np.ix_(rows, columns)].sum(axis=0, dtype=np.int64)
+        names = np.append(self.species.to_numpy(dtype=object), np.nan if missing is None else missing)[columns]
+        return labels, names, counts
+
+    #(species labels, (species, 12) counts per calendar month, January first) for the selected species and habitats
+    def month_of_year(self, species=None, habitats=None, missing=None):
+        labels, names, counts = self.counts('month', species, habitats, missing)
+        calendar_month = labels.astype(np.int64) % 12
+        return names, np.stack([counts[:, calendar_month == month].sum(axis=1) for month in range(12)], axis=1)
+
+    #Observations per (Common_Name, Location_Type) pair with dated rows (missing values kept as NaN)
+    def pairs(self):
+        _, years = self.matrix('year')
+        totals = years.sum(axis=2, dtype=np.int64)
+        habitat, species = np.nonzero(totals)
+        return pd.DataFrame({
+            SPECIES: pd.Categorical.from_codes(np.where(species == len(self.species), -1, species), categories=self.species),
+            HABITAT: pd.Categorical.from_codes(np.where(habitat == len(self.habitats), -1, habitat), categories=self.habitats),
+            'Count': totals[habitat, species]
+        })
+
+    #Bytes held by the base matrix and the coarser matrices built so far
+    def nbytes(self):
+        return self.counts_matrix.nbytes + sum(counts.nbytes for granularity, (_, counts) in self._matrices.items() if granularity != self.base)
+
+    #Reserves nbytes() in a result cache under the key (updated as coarser matrices are built, released with the rollups)
+    def track(self, key, cache=result_cache.RESULT_CACHE):
+        self._cache_key = (key, cache)
+        weakref.finalize(self, cache.release, key)
+        self._report()
+        return self
+
+    def _report(self):
+        if self._cache_key is not None:
+            key, cache = self._cache_key
+            cache.reserve(key, self.nbytes(), 'rollups')
+
+
+#Rollups of a snapshot from all of its rows
+def build_rollups(snapshot):
+    return TemporalRollups.from_frame(snapshot.frame).track(('rollups', snapshot.token))
+
+
+#Rollups of an appended snapshot: the rollups of the new rows are added into the previous ones
+def update_rollups(rollups, snapshot, rows, habitat):
+    return rollups.merge(TemporalRollups.from_frame(rows)).track(('rollups', snapshot.token))
+
+
+#Returns the TemporalRollups of a snapshot, building them the first time the snapshot is used
+def rollups_for(snapshot):
+    return snapshot.derived('temporal_rollups', build_rollups, update_rollups)
+
+
+#Command line: counts per period of one species (all species when none is given) in the loaded observations
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Observation counts per period from the temporal rollups")
+    parser.add_argument("--granularity", default='month', choices=GRANULARITIES, help="period length (day / week need a day base)")
+    parser.add_argument("--species", default=None, help="Common_Name to count (default: every species)")
+    parser.add_argument("--habitat", nargs="+", default=None, help="Location_Type values to include (default: all)")
+    args = parser.parse_args(argv)
+
+    import data_ingest
+    rollups = rollups_for(data_ingest.load_snapshot())
+    labels, _, counts = rollups.counts(args.granularity, args.species and [args.species], args.habitat)
+    table = pd.DataFrame({'Period': labels, 'Count': counts.sum(axis=0)})
+    with pd.option_context("display.max_rows", 500):
+        print(table[table['Count'] > 0].to_string(index=False))
+    print(f"{len(rollups.species):,} species × {len(rollups.habitats):,} habitats × {rollups.counts_matrix.shape[2]:,} "
+          f"{rollups.base} periods ({rollups.nbytes() / 2**20:.1f} MB); {rollups.out_of_range:,} rows outside {FIRST_YEAR}-{LAST_YEAR}")
+
+
+if __name__ == "__main__":
+    main()
+
+#Commands Used
+#np.add.at(int32 counts, flat index)        – Base-period counts of every (habitat, species) in one pass, in place
+#choose_base()                             – Falls back from days to months / years when the matrix would pass the budget
+#np.add.reduceat(axis=2)                   – Week / month / year matrices from contiguous runs of days
+#datetime64[D] / [M] / [Y]                 – Period starts without pandas date parsing per row
+#np.ix_(habitats, species)                 – Selected block of a matrix, summed over habitats for a page
+#Index.union() / get_indexer()             – Widens the axes when an appended workbook brings new species or habitats
@@ -0,0 +1,5 @@
+#Test setup: the dashboard modules live at the repository root (flat layout, no package)
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
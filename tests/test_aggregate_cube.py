@@ -0,0 +1,49 @@
+#AggregateCube: per-page cell tables, rollups equal to a groupby of the rows, appended workbooks and cube size
+
+import pandas as pd
+import aggregate_cube
+import page_pipelines
+import synthetic_data
+
+ROWS = 50_000
+
+#Dimension lists the pages roll the cube up to
+PAGE_DIMS = [
+    page_pipelines.GEOGRAPHIC_DIMS, page_pipelines.RICHNESS_DIMS, page_pipelines.TOP_DIMS, page_pipelines.ACTIVITY_DIMS,
+    page_pipelines.TEMPERATURE_DIMS, page_pipelines.HUMIDITY_DIMS, page_pipelines.SEASONAL_DIMS,
+    page_pipelines.TIME_FACTOR_DIMS, page_pipelines.FLYOVER_DIMS, page_pipelines.MIGRATION_DIMS,
+    page_pipelines.AT_RISK_DIMS, page_pipelines.ZONE_DIMS, ['Location_Type', 'Sky'], ['Location_Type', 'Wind']
+]
+
+
+def _sorted(frame, dims):
+    frame = frame[dims + ['Count']].astype({dim: object for dim in dims})
+    return frame.sort_values(dims, na_position='last').reset_index(drop=True)
+
+
+def _row_counts(snapshot, dims):
+    keys = aggregate_cube.dimension_columns(snapshot.frame, snapshot.ecosystem_codes())
+    return keys.groupby(dims, observed=True, dropna=False).size().reset_index(name='Count')
+
+
+def test_every_page_rollup_equals_a_groupby_of_the_rows():
+    snapshot = synthetic_data.synthetic_snapshot(ROWS)
+    cube = aggregate_cube.build_cube(snapshot)
+    for dims in PAGE_DIMS:
+        pd.testing.assert_frame_equal(_sorted(cube.rollup(dims), dims), _sorted(_row_counts(snapshot, dims), dims))
+
+
+def test_appended_rows_give_the_same_tables_as_a_rebuild():
+    snapshot = synthetic_data.synthetic_snapshot(ROWS // 2)
+    aggregate_cube.cube_for(snapshot)
+    appended = snapshot.append('grassland', synthetic_data.generate_typed_frame('grassland', ROWS // 4, seed=1), 'seed-1')
+    updated, rebuilt = aggregate_cube.cube_for(appended), aggregate_cube.build_cube(appended)
+    for name, dims in aggregate_cube.TABLES.items():
+        dims = [dim for dim in dims if dim in rebuilt.tables[name].columns]
+        pd.testing.assert_frame_equal(_sorted(updated.tables[name], dims), _sorted(rebuilt.tables[name], dims))
+
+
+def test_cells_grow_far_slower_than_the_rows():
+    small, large = (aggregate_cube.build_cube(synthetic_data.synthetic_snapshot(rows)) for rows in (ROWS // 2, ROWS * 2))
+    assert sum(large.cell_counts().values()) < 2.5 * sum(small.cell_counts().values())    #4 × the rows
+    assert large.table(page_pipelines.TOP_DIMS) is large.tables['species']
@@ -0,0 +1,71 @@
+#TopKSummary / top_k: exact when nothing is truncated, true counts inside the reported bounds after merges
+
+import numpy as np
+import pandas as pd
+import heavy_hitters
+
+
+def cells(rows=60_000, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        'Ecosystem': pd.Categorical(rng.choice(['Forest', 'Grassland'], rows)),
+        'Location_Type': pd.Categorical(rng.choice(['Forest', 'Grassland'], rows)),
+        'Year': pd.array(rng.integers(2015, 2019, rows), dtype='Int16'),
+        'Month': pd.array(rng.integers(1, 13, rows), dtype='Int8'),
+        'Flyover_Observed': rng.random(rows) < 0.2,
+        'Common_Name': pd.Categorical(np.char.add('sp', (rng.zipf(1.3, rows) % 400).astype(str))),
+        'Count': np.ones(rows, dtype=np.int64)
+    })
+    dims = heavy_hitters.SUMMARY_DIMS + ['Common_Name']
+    return frame.groupby(dims, observed=True)['Count'].sum().reset_index()
+
+
+def exact_counts(frame, **filters):
+    for column, value in filters.items():
+        frame = frame[frame[column] == value]
+    return frame.groupby('Common_Name', observed=True)['Count'].sum()
+
+
+def within_bounds(top, exact):
+    true = exact.reindex(top['Common_Name'].astype(str)).fillna(0).to_numpy()
+    return bool(((top['Count'] - top['Error'] <= true) & (true <= top['Count'])).all())
+
+
+def test_top_k_matches_a_stable_sort():
+    frame = pd.DataFrame({'name': list('abcdefgh'), 'value': [3, 9, 3, 1, 9, 3, 0, 5]})
+    expected = frame.sort_values('value', ascending=False, kind='stable').head(4)
+    assert heavy_hitters.top_k(frame, 'value', 4).equals(expected)
+    assert heavy_hitters.top_k(frame, 'value', 20).equals(frame.sort_values('value', ascending=False, kind='stable'))
+
+
+def test_untruncated_summary_is_exact():
+    frame = cells()
+    summary = heavy_hitters.TopKSummary.from_frame(frame, 'Count', capacity=10_000)
+    top = summary.top(10, Year=2016)
+    exact = exact_counts(frame, Year=2016).sort_values(ascending=False, kind='stable').head(10)
+    assert (top['Error'] == 0).all()
+    assert top['Count'].tolist() == exact.tolist()
+
+
+def test_merged_summaries_keep_true_counts_inside_the_bounds():
+    frame = cells().sample(frac=1, random_state=1)
+    quarter = len(frame) // 4
+    summary = heavy_hitters.TopKSummary.from_frame(frame.iloc[:quarter], 'Count', capacity=8)
+    for start in range(quarter, len(frame), quarter):
+        summary = summary.merge(heavy_hitters.TopKSummary.from_frame(frame.iloc[start:start + quarter], 'Count', capacity=8))
+    assert within_bounds(summary.top(10), exact_counts(frame))
+    assert within_bounds(summary.top(10, Year=2017, Flyover_Observed=True), exact_counts(frame, Year=2017, Flyover_Observed=True))
+    assert summary.totals.sum() == frame['Count'].sum()
+
+
+def test_untruncated_merge_equals_one_summary_of_all_cells():
+    frame = cells()
+    whole = heavy_hitters.TopKSummary.from_frame(frame, 'Count', capacity=10_000)
+    third = len(frame) // 3
+    merged = (
+        heavy_hitters.TopKSummary.from_frame(frame.iloc[:third], 'Count', capacity=10_000)
+        .merge(heavy_hitters.TopKSummary.from_frame(frame.iloc[third:], 'Count', capacity=10_000))
+    )
+    a, b = whole.top(50, Month=6), merged.top(50, Month=6)
+    assert a['Common_Name'].astype(str).tolist() == b['Common_Name'].astype(str).tolist()
+    assert a['Count'].tolist() == b['Count'].tolist()
@@ -0,0 +1,43 @@
+#Widget options: sorted values with a missing value last, and pages whose columns hold missing values
+
+import numpy as np
+import pandas as pd
+import data_ingest
+import figure_cache
+import page_pipelines
+import result_cache
+import synthetic_data
+
+
+def test_missing_value_is_the_last_option():
+    for values in (pd.Series(['b', np.nan, 'a', 'b']), pd.Series(['b', np.nan, 'a', 'b'], dtype='category')):
+        assert page_pipelines.sorted_options(values) == ['a', 'b']
+        options = page_pipelines.sorted_options(values, dropna=False)
+        assert options[:2] == ['a', 'b'] and len(options) == 3 and pd.isna(options[2])
+    assert page_pipelines.sorted_options(pd.Series(['b', 'a']), dropna=False) == ['a', 'b']
+
+
+def test_cached_options_with_missing_values():
+    cache = result_cache.ResultCache(budget=2**20, ttl=0)
+    df = pd.DataFrame({'Common_Name': ['Wood Thrush', np.nan, 'Field Sparrow']})
+    options = figure_cache.cached_options('token', 'page', df, 'Common_Name', dropna=False, cache=cache)
+    assert options[:2] == ['Field Sparrow', 'Wood Thrush'] and pd.isna(options[2])
+    assert figure_cache.cached_options('token', 'page', df, 'Common_Name', dropna=False, cache=cache) is options
+
+
+def test_temporal_heatmap_runs_with_missing_species_and_habitats():
+    snapshot = synthetic_data.synthetic_snapshot(2_000)
+    forest = snapshot.forest.copy()
+    forest.loc[:50, 'Common_Name'] = np.nan
+    forest.loc[40:90, 'Location_Type'] = np.nan
+    snapshot = data_ingest.ObservationSnapshot(forest, snapshot.grassland, 'missing-values')
+
+    pipeline = page_pipelines.PIPELINES['Temporal Heatmap']
+    rollups = pipeline.load(snapshot)
+    data = pipeline.clean(rollups)
+    filters = pipeline.defaults(data)
+    assert pd.isna(filters['species'][-1]) and pd.isna(filters['habitats'][-1])
+    names, years, yearly, months, monthly = pipeline.aggregate(rollups, data, **filters)
+    dated = snapshot.frame.dropna(subset=['Date', 'Common_Name'])
+    assert yearly.sum() == monthly.sum() == len(dated)
+    assert len(pipeline.figures((names, years, yearly, months, monthly))) == 2
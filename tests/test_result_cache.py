@@ -0,0 +1,73 @@
+#ResultCache: LRU eviction under the byte budget, TTL expiry (injected clock), reservations and statistics
+
+import numpy as np
+import plotly.graph_objects as go
+import result_cache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = result_cache.ResultCache(budget=100, ttl=0)
+    cache.store('a', 'A', 'aggregate', size=40)
+    cache.store('b', 'B', 'aggregate', size=40)
+    assert cache.lookup('a', 'aggregate') == 'A'       #'a' becomes the most recently used
+    cache.store('c', 'C', 'aggregate', size=40)
+    assert cache.lookup('b', 'aggregate') is None
+    assert cache.lookup('a', 'aggregate') == 'A'
+    assert cache.lookup('c', 'aggregate') == 'C'
+    assert cache.stats()['kinds']['aggregate']['evictions'] == 1
+
+
+def test_entries_expire_after_the_ttl():
+    clock = Clock()
+    cache = result_cache.ResultCache(budget=100, ttl=10, clock=clock)
+    cache.store('a', 'A', 'clean', size=1)
+    clock.now = 10
+    assert cache.lookup('a', 'clean') == 'A'
+    clock.now = 10.5
+    assert cache.lookup('a', 'clean') is None
+    stats = cache.stats()
+    assert stats['entries'] == 0 and stats['bytes'] == 0
+    assert stats['kinds']['clean']['expirations'] == 1
+
+
+def test_get_computes_once_and_oversized_results_are_not_kept():
+    cache = result_cache.ResultCache(budget=1000, ttl=0)
+    calls = []
+    assert cache.get('a', lambda: calls.append(1) or 'A') == 'A'
+    assert cache.get('a', lambda: calls.append(1) or 'A') == 'A'
+    assert len(calls) == 1
+    assert cache.store('big', 'B', size=1001) == 'B'
+    assert cache.lookup('big') is None
+
+
+def test_first_stored_value_wins():
+    cache = result_cache.ResultCache(budget=100, ttl=0)
+    first = cache.store('a', ['first'], size=1)
+    assert cache.store('a', ['second'], size=1) is first
+
+
+def test_reservations_count_against_the_budget_and_are_released():
+    cache = result_cache.ResultCache(budget=100, ttl=0)
+    cache.store('a', 'A', 'aggregate', size=40)
+    cache.store('b', 'B', 'aggregate', size=40)
+    cache.reserve('rollups', 50, 'rollups')
+    assert cache.lookup('a', 'aggregate') is None      #evicted to make room for the reservation
+    stats = cache.stats()
+    assert stats['reserved'] == 50
+    assert stats['kinds']['rollups']['bytes'] == 50
+    cache.release('rollups')
+    assert cache.stats()['reserved'] == 0
+
+
+def test_figure_size_follows_the_trace_arrays():
+    small = go.Figure(go.Scatter(x=np.arange(10.0), y=np.arange(10.0)))
+    large = go.Figure(go.Scatter(x=np.arange(100_000.0), y=np.arange(100_000.0)))
+    assert result_cache.estimate_size(large) - result_cache.estimate_size(small) == 2 * 8 * (100_000 - 10)
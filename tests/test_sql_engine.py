@@ -0,0 +1,31 @@
+#SQL engine: database rebuilds through a per-process temp file, left clean after a failure
+
+import os
+import pytest
+import sql_engine
+import synthetic_data
+
+
+def test_rebuild_leaves_other_processes_temp_files_alone(tmp_path):
+    snapshot = synthetic_data.synthetic_snapshot(500)
+    path = str(tmp_path / "observations.db")
+    other = f"{path}.{os.getpid() + 1}.tmp"          #Half-written file of another process
+    open(other, "w").close()
+    sql_engine.write_database(snapshot, path)
+    assert sql_engine.database_token(path) == snapshot.token
+    assert os.path.exists(other)
+    assert sorted(os.listdir(tmp_path)) == sorted([os.path.basename(path), os.path.basename(other)])
+
+
+def test_failed_rebuild_removes_its_temp_file_and_keeps_the_database(tmp_path, monkeypatch):
+    first, second = synthetic_data.synthetic_snapshot(500), synthetic_data.synthetic_snapshot(500, seed=1)
+    path = str(tmp_path / "observations.db")
+    sql_engine.write_database(first, path)
+
+    def fail(source, target):
+        raise OSError("disk full")
+    monkeypatch.setattr(sql_engine.os, "replace", fail)
+    with pytest.raises(OSError):
+        sql_engine.write_database(second, path)
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+    assert sql_engine.database_token(path) == first.token
@@ -0,0 +1,101 @@
+#TemporalRollups: merged rollups equal one build, periods match pandas, and the memory guards hold
+
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+import result_cache
+import temporal_rollups
+
+
+def observations(rows=30_000, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.Series(pd.Timestamp('2015-01-01') + pd.to_timedelta(rng.integers(0, 2_000, rows), unit='D'))
+    dates[rng.random(rows) < 0.05] = pd.NaT
+    return pd.DataFrame({
+        'Date': dates,
+        'Common_Name': pd.Series(rng.choice(['a', 'b', 'c', 'd', None], rows)).astype('category'),
+        'Location_Type': pd.Series(rng.choice(['Forest', 'Grassland', None], rows)).astype('category')
+    })
+
+
+def test_merged_rollups_equal_one_build_at_every_granularity():
+    frame = observations()
+    whole = temporal_rollups.TemporalRollups.from_frame(frame)
+    first, second = frame.iloc[:12_000], frame.iloc[12_000:]
+    second = second[second['Common_Name'] != 'd']     #the halves hold different species
+    merged = temporal_rollups.TemporalRollups.from_frame(first).merge(temporal_rollups.TemporalRollups.from_frame(second))
+    expected = temporal_rollups.TemporalRollups.from_frame(pd.concat([first, second]))
+    for granularity in temporal_rollups.GRANULARITIES:
+        labels, counts = merged.matrix(granularity)
+        expected_labels, expected_counts = expected.matrix(granularity)
+        assert np.array_equal(labels, expected_labels)
+        assert np.array_equal(counts, expected_counts)
+    assert whole.matrix('year')[1].sum() == frame['Date'].notna().sum()
+
+
+@pytest.mark.parametrize('granularity, period', [
+    ('week', lambda dates: (dates - pd.to_timedelta(dates.dt.weekday, unit='D')).dt.normalize()),
+    ('month', lambda dates: dates.dt.to_period('M').dt.to_timestamp()),
+    ('year', lambda dates: dates.dt.year)
+])
+def test_period_counts_match_a_groupby(granularity, period):
+    frame = observations().dropna(subset=['Date'])
+    rollups = temporal_rollups.TemporalRollups.from_frame(frame)
+    labels, _, counts = rollups.counts(granularity)
+    totals = pd.Series(counts.sum(axis=0), index=labels if granularity == 'year' else pd.to_datetime(labels))
+    expected = frame.groupby(period(frame['Date'])).size()
+    assert totals[totals > 0].tolist() == expected.tolist()
+    assert list(totals[totals > 0].index) == list(expected.index)
+
+
+def test_selection_positions_and_missing_slots():
+    frame = observations().dropna(subset=['Date'])
+    rollups = temporal_rollups.TemporalRollups.from_frame(frame)
+    _, names, counts = rollups.counts('year', ['a', np.nan], ['Forest'])
+    selected = frame[(frame['Common_Name'].isna() | (frame['Common_Name'] == 'a')) & (frame['Location_Type'] == 'Forest')]
+    assert names[0] == 'a' and pd.isna(names[1])
+    assert counts.sum() == len(selected)
+    _, names, counts = rollups.counts('year', ['Unknown'], None, missing="Unknown")
+    assert names.tolist() == ['Unknown'] and counts.sum() == frame['Common_Name'].isna().sum()
+    assert rollups.counts('year', [], None)[2].size == 0
+
+
+def test_month_of_year_folds_every_year():
+    frame = observations().dropna(subset=['Date'])
+    rollups = temporal_rollups.TemporalRollups.from_frame(frame)
+    _, months = rollups.month_of_year(['b'])
+    expected = frame[frame['Common_Name'] == 'b']['Date'].dt.month.value_counts().reindex(range(1, 13), fill_value=0)
+    assert months[0].tolist() == expected.tolist()
+
+
+def test_out_of_range_dates_are_left_out():
+    frame = observations().dropna(subset=['Date']).reset_index(drop=True)
+    frame.loc[0, 'Date'] = pd.Timestamp('1900-05-01')
+    rollups = temporal_rollups.TemporalRollups.from_frame(frame)
+    assert rollups.out_of_range == 1
+    assert rollups.matrix('year')[0][0] == 2015
+
+
+def test_budget_falls_back_to_months_with_the_same_month_counts():
+    frame = observations()
+    daily = temporal_rollups.TemporalRollups.from_frame(frame)
+    monthly = temporal_rollups.TemporalRollups.from_frame(frame, budget=daily.counts_matrix.nbytes - 1)
+    assert monthly.base == 'month'
+    assert np.array_equal(monthly.matrix('month')[1], daily.matrix('month')[1])
+    with pytest.raises(ValueError):
+        monthly.matrix('week')
+    merged = daily.merge(monthly)
+    assert merged.base == 'month'
+    assert np.array_equal(merged.matrix('year')[1], 2 * daily.matrix('year')[1])
+
+
+def test_rollups_reserve_their_bytes_until_dropped():
+    cache = result_cache.ResultCache(budget=2**30, ttl=0)
+    rollups = temporal_rollups.TemporalRollups.from_frame(observations()).track('rollups', cache)
+    rollups.matrix('month')
+    assert cache.stats()['reserved'] == rollups.nbytes()
+    del rollups
+    gc.collect()
+    assert cache.stats()['reserved'] == 0
@@ -0,0 +1,144 @@
+#Startup Warm-Up
+  #Precomputes what the first visitors would otherwise wait for, in a background thread started when the
+  #Streamlit server runs the app for the first time: the parsed and cleaned snapshot, the aggregate cube, every
+  #page's cleaned data, its widget option lists (species, habitats, years, months) and the aggregate result and
+  #figures of its default filters.
+  #Why? → After a deploy the first user of each page waited through the workbook parse, the cleaning and all
+  #the groupbys; now they are in the shared caches (data_ingest, result_cache) before anyone asks.
+
+#While it runs
+  #Pages are not blocked by it: a page opened during the warm-up shows a "warming" indicator and waits only
+  #for the snapshot it needs (the same parse the warm-up is running, never a second one); its own stages
+  #are computed on the spot if the warm-up has not reached them yet.
+  #A thread, not a process pool: the results have to end up in this process's caches.
+
+#Switching it off
+  #BIRD_WARMUP=0 skips it (pages then compute everything on first use, as before).
+
+#Usage
+  #Started by visualization.py on every run (only the first call in a process starts the thread)
+  #python warmup.py → runs the warm-up in the foreground and prints the time of each step
+
+#Import required libraries
+import os                          #BIRD_WARMUP switch
+import threading                   #Background warm-up thread
+import time                        #Step timings
+
+#Warm-up at server start (override with the BIRD_WARMUP environment variable)
+ENABLED = os.environ.get("BIRD_WARMUP", "1").strip().lower() not in ("0", "false", "no", "off")
+
+#Widget option lists precomputed for every page that has the column (species_list, habitat_list, years, months)
+OPTION_COLUMNS = ['Common_Name', 'Location_Type', 'Year', 'Month']
+
+_lock = threading.Lock()
+_thread = None
+_status = {'state': 'idle', 'step': None, 'done': 0, 'total': 0, 'seconds': None, 'errors': {}}
+
+
+#Copy of the warm-up status
+  #state   → idle / warming / ready / failed
+  #step    → what it is working on ('snapshot', 'cube' or a page title)
+  #done / total → pages warmed so far / pages to warm
+  #errors  → {page title: error message} for pages whose default view could not be built
+def status():
+    with _lock:
+        return dict(_status, errors=dict(_status['errors']))
+
+
+#True while the background warm-up is running
+def warming():
+    return status()['state'] == 'warming'
+
+
+def _update(**values):
+    with _lock:
+        _status.update(values)
+
+
+#Warms one page: cleaned data, option lists and the default view (same cache keys the page uses)
+def warm_page(pipeline, snapshot):
+    import figure_cache            #Imported here so importing warmup does not load pandas / Plotly
+
+    cached = figure_cache.cached_pipeline(pipeline, snapshot.token)
+    source = cached.load(snapshot)
+    data = cached.clean(source)
+    for column in OPTION_COLUMNS:
+        if column in getattr(data, 'columns', ()):
+            for dropna in (True, False):
+                figure_cache.cached_options(snapshot.token, pipeline.title, data, column, dropna)
+    cached.figures(cached.aggregate(source, data, **pipeline.defaults(data)))
+
+
+#Runs every warm-up step in the calling thread; returns {step: seconds} (report(step, seconds) is called after each)
+  #A page that fails is recorded in the status and skipped; a failing snapshot load stops the warm-up
+def run(report=None):
+    import aggregate_cube
+    import data_ingest
+    import page_pipelines
+
+    timings = {}
+    start = time.perf_counter()
+    _update(state='warming', step='snapshot', done=0, total=len(page_pipelines.PIPELINES), seconds=None, errors={})
+    try:
+        step = time.perf_counter()
+        snapshot = data_ingest.load_snapshot()
+        timings['snapshot'] = time.perf_counter() - step
+        if report:
+            report('snapshot', timings['snapshot'])
+        _update(step='cube')
+        step = time.perf_counter()
+        aggregate_cube.cube_for(snapshot)
+        timings['cube'] = time.perf_counter() - step
+        if report:
+            report('cube', timings['cube'])
+    except Exception as e:
+        _update(state='failed', step=None, seconds=round(time.perf_counter() - start, 3), errors={'snapshot': f"{type(e).__name__}: {e}"})
+        return timings
+
+    for done, (title, pipeline) in enumerate(page_pipelines.PIPELINES.items(), start=1):
+        _update(step=title)
+        step = time.perf_counter()
+        try:
+            warm_page(pipeline, snapshot)
+        except Exception as e:
+            with _lock:
+                _status['errors'][title] = f"{type(e).__name__}: {e}"
+        timings[title] = time.perf_counter() - step
+        _update(done=done)
+        if report:
+            report(title, timings[title])
+    _update(state='ready', step=None, seconds=round(time.perf_counter() - start, 3))
+    return timings
+
+
+#Starts the background warm-up once per process (later calls do nothing); returns True when this call started it
+def start():
+    global _thread
+    if not ENABLED:
+        return False
+    with _lock:
+        if _thread is not None:
+            return False
+        _thread = threading.Thread(target=run, name="bird-warmup", daemon=True)
+        _status['state'] = 'warming'
+        _thread.start()
+    return True
+
+
+#Command line: foreground warm-up with the time of each step
+def main():
+    run(report=lambda title, seconds: print(f"{title:60s} {seconds:7.3f} s"))
+    state = status()
+    for title, error in state['errors'].items():
+        print(f"Failed: {title} – {error}")
+    print(f"Warm-up {state['state']} in {state['seconds']} s")
+
+
+if __name__ == "__main__":
+    main()
+
+#Commands Used
+#threading.Thread(daemon=True)           – Warm-up next to the Streamlit server without holding shutdown
+#data_ingest.load_snapshot()             – Parse / Parquet / Arrow snapshot, shared with every session
+#figure_cache.cached_pipeline()          – Same cache keys as the pages, so their first view is a cache hit
+#pipeline.defaults(data)                 – Filters each page selects on first render